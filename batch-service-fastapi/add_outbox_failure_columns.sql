@@ -0,0 +1,6 @@
+-- catalog_change_outbox에 반영 실패 기록 컬럼 추가 (failed_at이 설정된 항목은 CDC 소비 대상에서 제외)
+-- 원인 해결 후 재처리: UPDATE catalog_change_outbox SET failed_at = NULL, error = NULL WHERE id IN (...);
+
+ALTER TABLE catalog_change_outbox
+ADD COLUMN failed_at DATETIME NULL,
+ADD COLUMN error TEXT NULL;
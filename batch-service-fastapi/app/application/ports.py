@@ -170,6 +170,20 @@ class ExcelParser(ABC):
         pass
 
 
+# ===== Main Migration Port =====
+class MainCatalogMigrator(ABC):
+    """스테이징 버전 → 메인 카탈로그 일괄 이관 인터페이스"""
+
+    @abstractmethod
+    def migrate_version(self, version_id: int) -> Dict[str, int]:
+        """
+        버전의 브랜드/차량라인/모델/트림/옵션을 한 트랜잭션으로 메인 테이블에 복사
+
+        반환: 메인 테이블별 이관 행 수 (실패 시 예외, 부분 이관 없음)
+        """
+        pass
+
+
 # ===== 할인 정책 Repository Ports =====
 class StagingDiscountPolicyRepository(ABC):
     """할인 정책 저장소 인터페이스"""
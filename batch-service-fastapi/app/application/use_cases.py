@@ -13,7 +13,7 @@ from ..domain.entities import (
 )
 from .ports import (
     BrandRepository, ModelRepository, TrimRepository,
-    ColorRepository, OptionRepository, ExcelParser
+    ColorRepository, OptionRepository, ExcelParser, MainCatalogMigrator
 )
 
 
@@ -862,78 +862,19 @@ class ExcelImportService:
 class MigrationService:
     """Staging → Production 마이그레이션 유스케이스"""
     
-    def __init__(
-        self,
-        version_repo, brand_repo, vehicle_line_repo, model_repo, trim_repo,
-        staging_brand_repo, staging_vehicle_line_repo, staging_model_repo, staging_trim_repo
-    ):
+    def __init__(self, version_repo, catalog_migrator: MainCatalogMigrator):
         self.version_repo = version_repo
-        self.brand_repo = brand_repo
-        self.vehicle_line_repo = vehicle_line_repo
-        self.model_repo = model_repo
-        self.trim_repo = trim_repo
-        self.staging_brand_repo = staging_brand_repo
-        self.staging_vehicle_line_repo = staging_vehicle_line_repo
-        self.staging_model_repo = staging_model_repo
-        self.staging_trim_repo = staging_trim_repo
+        self.catalog_migrator = catalog_migrator
+        self.last_counts: dict = {}
     
     def migrate_approved_version(self, version_id: int) -> bool:
-        """승인된 버전을 Production으로 마이그레이션"""
+        """승인된 버전을 Production으로 마이그레이션 (브랜드 ~ 옵션, 레벨별 일괄 복사 / 한 트랜잭션)"""
         version = self.version_repo.find_by_id(version_id)
         if not version or not version.is_approved():
             return False
         
         try:
-            # Staging 데이터를 Production으로 마이그레이션
-            staging_brands = self.staging_brand_repo.find_all_by_version(version_id)
-            
-            for staging_brand in staging_brands:
-                # Brand 마이그레이션
-                brand = Brand(
-                    name=staging_brand.name,
-                    country=staging_brand.country,
-                    logo_url=staging_brand.logo_url,
-                    manager=staging_brand.manager
-                )
-                production_brand = self.brand_repo.save(brand)
-                
-                # VehicleLine 마이그레이션
-                staging_vehicle_lines = self.staging_vehicle_line_repo.find_all_by_brand(staging_brand.id)
-                for staging_vehicle_line in staging_vehicle_lines:
-                    vehicle_line = VehicleLine(
-                        name=staging_vehicle_line.name,
-                        description=staging_vehicle_line.description,
-                        brand_id=production_brand.id
-                    )
-                    production_vehicle_line = self.vehicle_line_repo.save(vehicle_line)
-                    
-                    # Model 마이그레이션
-                    staging_models = self.staging_model_repo.find_all_by_vehicle_line(staging_vehicle_line.id)
-                    for staging_model in staging_models:
-                        model = Model(
-                            name=staging_model.name,
-                            code=staging_model.code,
-                            vehicle_line_id=production_vehicle_line.id,
-                            release_year=staging_model.release_year,
-                            price=staging_model.price,
-                            foreign=staging_model.foreign
-                        )
-                        production_model = self.model_repo.save(model)
-                        
-                        # Trim 마이그레이션
-                        staging_trims = self.staging_trim_repo.find_all_by_model(staging_model.id)
-                        for staging_trim in staging_trims:
-                            trim = Trim(
-                                name=staging_trim.name,
-                                car_type=staging_trim.car_type,
-                                fuel_name=staging_trim.fuel_name,
-                                cc=staging_trim.cc,
-                                base_price=staging_trim.base_price,
-                                description=staging_trim.description,
-                                model_id=production_model.id
-                            )
-                            self.trim_repo.save(trim)
-            
+            self.last_counts = self.catalog_migrator.migrate_version(version_id)
             return True
             
         except Exception as e:
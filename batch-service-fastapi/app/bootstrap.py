@@ -0,0 +1,47 @@
+"""
+Bootstrap 명령 - 스키마 생성 (배포/마이그레이션 단계에서 1회 실행)
+
+API/워커 import 시점에 create_all을 실행하지 않도록 분리했다.
+사용법:
+    python -m app.bootstrap
+"""
+import sys
+import time
+
+from .config import settings
+from .infrastructure.database import Base, engine
+from .infrastructure import orm_models  # noqa: F401  (모든 테이블을 Base.metadata에 등록)
+
+
+def create_tables() -> int:
+    """정의된 모든 테이블 생성 (이미 있는 테이블은 건너뜀)"""
+    started = time.perf_counter()
+    Base.metadata.create_all(bind=engine)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    table_count = len(Base.metadata.tables)
+    print(f"[BOOTSTRAP] 테이블 {table_count}개 확인/생성 완료 ({elapsed_ms:.1f}ms)")
+    return table_count
+
+
+def create_search_indexes() -> list:
+    """FULLTEXT 검색 백엔드 사용 시 ngram FULLTEXT 인덱스 생성 (기존 테이블 포함)"""
+    if settings.search_backend != "fulltext":
+        return []
+    from .infrastructure.fulltext_search import ensure_fulltext_indexes
+    created = ensure_fulltext_indexes(engine)
+    print(f"[BOOTSTRAP] FULLTEXT 인덱스 {len(created)}개 생성: {created}")
+    return created
+
+
+def main() -> int:
+    try:
+        create_tables()
+        create_search_indexes()
+        return 0
+    except Exception as e:
+        print(f"[BOOTSTRAP] 스키마 생성 실패: {str(e)}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
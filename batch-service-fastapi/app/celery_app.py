@@ -2,6 +2,9 @@
 Celery Application - 배치 작업 및 크롤링용
 """
 from celery import Celery
+from celery.signals import worker_process_shutdown
+
+from .config import settings
 
 # Celery 앱 생성
 celery_app = Celery(
@@ -23,8 +26,27 @@ celery_app.conf.update(
     task_soft_time_limit=25 * 60,  # 25분
 )
 
+# CDC(메인 반영) 태스크는 별도 큐 → cdc_worker 프로필 워커가 처리 (엑셀 워커와 연결 풀 분리)
+CDC_QUEUE = "cdc"
+celery_app.conf.task_routes = {
+    name: {"queue": CDC_QUEUE}
+    for name in (
+        "migrate_version_to_main",
+        "sync_approved_to_main",
+        "drain_change_outbox",
+        "cleanup_approved_staging_data",
+        "sync_pending_approvals",
+        "migrate_discount_policies_to_main",
+    )
+}
+
 # 스케줄링 예시 (Celery Beat)
 celery_app.conf.beat_schedule = {
+    # 스테이징 변경 outbox → 메인 증분 반영
+    "drain-change-outbox": {
+        "task": "drain_change_outbox",
+        "schedule": float(settings.outbox_drain_interval),
+    },
     # 예: 매일 새벽 2시 크롤링 실행
     # "crawl-every-night": {
     #     "task": "app.tasks.crawler_tasks.crawl_vehicle_data",
@@ -32,3 +54,12 @@ celery_app.conf.beat_schedule = {
     # },
 }
 
+
+
+# 워커 프로세스 종료 시 연결 풀 지표 기록 (워커는 HTTP 엔드포인트가 없으므로 로그로 남김)
+@worker_process_shutdown.connect
+def log_db_pool_metrics(**kwargs):
+    from .infrastructure.database import engine, pool_profile
+    from .infrastructure.pool_metrics import get_pool_snapshot
+
+    print(f"[POOL] {get_pool_snapshot(engine, pool_profile)}")
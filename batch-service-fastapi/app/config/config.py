@@ -12,11 +12,47 @@ class Settings(BaseSettings):
     db_pool_timeout: int = 30      # 연결 대기 시간 (초)
     db_pool_recycle: int = 3600    # 연결 재활용 시간 (초)
     
+    # Process Role - 역할별 연결 풀 프로필 선택 (api / excel_worker / cdc_worker)
+    app_role: str = "api"
+    
+    # 역할별 Connection Pool 프로필 (api는 위 db_pool_size / db_max_overflow 사용)
+    excel_worker_db_pool_size: int = 2      # 엑셀 워커 프로세스당 연결 풀 크기
+    excel_worker_db_max_overflow: int = 2   # 엑셀 워커 오버플로우 연결 수
+    cdc_worker_db_pool_size: int = 2        # CDC 워커 프로세스당 연결 풀 크기
+    cdc_worker_db_max_overflow: int = 4     # CDC 워커 오버플로우 연결 수
+    
     # Celery & Redis
     redis_url: str = "redis://localhost:6379/0"
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/0"
     
+    # Version Snapshot Cache (Redis)
+    snapshot_cache_enabled: bool = True
+    snapshot_cache_max_bytes: int = 256 * 1024 * 1024       # 전체 스냅샷 캐시 용량 (256MB)
+    snapshot_cache_max_entry_bytes: int = 32 * 1024 * 1024  # 단일 스냅샷 최대 크기 (32MB)
+    
+    # Search Backend - "index" (버전별 인메모리 역색인) / "fulltext" (MySQL ngram FULLTEXT) / "like" (LIKE SQL)
+    search_backend: str = "index"
+    
+    # Search Index (버전별 인메모리 역색인)
+    search_index_max_versions: int = 8     # 프로세스당 유지할 버전 색인 수 (LRU)
+    search_index_max_age: int = 5 * 60     # Redis revision 확인 불가 시 색인 재사용 최대 시간 (초)
+    
+    # Search Cache (검색 응답 캐시 - revision 단위)
+    search_cache_enabled: bool = True
+    search_cache_max_entries: int = 2048   # 프로세스당 캐시 항목 수 (LRU)
+    search_cache_ttl: int = 60             # 캐시 항목 만료 시간 (초)
+    search_cache_redis: bool = False       # Redis 2차 캐시 사용 (프로세스 간 공유)
+    
+    # Search Telemetry
+    search_slow_ms: int = 300              # 느린 검색 기록 기준 (ms)
+    search_slow_capture_size: int = 50     # 느린 검색 최근 기록 수
+    
+    # CDC Outbox (스테이징 변경 → 메인 증분 반영)
+    outbox_batch_size: int = 500           # 배치당 outbox 행 수
+    outbox_max_batches: int = 20           # 태스크 1회 실행당 최대 배치 수
+    outbox_drain_interval: int = 10        # Celery Beat 실행 주기 (초)
+    
     # JWT Authentication
     SECRET_KEY: str = "GOODLIFE_SECRET1_KEY"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
@@ -32,6 +68,24 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
     
+    def get_pool_profile(self, role: str = None) -> dict:
+        """프로세스 역할에 맞는 연결 풀 설정 반환"""
+        role = (role or self.app_role).lower()
+        if role == "excel_worker":
+            pool_size, max_overflow = self.excel_worker_db_pool_size, self.excel_worker_db_max_overflow
+        elif role == "cdc_worker":
+            pool_size, max_overflow = self.cdc_worker_db_pool_size, self.cdc_worker_db_max_overflow
+        else:
+            role = "api"
+            pool_size, max_overflow = self.db_pool_size, self.db_max_overflow
+        return {
+            "role": role,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": self.db_pool_timeout,
+            "pool_recycle": self.db_pool_recycle,
+        }
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -81,7 +81,7 @@ class ActionType(str, Enum):
 
 # ===== 사용자 엔티티 =====
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """사용자 엔티티"""
     username: str
@@ -136,7 +136,7 @@ class User:
         return self.position == UserPosition.CEO
 
 
-@dataclass
+@dataclass(slots=True)
 class Permission:
     """권한 엔티티"""
     resource: str  # 리소스 (예: main_carsystem)
@@ -149,7 +149,7 @@ class Permission:
         return f"{self.resource}_{self.action}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Role:
     """역할 엔티티"""
     name: str
@@ -159,7 +159,7 @@ class Role:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserRoleAssignment:
     """사용자-역할 연결 엔티티"""
     user_id: int
@@ -169,7 +169,7 @@ class UserRoleAssignment:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RolePermission:
     """역할-권한 연결 엔티티"""
     role_id: int
@@ -181,7 +181,7 @@ class RolePermission:
 
 # ===== Staging 엔티티 (임시 데이터) =====
 
-@dataclass
+@dataclass(slots=True)
 class StagingBrand:
     """임시 브랜드 데이터"""
     name: str
@@ -210,7 +210,7 @@ class StagingBrand:
             raise ValueError("국가 코드는 2자리여야 합니다 (예: KR, US)")
 
 
-@dataclass
+@dataclass(slots=True)
 class StagingVehicleLine:
     """임시 차량 라인 데이터"""
     name: str
@@ -235,7 +235,7 @@ class StagingVehicleLine:
             raise ValueError("차량 라인 이름은 필수입니다")
 
 
-@dataclass
+@dataclass(slots=True)
 class StagingModel:
     """임시 모델 데이터"""
     name: str
@@ -265,7 +265,7 @@ class StagingModel:
             raise ValueError("모델 코드는 필수입니다")
 
 
-@dataclass
+@dataclass(slots=True)
 class StagingTrim:
     """임시 트림 데이터"""
     name: str
@@ -294,7 +294,7 @@ class StagingTrim:
             raise ValueError("트림 이름은 필수입니다")
 
 
-@dataclass
+@dataclass(slots=True)
 class StagingOption:
     """Staging 옵션 엔티티 - 옵션 이름과 가격을 하나로 통합"""
     name: str
@@ -319,7 +319,7 @@ class StagingOption:
 
 
 # 기존 엔티티들 - 호환성을 위해 유지 (마이그레이션 후 제거 예정)
-@dataclass
+@dataclass(slots=True)
 class StagingOptionTitle:
     """Staging 옵션 타이틀 엔티티 - 호환성을 위해 유지"""
     name: str
@@ -340,7 +340,7 @@ class StagingOptionTitle:
             raise ValueError("옵션 타이틀 이름은 필수입니다")
 
 
-@dataclass
+@dataclass(slots=True)
 class StagingOptionPrice:
     """Staging 옵션 가격 엔티티 - 호환성을 위해 유지"""
     name: str
@@ -365,7 +365,7 @@ class StagingOptionPrice:
 
 # ===== 메인 엔티티 (승인 후 CDC로 전송될 데이터) =====
 
-@dataclass
+@dataclass(slots=True)
 class Brand:
     """브랜드 도메인 엔티티"""
     name: str
@@ -375,7 +375,7 @@ class Brand:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleLine:
     """차량 라인 도메인 엔티티"""
     name: str
@@ -384,7 +384,7 @@ class VehicleLine:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Model:
     """모델 도메인 엔티티"""
     name: str
@@ -396,7 +396,7 @@ class Model:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Trim:
     """트림 도메인 엔티티"""
     name: str
@@ -409,7 +409,7 @@ class Trim:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TrimCarColor:
     """트림 색상 도메인 엔티티"""
     name: str
@@ -420,7 +420,7 @@ class TrimCarColor:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionTitle:
     """옵션 그룹 도메인 엔티티"""
     name: str
@@ -430,7 +430,7 @@ class OptionTitle:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionPrice:
     """옵션 가격 도메인 엔티티"""
     name: str
@@ -442,7 +442,7 @@ class OptionPrice:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchJob:
     """배치 작업 엔티티"""
     job_type: JobType
@@ -468,7 +468,7 @@ class VersionStatus(str, Enum):
     REJECTED = "REJECTED"    # 거부됨
 
 
-@dataclass
+@dataclass(slots=True)
 class StagingVersion:
     """Staging 데이터 버전 관리 - 버전 단위 승인 관리"""
     version_name: str
@@ -524,7 +524,7 @@ class EventStatus(str, Enum):
     CANCELLED = "CANCELLED"   # 취소
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """이벤트 도메인 엔티티"""
     title: str
@@ -589,7 +589,7 @@ class Event:
                 (self.max_participants is None or self.current_participants < self.max_participants))
 
 
-@dataclass
+@dataclass(slots=True)
 class EventRegistration:
     """이벤트 등록 도메인 엔티티"""
     event_id: int
@@ -633,7 +633,7 @@ class EventTypeForPrePurchase(str, Enum):
     SPECIAL_OFFER = "SPECIAL_OFFER"   # 특가
 
 
-@dataclass
+@dataclass(slots=True)
 class StagingDiscountPolicy:
     """할인 정책 허브 엔티티 - 브랜드, Vehicle Line, 트림, 버전 단위"""
     brand_id: int
@@ -675,7 +675,7 @@ class StagingDiscountPolicy:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class StagingBrandCardBenefit:
     """카드사 제휴 할인 엔티티"""
     discount_policy_id: int
@@ -698,7 +698,7 @@ class StagingBrandCardBenefit:
             raise ValueError("제목은 필수입니다")
 
 
-@dataclass
+@dataclass(slots=True)
 class StagingBrandPromo:
     """브랜드 프로모션 할인 엔티티"""
     discount_policy_id: int
@@ -732,7 +732,7 @@ class StagingBrandPromo:
         return 0
 
 
-@dataclass
+@dataclass(slots=True)
 class StagingBrandInventoryDiscount:
     """재고 보유 할인 엔티티"""
     discount_policy_id: int
@@ -759,7 +759,7 @@ class StagingBrandInventoryDiscount:
         return current_inventory >= self.inventory_level_threshold
 
 
-@dataclass
+@dataclass(slots=True)
 class StagingBrandPrePurchase:
     """선구매/특가 할인 엔티티"""
     discount_policy_id: int
@@ -806,7 +806,7 @@ class StagingBrandPrePurchase:
 
 # ===== Main (Production) 할인 정책 엔티티 =====
 
-@dataclass
+@dataclass(slots=True)
 class DiscountPolicy:
     """할인 정책 허브 엔티티 - 브랜드, Vehicle Line, 트림 단위"""
     brand_id: int
@@ -845,7 +845,7 @@ class DiscountPolicy:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandCardBenefit:
     """카드사 제휴 할인 엔티티"""
     discount_policy_id: int
@@ -868,7 +868,7 @@ class BrandCardBenefit:
             raise ValueError("제목은 필수입니다")
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandPromo:
     """브랜드 프로모션 할인 엔티티"""
     discount_policy_id: int
@@ -901,7 +901,7 @@ class BrandPromo:
         return 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandInventoryDiscount:
     """재고 보유 할인 엔티티"""
     discount_policy_id: int
@@ -928,7 +928,7 @@ class BrandInventoryDiscount:
         return current_inventory >= self.inventory_level_threshold
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandPrePurchase:
     """선구매/특가 할인 엔티티"""
     discount_policy_id: int
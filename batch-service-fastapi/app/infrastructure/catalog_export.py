@@ -0,0 +1,93 @@
+"""
+Catalog Export - 버전 카탈로그를 NDJSON으로 스트리밍
+
+한 줄 = 트림 1건 + 소속 옵션 목록 (+ 브랜드/차량 라인/모델 정보).
+trim LEFT JOIN option 결과를 서버 사이드 커서(yield_per)로 읽으면서
+연속된 같은 trim 행을 묶어 바로 내보내므로 서버 메모리는 버전 크기와 무관하다.
+"""
+import json
+from typing import Iterator
+
+from sqlalchemy import select
+
+from .database import SessionLocal
+from .orm_models import (
+    StagingBrandORM, StagingVehicleLineORM, StagingModelORM,
+    StagingTrimORM, StagingOptionORM
+)
+from .projections import serialize_value
+
+# 서버 사이드 커서에서 한 번에 가져올 행 수
+EXPORT_YIELD_PER = 1000
+
+BRAND_COLUMNS = ("id", "name", "country")
+VEHICLE_LINE_COLUMNS = ("id", "name")
+MODEL_COLUMNS = ("id", "name", "code", "release_year", "price", "foreign")
+TRIM_COLUMNS = ("id", "name", "car_type", "fuel_name", "cc", "base_price", "description")
+OPTION_COLUMNS = ("id", "name", "code", "category", "price", "discounted_price")
+
+_GROUPS = (
+    ("brand", StagingBrandORM, BRAND_COLUMNS),
+    ("vehicle_line", StagingVehicleLineORM, VEHICLE_LINE_COLUMNS),
+    ("model", StagingModelORM, MODEL_COLUMNS),
+    ("trim", StagingTrimORM, TRIM_COLUMNS),
+    ("option", StagingOptionORM, OPTION_COLUMNS),
+)
+
+
+def _export_statement(version_id: int):
+    """트림 + 옵션 평면 조회 (trim.id, option.id 순)"""
+    selected = [
+        getattr(orm_class, name).label(f"{group}__{name}")
+        for group, orm_class, names in _GROUPS
+        for name in names
+    ]
+    return (
+        select(*selected)
+        .select_from(StagingTrimORM)
+        .join(StagingModelORM, StagingTrimORM.model_id == StagingModelORM.id)
+        .join(StagingVehicleLineORM, StagingModelORM.vehicle_line_id == StagingVehicleLineORM.id)
+        .join(StagingBrandORM, StagingVehicleLineORM.brand_id == StagingBrandORM.id)
+        .outerjoin(StagingOptionORM, StagingOptionORM.trim_id == StagingTrimORM.id)
+        .where(StagingBrandORM.version_id == version_id)
+        .order_by(StagingTrimORM.id, StagingOptionORM.id)
+    )
+
+
+def _pick(row, group: str, names: tuple) -> dict:
+    return {name: serialize_value(row[f"{group}__{name}"]) for name in names}
+
+
+def iter_version_ndjson(version_id: int) -> Iterator[bytes]:
+    """
+    버전 카탈로그를 NDJSON 줄 단위로 생성
+    
+    StreamingResponse 전송 중에도 연결이 유지되어야 하므로 요청 세션과 별도로
+    자체 세션을 열고 닫는다.
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            _export_statement(version_id).execution_options(yield_per=EXPORT_YIELD_PER)
+        ).mappings()
+
+        current = None
+        for row in result:
+            trim_id = row["trim__id"]
+            if current is None or current["trim"]["id"] != trim_id:
+                if current is not None:
+                    yield (json.dumps(current, ensure_ascii=False) + "\n").encode("utf-8")
+                current = {
+                    "brand": _pick(row, "brand", BRAND_COLUMNS),
+                    "vehicle_line": _pick(row, "vehicle_line", VEHICLE_LINE_COLUMNS),
+                    "model": _pick(row, "model", MODEL_COLUMNS),
+                    "trim": _pick(row, "trim", TRIM_COLUMNS),
+                    "options": [],
+                }
+            if row["option__id"] is not None:
+                current["options"].append(_pick(row, "option", OPTION_COLUMNS))
+
+        if current is not None:
+            yield (json.dumps(current, ensure_ascii=False) + "\n").encode("utf-8")
+    finally:
+        db.close()
@@ -0,0 +1,106 @@
+"""
+Catalog Search - 검색 백엔드 선택 (settings.search_backend)
+
+- "index": 버전별 인메모리 역색인 (search_index) - 스테이징 버전 전용
+- "fulltext": MySQL ngram FULLTEXT (fulltext_search) - 스테이징 버전 + 메인 카탈로그
+- "like": LIKE 조건 SQL
+검색 API는 이 모듈의 search_catalog / search_level만 사용하며, 결과 항목 형식은 백엔드와 무관하게 같다.
+SQL 백엔드(fulltext/like)는 검색 하나를 UNION 쿼리 한 번으로 처리한다 (search_query.compile_search).
+"""
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from .search_index import LEVEL_SCORES
+from .search_query import ParsedQuery, compile_search, like_condition, row_to_result
+from .tree_loader import LEVELS
+
+BACKEND_INDEX = "index"
+BACKEND_FULLTEXT = "fulltext"
+BACKEND_LIKE = "like"
+
+
+def uses_fulltext() -> bool:
+    return settings.search_backend == BACKEND_FULLTEXT
+
+
+def search_catalog(
+    db: Session,
+    parsed: ParsedQuery,
+    types: Sequence[str],
+    limit: int,
+    version_id: Optional[int] = None,
+    collapse_to: Optional[str] = None
+) -> List[dict]:
+    """
+    파싱된 검색어로 types 유형 항목을 점수 순으로 최대 limit개 검색
+
+    collapse_to: 하위 유형 일치를 이 레벨 항목으로 묶음 (예: "model" - 트림 일치 → 해당 모델)
+    version_id가 없으면 메인 카탈로그 검색 (SQL 백엔드)
+    """
+    if settings.search_backend == BACKEND_INDEX and version_id is not None:
+        return _search_index(db, parsed, types, limit, version_id, collapse_to)
+
+    relevance = None
+    if uses_fulltext():
+        from .fulltext_search import match_condition as condition, match_relevance as relevance
+    else:
+        condition = like_condition
+    statement = compile_search(parsed, types, limit, version_id, collapse_to, condition, relevance)
+    if statement is None:
+        return []
+    return [row_to_result(row) for row in db.execute(statement).mappings()]
+
+
+def _search_index(
+    db: Session,
+    parsed: ParsedQuery,
+    types: Sequence[str],
+    limit: int,
+    version_id: int,
+    collapse_to: Optional[str]
+) -> List[dict]:
+    """인메모리 역색인으로 compile_search와 같은 결과를 만든다 (DB 조회 없음)"""
+    from .search_index import get_index
+    index = get_index(db, version_id)
+
+    found: Dict[tuple, dict] = {}
+    for level in types:
+        conditions = parsed.conditions_for(level)
+        if not conditions:
+            continue
+        for doc in index.search(level, conditions, limit):
+            score = LEVEL_SCORES[level]
+            if collapse_to and LEVELS.index(collapse_to) < LEVELS.index(level):
+                doc = index.ancestor(doc, collapse_to)
+            key = (doc.level, doc.id)
+            if key not in found or found[key]["match_score"] < score:
+                item = index.breadcrumb(doc)
+                item["match_score"] = score
+                found[key] = item
+
+    # 점수 → 유형 → 색인 일치 순서 (정렬은 안정적이므로 같은 점수 안에서는 검색 순서 유지)
+    results = sorted(found.values(), key=lambda item: (-item["match_score"], item["type"]))
+    return results[:limit]
+
+
+def search_level(
+    db: Session,
+    level: str,
+    terms: Dict[str, Optional[str]],
+    limit: int,
+    version_id: Optional[int] = None
+) -> List[dict]:
+    """
+    level 항목 검색 (terms: {레벨: 검색어}, 상위 레벨 조건 포함)
+
+    version_id가 없으면 메인 카탈로그 검색 (fulltext 백엔드가 아니면 LIKE 조건)
+    """
+    if uses_fulltext() or version_id is None:
+        from .fulltext_search import search_level as fulltext_search_level
+        return fulltext_search_level(db, level, terms, limit, version_id=version_id, use_match=uses_fulltext())
+
+    from .search_index import get_index
+    index = get_index(db, version_id)
+    return [index.breadcrumb(doc) for doc in index.search(level, terms, limit)]
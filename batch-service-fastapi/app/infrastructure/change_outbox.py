@@ -0,0 +1,433 @@
+"""
+Change Outbox - 스테이징 카탈로그 변경을 outbox 테이블에 기록하고 CDC 태스크가 배치로 메인에 반영
+
+쓰기: ORM 세션 after_flush에서 변경된 스테이징 브랜드/차량라인/모델/트림/옵션 중 승인된 버전의 행만
+      catalog_change_outbox에 INSERT (스테이징 쓰기와 같은 트랜잭션 - 롤백되면 outbox도 함께 롤백)
+      승인 전 버전(엑셀 임포트 등)의 쓰기는 기록하지 않는다 - 승인 후 버전 단위 이관이 반영한다.
+      삭제는 행이 사라지므로 메인 행을 찾을 자연 키를 payload에 남긴다.
+소비: drain_outbox가 오래된 순으로 batch_size건을 잠그고(SKIP LOCKED) 같은 행의 변경을 마지막 것 하나로 합친 뒤
+      승인된 버전의 변경만 레벨 순서대로 메인 테이블에 일괄 반영하고 outbox 행을 지운다 (한 트랜잭션).
+      무결성 오류로 반영할 수 없는 행은 failed_at/error를 기록해 제외하고 나머지는 계속 반영한다.
+메인 행은 기존 CDC 동기화와 같은 자연 키로 찾는다 - 브랜드: 이름, 차량라인: (브랜드, 이름), 모델: 코드,
+트림: (모델, 이름), 옵션: (트림, 이름).
+query.update()/delete() 같은 벌크 쓰기는 세션 flush를 거치지 않으므로 기록되지 않는다 (버전 단위 이관 사용).
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, event, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm.util import identity_key
+
+from ..domain.entities import ApprovalStatus
+from .orm_models import (
+    CatalogChangeOutboxORM, StagingVersionORM,
+    StagingBrandORM, StagingVehicleLineORM, StagingModelORM, StagingTrimORM, StagingOptionORM,
+    BrandORM, VehicleLineORM, ModelORM, TrimORM, OptionORM
+)
+
+OP_UPSERT = "upsert"
+OP_DELETE = "delete"
+
+# 반영 순서 (부모 레벨이 먼저) - 삭제는 역순
+LEVELS = ("brand", "vehicle_line", "model", "trim", "option")
+
+STAGING_CLASSES = {
+    "brand": StagingBrandORM,
+    "vehicle_line": StagingVehicleLineORM,
+    "model": StagingModelORM,
+    "trim": StagingTrimORM,
+    "option": StagingOptionORM,
+}
+MAIN_CLASSES = {
+    "brand": BrandORM,
+    "vehicle_line": VehicleLineORM,
+    "model": ModelORM,
+    "trim": TrimORM,
+    "option": OptionORM,
+}
+_LEVEL_BY_CLASS = {orm_class: level for level, orm_class in STAGING_CLASSES.items()}
+
+# 레벨 → (부모 FK 컬럼, 부모 레벨)
+PARENTS = {
+    "vehicle_line": ("brand_id", "brand"),
+    "model": ("vehicle_line_id", "vehicle_line"),
+    "trim": ("model_id", "model"),
+    "option": ("trim_id", "trim"),
+}
+
+# 자연 키 필드 (스테이징 조회 결과 / 삭제 payload 공통)
+KEY_FIELDS = {
+    "brand": ("name",),
+    "vehicle_line": ("brand_name", "name"),
+    "model": ("code",),
+    "trim": ("model_code", "name"),
+    "option": ("model_code", "trim_name", "name"),
+}
+# 부모 행의 자연 키 필드 (부모 레벨 KEY_FIELDS 순서)
+PARENT_KEY_FIELDS = {
+    "vehicle_line": ("brand_name",),
+    "model": ("brand_name", "line_name"),
+    "trim": ("model_code",),
+    "option": ("model_code", "trim_name"),
+}
+# 상위 레벨에서 가져오는 자연 키 값 - (상위 레벨, 컬럼, 필드 이름)
+ANCESTOR_FIELDS = (
+    ("brand", "name", "brand_name"),
+    ("vehicle_line", "name", "line_name"),
+    ("model", "code", "model_code"),
+    ("trim", "name", "trim_name"),
+)
+
+
+def _ancestors(level: str) -> List[str]:
+    chain = []
+    while level in PARENTS:
+        level = PARENTS[level][1]
+        chain.append(level)
+    return chain
+
+
+def _key(level: str, values) -> tuple:
+    return tuple(values[name] for name in KEY_FIELDS[level])
+
+
+# ===== 쓰기: 세션 flush → outbox =====
+
+def _load_parent(session: Session, level: str, entity_id: Optional[int]):
+    """세션에 있으면 객체, 없으면 DB 행 (flush 중이므로 autoflush 없이 연결로 직접 조회)"""
+    if entity_id is None:
+        return None
+    orm_class = STAGING_CLASSES[level]
+    found = session.identity_map.get(identity_key(orm_class, entity_id))
+    if found is not None:
+        return found
+    table = orm_class.__table__
+    return session.connection().execute(select(table).where(table.c.id == entity_id)).first()
+
+
+def _chain(session: Session, level: str, obj) -> dict:
+    """스테이징 행과 상위 행들 {레벨: 객체/행} (브랜드까지)"""
+    chain = {level: obj}
+    current_level, current = level, obj
+    while current_level in PARENTS and current is not None:
+        fk, parent_level = PARENTS[current_level]
+        current = _load_parent(session, parent_level, getattr(current, fk))
+        current_level = parent_level
+        chain[current_level] = current
+    return chain
+
+
+def _version_id(chain: dict) -> Optional[int]:
+    brand = chain.get("brand")
+    return getattr(brand, "version_id", None) if brand is not None else None
+
+
+def _delete_payload(level: str, obj, chain: dict) -> dict:
+    """삭제된 스테이징 행의 자연 키 + version_id"""
+    payload = {"name": getattr(obj, "name", None)}
+    if level == "model":
+        payload["code"] = obj.code
+    for ancestor, column, field_name in ANCESTOR_FIELDS:
+        if ancestor != level and ancestor in chain:
+            payload[field_name] = getattr(chain[ancestor], column, None) if chain[ancestor] is not None else None
+    payload["version_id"] = _version_id(chain)
+    return payload
+
+
+def _approved_versions(session: Session, version_ids: set) -> set:
+    """승인된 버전 ID (세션 트랜잭션 동안 버전 상태를 캐시 - flush마다 조회하지 않음)"""
+    statuses = session.info.setdefault("outbox_version_status", {})
+    missing = [version_id for version_id in version_ids if version_id not in statuses]
+    if missing:
+        table = StagingVersionORM.__table__
+        found = dict(session.connection().execute(
+            select(table.c.id, table.c.approval_status).where(table.c.id.in_(missing))
+        ).all())
+        for version_id in missing:
+            statuses[version_id] = found.get(version_id)
+    return {
+        version_id for version_id in version_ids
+        if statuses[version_id] in (ApprovalStatus.APPROVED, ApprovalStatus.APPROVED.value)
+    }
+
+
+@event.listens_for(Session, "after_flush")
+def _record_changes(session: Session, flush_context):
+    changes = []  # (레벨, 객체, 연산, 상위 체인)
+    for obj in list(session.new) + list(session.dirty):
+        level = _LEVEL_BY_CLASS.get(type(obj))
+        if level is not None and (obj in session.new or session.is_modified(obj, include_collections=False)):
+            changes.append((level, obj, OP_UPSERT, _chain(session, level, obj)))
+    for obj in session.deleted:
+        level = _LEVEL_BY_CLASS.get(type(obj))
+        if level is not None:
+            changes.append((level, obj, OP_DELETE, _chain(session, level, obj)))
+    if not changes:
+        return
+
+    approved = _approved_versions(session, {_version_id(chain) for _, _, _, chain in changes} - {None})
+    rows = [
+        {
+            "entity_type": level,
+            "entity_id": obj.id,
+            "operation": operation,
+            "payload": _delete_payload(level, obj, chain) if operation == OP_DELETE else None,
+        }
+        for level, obj, operation, chain in changes
+        if _version_id(chain) in approved
+    ]
+    if rows:
+        session.connection().execute(insert(CatalogChangeOutboxORM.__table__), rows)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _reset_version_status(session: Session):
+    session.info.pop("outbox_version_status", None)
+
+
+# ===== 소비: outbox → 메인 =====
+
+def _resolve_main(db: Session, level: str, keys) -> Dict[tuple, int]:
+    """자연 키 → 메인 ID (레벨당 1쿼리)"""
+    keys = set(keys)
+    if not keys:
+        return {}
+    main = MAIN_CLASSES[level]
+    if level == "brand":
+        query = select(main.id, main.name).where(main.name.in_({key[0] for key in keys}))
+    elif level == "vehicle_line":
+        query = select(main.id, BrandORM.name, main.name).join(
+            BrandORM, main.brand_id == BrandORM.id
+        ).where(BrandORM.name.in_({key[0] for key in keys}))
+    elif level == "model":
+        query = select(main.id, main.code).where(main.code.in_({key[0] for key in keys}))
+    elif level == "trim":
+        query = select(main.id, ModelORM.code, main.name).join(
+            ModelORM, main.model_id == ModelORM.id
+        ).where(ModelORM.code.in_({key[0] for key in keys}))
+    else:
+        query = select(main.id, ModelORM.code, TrimORM.name, main.name).join(
+            TrimORM, main.trim_id == TrimORM.id
+        ).join(
+            ModelORM, TrimORM.model_id == ModelORM.id
+        ).where(ModelORM.code.in_({key[0] for key in keys}))
+
+    found: Dict[tuple, int] = {}
+    for row in db.execute(query.order_by(main.id)):
+        key = tuple(row[1:])
+        if key in keys:
+            found.setdefault(key, row[0])
+    return found
+
+
+def _load_staging(db: Session, level: str, ids: List[int]) -> List[dict]:
+    """변경된 스테이징 행 + 상위 자연 키 (승인된 버전만, 1쿼리)"""
+    staging = STAGING_CLASSES[level]
+    aliases = {level: staging}
+    columns = [staging]
+    for ancestor in _ancestors(level):
+        aliases[ancestor] = aliased(STAGING_CLASSES[ancestor])
+    field_names = []
+    for ancestor, column, field_name in ANCESTOR_FIELDS:
+        if ancestor != level and ancestor in aliases:
+            columns.append(getattr(aliases[ancestor], column).label(field_name))
+            field_names.append(field_name)
+
+    query = select(*columns).select_from(staging)
+    current = level
+    while current in PARENTS:
+        fk, parent = PARENTS[current]
+        query = query.join(aliases[parent], getattr(aliases[current], fk) == aliases[parent].id)
+        current = parent
+    query = query.join(
+        StagingVersionORM, aliases["brand"].version_id == StagingVersionORM.id
+    ).where(
+        staging.id.in_(ids),
+        StagingVersionORM.approval_status == ApprovalStatus.APPROVED
+    )
+
+    copy_columns = [
+        column.key for column in staging.__table__.columns
+        if column.key in MAIN_CLASSES[level].__table__.columns and column.key != "id" and not column.foreign_keys
+    ]
+    rows = []
+    for row in db.execute(query):
+        values = {name: getattr(row[0], name) for name in copy_columns}
+        for field_name in field_names:
+            values[field_name] = row._mapping[field_name]
+        rows.append(values)
+    return rows
+
+
+def _apply_upserts(db: Session, level: str, ids: List[int]) -> Tuple[int, int, int]:
+    """스테이징 행을 메인에 일괄 삽입/갱신 - (삽입 수, 갱신 수, 건너뜀 수)"""
+    rows = _load_staging(db, level, ids)
+    if not rows:
+        return 0, 0, len(ids)
+
+    parents: Dict[tuple, int] = {}
+    if level in PARENTS:
+        parent_level = PARENTS[level][1]
+        parents = _resolve_main(db, parent_level, (
+            tuple(row[name] for name in PARENT_KEY_FIELDS[level]) for row in rows
+        ))
+    existing = _resolve_main(db, level, (_key(level, row) for row in rows))
+
+    main = MAIN_CLASSES[level]
+    data_columns = {column.key for column in main.__table__.columns}
+    inserts, updates, skipped = [], [], len(ids) - len(rows)
+    for row in rows:
+        values = {name: value for name, value in row.items() if name in data_columns}
+        if level in PARENTS:
+            parent_id = parents.get(tuple(row[name] for name in PARENT_KEY_FIELDS[level]))
+            if parent_id is None:
+                # 상위 항목이 아직 메인에 없음 (버전 이관 전)
+                skipped += 1
+                continue
+            values[PARENTS[level][0]] = parent_id
+        main_id = existing.get(_key(level, row))
+        if main_id is None:
+            inserts.append(values)
+        else:
+            updates.append({"id": main_id, **values})
+
+    if inserts:
+        db.execute(insert(main), inserts)
+    if updates:
+        db.execute(update(main), updates)
+    return len(inserts), len(updates), skipped
+
+
+def _delete_main(db: Session, level: str, ids: List[int]) -> int:
+    """메인 행과 하위 카탈로그 행 삭제 (하위부터)"""
+    if not ids:
+        return 0
+    position = LEVELS.index(level)
+    if position + 1 < len(LEVELS):
+        child_level = LEVELS[position + 1]
+        child = MAIN_CLASSES[child_level]
+        fk = getattr(child, PARENTS[child_level][0])
+        child_ids = list(db.execute(select(child.id).where(fk.in_(ids))).scalars())
+        _delete_main(db, child_level, child_ids)
+    main = MAIN_CLASSES[level]
+    return db.execute(delete(main).where(main.id.in_(ids))).rowcount
+
+
+def _apply_changes(db: Session, latest: Dict[Tuple[str, int], CatalogChangeOutboxORM], stats: dict) -> None:
+    """합쳐진 변경을 메인에 반영 - 업서트는 레벨 순서, 삭제는 역순 (커밋하지 않음)"""
+    upserts: Dict[str, List[int]] = {level: [] for level in LEVELS}
+    deletes: Dict[str, List[dict]] = {level: [] for level in LEVELS}
+    for (level, entity_id), entry in latest.items():
+        if entry.operation == OP_DELETE:
+            deletes[level].append(entry.payload or {})
+        else:
+            upserts[level].append(entity_id)
+
+    for level in LEVELS:
+        if upserts[level]:
+            inserted, updated, skipped = _apply_upserts(db, level, upserts[level])
+            stats["inserted"] += inserted
+            stats["updated"] += updated
+            stats["skipped"] += skipped
+
+    payloads = [payload for level in LEVELS for payload in deletes[level]]
+    version_ids = {payload.get("version_id") for payload in payloads} - {None}
+    approved = set(db.execute(
+        select(StagingVersionORM.id).where(
+            StagingVersionORM.id.in_(version_ids),
+            StagingVersionORM.approval_status == ApprovalStatus.APPROVED
+        )
+    ).scalars()) if version_ids else set()
+    for level in reversed(LEVELS):
+        keys = [
+            _key(level, {name: payload.get(name) for name in KEY_FIELDS[level]})
+            for payload in deletes[level] if payload.get("version_id") in approved
+        ]
+        stats["skipped"] += len(deletes[level]) - len(keys)
+        main_ids = list(_resolve_main(db, level, keys).values())
+        stats["deleted"] += _delete_main(db, level, main_ids)
+
+
+def _apply_each(
+    db: Session, latest: Dict[Tuple[str, int], CatalogChangeOutboxORM], stats: dict
+) -> Dict[Tuple[str, int], str]:
+    """
+    변경을 한 행씩 SAVEPOINT 안에서 반영 - 무결성 오류가 난 행만 되돌리고 나머지는 반영
+
+    반환: 실패한 행 {(entity_type, entity_id): 오류 메시지}
+    """
+    def order(item):
+        (level, _), entry = item
+        position = LEVELS.index(level)
+        return (1, -position) if entry.operation == OP_DELETE else (0, position)
+
+    failed: Dict[Tuple[str, int], str] = {}
+    for key, entry in sorted(latest.items(), key=order):
+        row_stats = dict.fromkeys(("inserted", "updated", "deleted", "skipped"), 0)
+        try:
+            with db.begin_nested():
+                _apply_changes(db, {key: entry}, row_stats)
+        except IntegrityError as e:
+            failed[key] = str(e.orig)[:1000]
+            continue
+        for name, value in row_stats.items():
+            stats[name] += value
+    return failed
+
+
+def drain_outbox(db: Session, batch_size: int) -> dict:
+    """
+    outbox에서 batch_size건을 꺼내 메인에 반영 (한 트랜잭션, 커밋 포함)
+
+    배치 반영이 무결성 오류(예: 메인 브랜드/트림을 할인 정책·옵션 타이틀·트림 색상이 아직 참조)로 실패하면
+    한 행씩 다시 반영하고, 실패한 행의 outbox 항목은 failed_at/error를 기록해 다음 배치에서 제외한다
+    (원인 해결 후 failed_at을 NULL로 되돌리면 재처리).
+    반환: 처리 통계 (changes: 꺼낸 건수, coalesced: 합친 뒤 행 수, failed: 실패로 제외한 항목 수, ...)
+    """
+    outbox = CatalogChangeOutboxORM
+    entries = db.execute(
+        select(outbox).where(outbox.failed_at.is_(None))
+        .order_by(outbox.id).limit(batch_size).with_for_update(skip_locked=True)
+    ).scalars().all()
+    stats = {
+        "changes": len(entries), "coalesced": 0, "inserted": 0, "updated": 0,
+        "deleted": 0, "skipped": 0, "failed": 0
+    }
+    if not entries:
+        db.rollback()
+        return stats
+
+    try:
+        # 같은 행의 변경은 마지막 것 하나로
+        latest: Dict[Tuple[str, int], CatalogChangeOutboxORM] = {}
+        for entry in entries:
+            latest[(entry.entity_type, entry.entity_id)] = entry
+        stats["coalesced"] = len(latest)
+
+        failed: Dict[Tuple[str, int], str] = {}
+        batch_stats = dict(stats)
+        try:
+            with db.begin_nested():
+                _apply_changes(db, latest, batch_stats)
+            stats = batch_stats
+        except IntegrityError:
+            failed = _apply_each(db, latest, stats)
+
+        done = [entry.id for entry in entries if (entry.entity_type, entry.entity_id) not in failed]
+        if done:
+            db.execute(delete(outbox).where(outbox.id.in_(done)))
+        now = datetime.utcnow()
+        for entry in entries:
+            error = failed.get((entry.entity_type, entry.entity_id))
+            if error is not None:
+                entry.failed_at = now
+                entry.error = error
+                stats["failed"] += 1
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return stats
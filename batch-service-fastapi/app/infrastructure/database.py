@@ -5,17 +5,22 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from ..config import settings
+from .pool_metrics import InstrumentedQueuePool, instrument_engine
+
+# 프로세스 역할(api / excel_worker / cdc_worker)별 연결 풀 프로필
+pool_profile = settings.get_pool_profile()
 
 # SQLAlchemy 엔진 생성 (연결 풀 설정 최적화)
 engine = create_engine(
     settings.database_url,
     echo=True,
-    # 연결 풀 설정 (설정 파일에서 가져옴)
-    pool_size=settings.db_pool_size,          # 기본 연결 풀 크기
-    max_overflow=settings.db_max_overflow,    # 오버플로우 연결 수
-    pool_timeout=settings.db_pool_timeout,    # 연결 대기 시간
-    pool_recycle=settings.db_pool_recycle,    # 연결 재활용 시간
-    pool_pre_ping=True,                       # 연결 유효성 검사 활성화
+    # 연결 풀 설정 (역할별 프로필에서 가져옴)
+    poolclass=InstrumentedQueuePool,                  # checkout 대기 시간 측정
+    pool_size=pool_profile["pool_size"],              # 기본 연결 풀 크기
+    max_overflow=pool_profile["max_overflow"],        # 오버플로우 연결 수
+    pool_timeout=pool_profile["pool_timeout"],        # 연결 대기 시간
+    pool_recycle=pool_profile["pool_recycle"],        # 연결 재활용 시간
+    pool_pre_ping=True,                               # 연결 유효성 검사 활성화
     # 연결 설정
     connect_args={
         "charset": "utf8mb4",
@@ -26,6 +31,9 @@ engine = create_engine(
     }
 )
 
+# 연결 풀 텔레메트리 리스너 등록
+instrument_engine(engine)
+
 # 세션 팩토리
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
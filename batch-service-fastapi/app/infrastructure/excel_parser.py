@@ -3,7 +3,6 @@ Excel Parser 구현체 - Pandas 기반
 실제 엑셀 구조에 맞게 수정된 파서
 """
 from typing import List, Dict, Optional
-import pandas as pd
 from io import BytesIO
 from ..application.ports import ExcelParser
 
@@ -29,6 +28,9 @@ class PandasExcelParser(ExcelParser):
             ...
         }
         """
+        # pandas/openpyxl은 무거우므로 실제 파싱 시점에만 import (API/워커 기동 시간 단축)
+        import pandas as pd
+
         try:
             print(f"[DEBUG] 엑셀 파일 파싱 시작")
             
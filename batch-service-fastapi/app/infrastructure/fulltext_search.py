@@ -0,0 +1,132 @@
+"""
+FULLTEXT Search - MySQL ngram FULLTEXT 인덱스 기반 이름 검색
+
+스테이징/메인 카탈로그의 name 컬럼에 ngram 파서 FULLTEXT 인덱스를 두고
+MATCH ... AGAINST (BOOLEAN MODE, 구문 검색)로 부분 문자열에 가까운 검색과 관련도 정렬을 한다.
+ngram 토큰보다 짧은 검색어(1글자)는 인덱스로 찾을 수 없으므로 LIKE 조건으로 대체한다.
+"""
+from typing import Dict, List, Optional
+
+from sqlalchemy import literal, select, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+
+from .search_index import LEVEL_SCORES
+from .tree_loader import LEVELS, PARENT_KEYS, STAGING_TREE, MAIN_TREE
+
+# MySQL 기본 ngram_token_size
+NGRAM_TOKEN_SIZE = 2
+
+
+def fulltext_index_name(table_name: str) -> str:
+    return f"ft_{table_name}_name"
+
+
+def ensure_fulltext_indexes(engine) -> List[str]:
+    """카탈로그 name 컬럼의 ngram FULLTEXT 인덱스 생성 (MySQL 전용, 이미 있으면 건너뜀)"""
+    if engine.dialect.name != "mysql":
+        return []
+    tables = [orm_class.__tablename__ for tree in (STAGING_TREE, MAIN_TREE) for orm_class in tree.values()]
+    created = []
+    with engine.begin() as connection:
+        existing = {
+            row[0] for row in connection.execute(text(
+                "SELECT DISTINCT index_name FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND index_type = 'FULLTEXT'"
+            ))
+        }
+        for table_name in tables:
+            index_name = fulltext_index_name(table_name)
+            if index_name in existing:
+                continue
+            connection.execute(text(
+                f"ALTER TABLE `{table_name}` ADD FULLTEXT INDEX `{index_name}` (`name`) WITH PARSER ngram"
+            ))
+            created.append(index_name)
+    return created
+
+
+def _phrase(term: str) -> str:
+    """BOOLEAN MODE 구문 검색식 (연산자 문자 제거 후 큰따옴표로 감쌈)"""
+    cleaned = "".join(ch for ch in term if ch not in '"+-<>()~*@')
+    return f'"{cleaned}"'
+
+
+def _condition(column, term: str, use_match: bool = True):
+    """검색어 조건과 관련도 식 - (WHERE 조건, 관련도 또는 None)"""
+    stripped = term.strip()
+    if not use_match or len("".join(stripped.split())) < NGRAM_TOKEN_SIZE:
+        return column.like(f"%{stripped}%"), None
+    expression = match(column, against=_phrase(stripped)).in_boolean_mode()
+    return expression, expression
+
+
+def match_condition(column, term: str):
+    """검색어 WHERE 조건 (search_query.compile_search용)"""
+    return _condition(column, term)[0]
+
+
+def match_relevance(column, term: str):
+    """검색어 관련도 식 (search_query.compile_search용, LIKE로 대체되는 짧은 검색어는 None)"""
+    return _condition(column, term)[1]
+
+
+def search_level(
+    db: Session,
+    level: str,
+    terms: Dict[str, Optional[str]],
+    limit: int,
+    version_id: Optional[int] = None,
+    use_match: bool = True
+) -> List[dict]:
+    """
+    level 항목 중 레벨별 조건(terms: {레벨: 검색어})을 모두 만족하는 항목을 관련도 순으로 반환
+
+    version_id가 있으면 스테이징 버전, 없으면 메인 카탈로그를 검색한다.
+    use_match=False면 FULLTEXT 인덱스 없이 LIKE 조건만 사용한다 (관련도 0, ID 순).
+    상위 레벨 이름까지 한 행으로 조회하므로 결과 수와 무관하게 쿼리 1번이다.
+    반환 항목: id, name, type, match_score, relevance, {상위레벨}_id, {상위레벨}_name
+    """
+    tree = STAGING_TREE if version_id is not None else MAIN_TREE
+    depth = LEVELS.index(level)
+    path = LEVELS[:depth + 1]
+
+    columns = []
+    for name in path:
+        orm_class = tree[name]
+        columns += [orm_class.id.label(f"{name}_id"), orm_class.name.label(f"{name}_name")]
+
+    query = select(*columns).select_from(tree[level])
+    for index in range(depth, 0, -1):
+        child, parent = tree[LEVELS[index]], tree[LEVELS[index - 1]]
+        query = query.join(parent, getattr(child, PARENT_KEYS[LEVELS[index]]) == parent.id)
+    if version_id is not None:
+        query = query.where(tree["brand"].version_id == version_id)
+
+    relevance = []
+    for name, term in terms.items():
+        if not term or name not in path:
+            continue
+        condition, score = _condition(tree[name].name, term, use_match)
+        query = query.where(condition)
+        if score is not None:
+            relevance.append(score)
+
+    relevance_expression = sum(relevance[1:], relevance[0]) if relevance else literal(0)
+    query = query.add_columns(relevance_expression.label("relevance"))
+    query = query.order_by(text("relevance DESC"), tree[level].id).limit(limit)
+
+    results = []
+    for row in db.execute(query).mappings():
+        item = {
+            "id": row[f"{level}_id"],
+            "name": row[f"{level}_name"],
+            "type": level,
+            "match_score": LEVEL_SCORES[level],
+            "relevance": float(row["relevance"] or 0),
+        }
+        for name in path:
+            item[f"{name}_id"] = row[f"{name}_id"]
+            item[f"{name}_name"] = row[f"{name}_name"]
+        results.append(item)
+    return results
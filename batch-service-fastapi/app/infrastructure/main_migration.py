@@ -0,0 +1,106 @@
+"""
+Main Migration - 승인된 스테이징 버전 계층을 메인 테이블로 일괄 이관
+
+레벨(브랜드 → 차량라인 → 모델 → 트림 → 옵션)마다 INSERT ... SELECT 1문으로 복사한다 (version_clone과 같은 방식).
+메인 ID는 "스테이징 ID + 레벨별 오프셋"으로 미리 정하고, 자식 행의 FK도 부모 레벨의 오프셋만큼 더해
+스테이징 → 메인 ID를 매핑한다. 오프셋 계산 시 메인 테이블의 MAX(id)를 FOR UPDATE로 읽어
+이관이 끝날 때까지 다른 트랜잭션이 해당 ID 구간에 삽입하지 못하게 한다.
+메인 테이블에 없는 컬럼(version_id, 감사 컬럼)은 복사하지 않고, 스테이징에 없는 메인 컬럼은 기본값으로 둔다.
+"""
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import column as sql_column, func, insert, select, table as sql_table
+from sqlalchemy.orm import Session
+
+from ..application.ports import MainCatalogMigrator
+from .orm_models import (
+    StagingBrandORM, StagingVehicleLineORM, StagingModelORM, StagingTrimORM, StagingOptionORM,
+    BrandORM, VehicleLineORM, ModelORM, TrimORM, OptionORM
+)
+from .version_clone import _scoped_select
+
+# 이관 순서 (부모 레벨이 먼저) - (스테이징 ORM, 메인 ORM)
+MAIN_MIGRATION_PLAN = (
+    (StagingBrandORM, BrandORM),
+    (StagingVehicleLineORM, VehicleLineORM),
+    (StagingModelORM, ModelORM),
+    (StagingTrimORM, TrimORM),
+    (StagingOptionORM, OptionORM),
+)
+
+
+def migrate_version_rows(
+    db: Session,
+    version_id: int,
+    suffix: str = "",
+    conditions: Optional[dict] = None,
+    id_floors: Optional[Dict[str, int]] = None
+) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    스테이징 버전 계층을 메인 테이블로 복사 (커밋은 호출자 담당)
+
+    suffix: 대상 테이블 이름 접미사 (예: "__next" - 같은 구조의 섀도 테이블에 복사)
+    conditions: {스테이징 ORM: 추가 WHERE 조건} - 해당 레벨에서 복사할 행 제한
+    id_floors: {메인 테이블: 사용 중인 최대 ID} - 대상 테이블(빈 섀도 테이블 등) 밖의 ID도 재사용하지 않도록
+    반환: (메인 테이블별 이관 행 수, 메인 테이블별 ID 오프셋 - 메인 ID = 스테이징 ID + 오프셋)
+    """
+    conditions = conditions or {}
+    id_floors = id_floors or {}
+    offsets: Dict[str, int] = {}
+    counts: Dict[str, int] = {}
+
+    for staging_class, main_class in MAIN_MIGRATION_PLAN:
+        table = main_class.__table__
+        target = sql_table(table.name + suffix, *[sql_column(c.key) for c in table.columns])
+        staging_columns = staging_class.__table__.columns
+        counts[table.name] = 0
+
+        min_id = db.execute(_scoped_select(staging_class, version_id, func.min(staging_class.id))).scalar()
+        if min_id is None:
+            continue
+        # 메인 테이블 끝 구간 잠금 - 이관 중 다른 삽입이 새 ID 구간과 겹치지 않도록
+        max_id = db.execute(select(func.max(target.c.id)).with_for_update()).scalar() or 0
+        max_id = max(max_id, id_floors.get(table.name, 0))
+        offset = max_id + 1 - min_id
+        offsets[table.name] = offset
+
+        target_columns = []
+        select_columns = []
+        for column in table.columns:
+            if column.key not in staging_columns:
+                continue
+            source = getattr(staging_class, column.key)
+            if column.key == "id":
+                value = source + offset
+            elif column.foreign_keys:
+                parent_table = next(iter(column.foreign_keys)).column.table
+                value = source + offsets.get(parent_table.name, 0)
+            else:
+                value = source
+            target_columns.append(column.key)
+            select_columns.append(value)
+
+        source_rows = _scoped_select(staging_class, version_id, *select_columns)
+        if staging_class in conditions:
+            source_rows = source_rows.where(conditions[staging_class])
+        statement = insert(target).from_select(target_columns, source_rows)
+        counts[table.name] = db.execute(statement).rowcount
+
+    return counts, offsets
+
+
+class SQLAlchemyMainCatalogMigrator(MainCatalogMigrator):
+    """INSERT ... SELECT 기반 메인 카탈로그 이관 (전체 레벨을 한 트랜잭션으로 커밋)"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def migrate_version(self, version_id: int) -> Dict[str, int]:
+        try:
+            counts, offsets = migrate_version_rows(self.db, version_id)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        print(f"[DEBUG] 메인 이관 완료 - version_id={version_id}, counts={counts}, offsets={offsets}")
+        return counts
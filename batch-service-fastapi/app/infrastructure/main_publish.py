@@ -0,0 +1,327 @@
+"""
+Main Publish - 승인된 버전으로 메인 카탈로그 전체 교체 (섀도 테이블 + RENAME TABLE 교체, MySQL)
+
+1. 메인 카탈로그 테이블마다 같은 구조의 섀도 테이블(brand__next, ...)을 만든다 (CREATE TABLE ... LIKE)
+2. 섀도 테이블에 버전 계층을 INSERT ... SELECT로 채운다 (main_migration과 같은 복사 경로, 메인 테이블 잠금 없음)
+   새 ID는 현재/이전 세대의 최대 ID 다음부터 정하므로 이전에 쓰인 ID를 재사용하지 않는다.
+3. RENAME TABLE 한 문장으로 "현재 → __prev, __next → 현재"를 원자적으로 교체한다
+   읽기 요청은 교체 전 카탈로그 또는 교체 후 카탈로그만 보며 빈/부분 카탈로그를 보지 않는다.
+4. 이전 세대(__prev)는 다음 게시 전까지 보관하며 rollback_main_catalog로 즉시 되돌린다.
+
+외래 키: InnoDB의 RENAME TABLE은 참조 FK를 이름이 바뀐 테이블(__prev)로 옮기고, CREATE TABLE ... LIKE는 FK를 복사하지 않는다.
+그래서 교체 전에 카탈로그 테이블을 참조하는 FK(카탈로그 내부 + discount_policy, trim_car_color, option_title 등)를
+information_schema에서 읽어 삭제하고, 교체 후 같은 이름으로 새 현재 테이블에 다시 만든다 (되돌리기도 동일).
+카탈로그 밖의 참조 행은 자연 키(브랜드명 → 라인명 → 모델 코드 → 트림명 → 옵션명)로 새 세대 ID에 다시 연결한다.
+새 세대에 대응 항목이 없는 참조 행이 있으면 교체하지 않고 ValueError를 낸다 (FK는 검증을 켠 상태로 재생성).
+
+게시/되돌리기는 MySQL 네임드 락(GET_LOCK)으로 직렬화한다 - 동시에 실행되면 같은 __next 테이블을 지우고 다시 채우게 된다.
+"""
+from contextlib import contextmanager
+from typing import Dict, List
+
+from sqlalchemy import and_, bindparam, column as sql_column, func, select, table as sql_table, text, update
+from sqlalchemy.orm import Session
+
+from .main_migration import MAIN_MIGRATION_PLAN, migrate_version_rows
+from .orm_models import StagingOptionORM
+from .tree_loader import LEVELS, MAIN_TREE, PARENT_KEYS
+
+NEXT_SUFFIX = "__next"
+PREV_SUFFIX = "__prev"
+SWAP_SUFFIX = "__swap"
+
+# 가격 없는 옵션은 메인 카탈로그에 게시하지 않음
+PUBLISH_CONDITIONS = {
+    StagingOptionORM: StagingOptionORM.price.isnot(None) & (StagingOptionORM.price != 0),
+}
+
+# 세대 간 같은 항목을 찾는 레벨별 자연 키 (상위 레벨 일치 + 이 컬럼 일치)
+NATURAL_KEYS = {
+    "brand": "name",
+    "vehicle_line": "name",
+    "model": "code",
+    "trim": "name",
+    "option": "name",
+}
+
+LEVEL_BY_TABLE = {orm_class.__tablename__: level for level, orm_class in MAIN_TREE.items()}
+
+PUBLISH_LOCK_NAME = "main_catalog_publish"
+PUBLISH_LOCK_TIMEOUT = 10  # 락 대기 시간 (초)
+
+
+def catalog_tables() -> List[str]:
+    return [main_class.__table__.name for _, main_class in MAIN_MIGRATION_PLAN]
+
+
+def _quote(db: Session, name: str) -> str:
+    return db.get_bind().dialect.identifier_preparer.quote(name)
+
+
+def _generation(level: str, suffix: str = ""):
+    """레벨 테이블의 세대(접미사) 테이블 객체"""
+    table = MAIN_TREE[level].__table__
+    return sql_table(table.name + suffix, *[sql_column(c.key) for c in table.columns])
+
+
+def _existing_tables(db: Session, names: List[str]) -> set:
+    statement = text("""
+        SELECT table_name AS table_name
+        FROM information_schema.tables
+        WHERE table_schema = DATABASE() AND table_name IN :names
+    """).bindparams(bindparam("names", expanding=True))
+    return {row.table_name for row in db.execute(statement, {"names": names})}
+
+
+def _id_floors(db: Session, tables: List[str]) -> Dict[str, int]:
+    """테이블별 현재/이전 세대 최대 ID (새 세대 ID가 이전에 쓰인 ID와 겹치지 않도록)"""
+    existing = _existing_tables(db, [name + PREV_SUFFIX for name in tables])
+    floors = {}
+    for name in tables:
+        level = LEVEL_BY_TABLE[name]
+        suffixes = [""] + ([PREV_SUFFIX] if name + PREV_SUFFIX in existing else [])
+        floors[name] = max(
+            db.execute(select(func.max(_generation(level, suffix).c.id))).scalar() or 0
+            for suffix in suffixes
+        )
+    return floors
+
+
+def _referencing_foreign_keys(db: Session, tables: List[str]) -> List[dict]:
+    """카탈로그 테이블을 참조하는 FK 정의 목록 (다중 컬럼 FK는 컬럼 순서대로 묶음)"""
+    statement = text("""
+        SELECT
+            kcu.constraint_name AS constraint_name,
+            kcu.table_name AS table_name,
+            kcu.column_name AS column_name,
+            kcu.referenced_table_name AS referenced_table_name,
+            kcu.referenced_column_name AS referenced_column_name,
+            rc.update_rule AS update_rule,
+            rc.delete_rule AS delete_rule
+        FROM information_schema.key_column_usage kcu
+        JOIN information_schema.referential_constraints rc
+            ON rc.constraint_schema = kcu.constraint_schema
+            AND rc.table_name = kcu.table_name
+            AND rc.constraint_name = kcu.constraint_name
+        WHERE kcu.table_schema = DATABASE() AND kcu.referenced_table_name IN :tables
+        ORDER BY kcu.table_name, kcu.constraint_name, kcu.ordinal_position
+    """).bindparams(bindparam("tables", expanding=True))
+
+    foreign_keys: Dict[tuple, dict] = {}
+    for row in db.execute(statement, {"tables": tables}):
+        key = (row.table_name, row.constraint_name)
+        fk = foreign_keys.setdefault(key, {
+            "name": row.constraint_name,
+            "table": row.table_name,
+            "columns": [],
+            "referenced_table": row.referenced_table_name,
+            "referenced_columns": [],
+            "update_rule": row.update_rule,
+            "delete_rule": row.delete_rule,
+        })
+        fk["columns"].append(row.column_name)
+        fk["referenced_columns"].append(row.referenced_column_name)
+    return list(foreign_keys.values())
+
+
+def _external_references(foreign_keys: List[dict], tables: List[str]) -> List[dict]:
+    """카탈로그 밖 테이블의 단일 컬럼 참조 (세대 테이블 자신의 FK 제외)"""
+    generations = {name + suffix for name in tables for suffix in ("", NEXT_SUFFIX, PREV_SUFFIX, SWAP_SUFFIX)}
+    return [
+        fk for fk in foreign_keys
+        if fk["table"] not in generations and len(fk["columns"]) == 1 and fk["referenced_columns"] == ["id"]
+    ]
+
+
+def _id_map(level: str, target_suffix: str):
+    """현재 세대 ID → 대상 세대 ID (자연 키 경로가 같은 항목, 중복 시 가장 작은 ID)"""
+    depth = LEVELS.index(level)
+    current = [_generation(name).alias(f"cur_{index}") for index, name in enumerate(LEVELS[:depth + 1])]
+    target = [_generation(name, target_suffix).alias(f"tgt_{index}") for index, name in enumerate(LEVELS[:depth + 1])]
+
+    joined = current[0]
+    for index in range(1, depth + 1):
+        parent_key = PARENT_KEYS[LEVELS[index]]
+        joined = joined.join(current[index], current[index].c[parent_key] == current[index - 1].c.id)
+    for index, name in enumerate(LEVELS[:depth + 1]):
+        key = NATURAL_KEYS[name]
+        condition = target[index].c[key] == current[index].c[key]
+        if index:
+            condition = and_(condition, target[index].c[PARENT_KEYS[name]] == target[index - 1].c.id)
+        joined = joined.join(target[index], condition)
+
+    return (
+        select(current[depth].c.id.label("old_id"), func.min(target[depth].c.id).label("new_id"))
+        .select_from(joined)
+        .group_by(current[depth].c.id)
+        .subquery()
+    )
+
+
+def _unmapped_references(db: Session, references: List[dict], target_suffix: str) -> Dict[str, int]:
+    """대상 세대에 대응 항목이 없는 참조 행 수 ({"테이블.컬럼": 행 수}, 0건은 제외)"""
+    unmapped = {}
+    for fk in references:
+        column = fk["columns"][0]
+        child = sql_table(fk["table"], sql_column(column))
+        id_map = _id_map(LEVEL_BY_TABLE[fk["referenced_table"]], target_suffix)
+        count = db.execute(
+            select(func.count()).select_from(child).where(
+                child.c[column].isnot(None),
+                child.c[column].not_in(select(id_map.c.old_id))
+            )
+        ).scalar()
+        if count:
+            unmapped[f"{fk['table']}.{column}"] = count
+    return unmapped
+
+
+def _remap_references(db: Session, references: List[dict], target_suffix: str):
+    """참조 행을 대상 세대 ID로 다시 연결 (UPDATE ... JOIN, 참조 컬럼별 1문)"""
+    for fk in references:
+        column = fk["columns"][0]
+        child = sql_table(fk["table"], sql_column(column))
+        id_map = _id_map(LEVEL_BY_TABLE[fk["referenced_table"]], target_suffix)
+        db.execute(update(child).where(child.c[column] == id_map.c.old_id).values({column: id_map.c.new_id}))
+
+
+def _check_references(db: Session, tables: List[str], target_suffix: str) -> List[dict]:
+    """교체 전 확인 - 모든 외부 참조가 대상 세대로 연결 가능한지 (아니면 ValueError)"""
+    foreign_keys = _referencing_foreign_keys(db, tables)
+    unmapped = _unmapped_references(db, _external_references(foreign_keys, tables), target_suffix)
+    if unmapped:
+        detail = ", ".join(f"{name} {count}건" for name, count in sorted(unmapped.items()))
+        raise ValueError(f"새 카탈로그에 대응 항목이 없는 참조 행이 있어 교체할 수 없습니다: {detail}")
+    return foreign_keys
+
+
+def _swap_tables(db: Session, tables: List[str], renames: List[str], foreign_keys: List[dict], target_suffix: str):
+    """
+    참조 FK 삭제 → 외부 참조 행 재연결 → RENAME TABLE 한 문장으로 교체 → FK 재생성 (검증 포함)
+
+    FK를 그대로 두면 RENAME이 참조를 __prev로 옮겨, 다음 게시에서 __prev 삭제 시 끊어진 FK가 남는다.
+    """
+    q = lambda name: _quote(db, name)
+    for fk in foreign_keys:
+        db.execute(text(f"ALTER TABLE {q(fk['table'])} DROP FOREIGN KEY {q(fk['name'])}"))
+
+    _remap_references(db, _external_references(foreign_keys, tables), target_suffix)
+    db.execute(text("RENAME TABLE " + ", ".join(renames)))
+
+    for fk in foreign_keys:
+        db.execute(text(
+            f"ALTER TABLE {q(fk['table'])} ADD CONSTRAINT {q(fk['name'])} "
+            f"FOREIGN KEY ({', '.join(q(column) for column in fk['columns'])}) "
+            f"REFERENCES {q(fk['referenced_table'])} ({', '.join(q(column) for column in fk['referenced_columns'])}) "
+            f"ON UPDATE {fk['update_rule']} ON DELETE {fk['delete_rule']}"
+        ))
+    db.commit()
+    print(f"[DEBUG] 카탈로그 FK {len(foreign_keys)}개 재생성")
+
+
+@contextmanager
+def _publish_lock(db: Session):
+    """
+    메인 카탈로그 게시 락 (GET_LOCK) - 대기 시간 안에 얻지 못하면 TimeoutError
+
+    세션 연결은 커밋마다 풀로 돌아갈 수 있으므로 락은 별도 연결에서 잡고 끝날 때까지 유지한다.
+    """
+    with db.get_bind().connect() as connection:
+        acquired = connection.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"),
+            {"name": PUBLISH_LOCK_NAME, "timeout": PUBLISH_LOCK_TIMEOUT}
+        ).scalar()
+        if acquired != 1:
+            raise TimeoutError("다른 메인 카탈로그 게시/되돌리기 작업이 진행 중입니다")
+        try:
+            yield
+        finally:
+            connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": PUBLISH_LOCK_NAME})
+
+
+def _drop_tables(db: Session, names: List[str]):
+    """섀도/이전 세대 테이블 일괄 삭제 (교체 시 FK를 떼어 두므로 참조는 없지만, 이전 버전이 남긴 FK에 대비해 검사를 끄고 수행)"""
+    db.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
+    try:
+        db.execute(text("DROP TABLE IF EXISTS " + ", ".join(_quote(db, name) for name in names)))
+    finally:
+        db.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
+
+
+def publish_version(db: Session, version_id: int) -> Dict[str, int]:
+    """
+    버전 계층을 섀도 테이블에 만든 뒤 메인 카탈로그와 원자적으로 교체
+
+    반환: 메인 테이블별 게시 행 수
+    예외: ValueError - 새 카탈로그로 옮길 수 없는 참조 행이 있음 (현재 카탈로그 유지)
+          TimeoutError - 다른 게시/되돌리기 작업 진행 중
+    """
+    with _publish_lock(db):
+        return _publish_version(db, version_id)
+
+
+def _publish_version(db: Session, version_id: int) -> Dict[str, int]:
+    tables = catalog_tables()
+    q = lambda name: _quote(db, name)
+    next_tables = [name + NEXT_SUFFIX for name in tables]
+
+    # 1. 섀도 테이블 준비 (DDL은 MySQL에서 암묵적으로 커밋됨)
+    id_floors = _id_floors(db, tables)
+    _drop_tables(db, next_tables)
+    for name in tables:
+        db.execute(text(f"CREATE TABLE {q(name + NEXT_SUFFIX)} LIKE {q(name)}"))
+
+    # 2. 섀도 테이블 채우기 (한 트랜잭션) + 외부 참조 연결 가능 여부 확인
+    try:
+        counts, _ = migrate_version_rows(
+            db, version_id, suffix=NEXT_SUFFIX, conditions=PUBLISH_CONDITIONS, id_floors=id_floors
+        )
+        db.commit()
+        foreign_keys = _check_references(db, tables, NEXT_SUFFIX)
+    except Exception:
+        db.rollback()
+        _drop_tables(db, next_tables)
+        raise
+
+    # 3. 이전 세대 정리 후 원자적 교체
+    _drop_tables(db, [name + PREV_SUFFIX for name in tables])
+    renames = []
+    for name in tables:
+        renames.append(f"{q(name)} TO {q(name + PREV_SUFFIX)}")
+        renames.append(f"{q(name + NEXT_SUFFIX)} TO {q(name)}")
+    _swap_tables(db, tables, renames, foreign_keys, NEXT_SUFFIX)
+    print(f"[DEBUG] 메인 카탈로그 교체 완료 - version_id={version_id}, counts={counts}")
+    return counts
+
+
+def rollback_main_catalog(db: Session) -> Dict[str, int]:
+    """
+    이전 세대(__prev)와 현재 카탈로그를 원자적으로 맞바꿈 (다시 호출하면 되돌린 게시로 복귀)
+
+    반환: 복원된 메인 테이블별 행 수
+    예외: LookupError - 이전 세대 없음, ValueError - 이전 세대로 옮길 수 없는 참조 행이 있음,
+          TimeoutError - 다른 게시/되돌리기 작업 진행 중
+    """
+    with _publish_lock(db):
+        return _rollback_main_catalog(db)
+
+
+def _rollback_main_catalog(db: Session) -> Dict[str, int]:
+    tables = catalog_tables()
+    q = lambda name: _quote(db, name)
+
+    missing = set(name + PREV_SUFFIX for name in tables) - _existing_tables(db, [name + PREV_SUFFIX for name in tables])
+    if missing:
+        raise LookupError(f"되돌릴 이전 카탈로그가 없습니다: {', '.join(sorted(missing))}")
+
+    foreign_keys = _check_references(db, tables, PREV_SUFFIX)
+    renames = []
+    for name in tables:
+        renames.append(f"{q(name)} TO {q(name + SWAP_SUFFIX)}")
+        renames.append(f"{q(name + PREV_SUFFIX)} TO {q(name)}")
+        renames.append(f"{q(name + SWAP_SUFFIX)} TO {q(name + PREV_SUFFIX)}")
+    _swap_tables(db, tables, renames, foreign_keys, PREV_SUFFIX)
+    return {
+        name: db.execute(text(f"SELECT COUNT(*) FROM {q(name)}")).scalar()
+        for name in tables
+    }
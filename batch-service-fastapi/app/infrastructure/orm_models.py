@@ -485,6 +485,22 @@ class BatchJobORM(Base):
     error_message = Column(Text, nullable=True)
     result_data = Column(JSON, nullable=True)
 
+
+# ===== CDC Outbox =====
+
+class CatalogChangeOutboxORM(Base):
+    """스테이징 카탈로그 변경 outbox - 스테이징 쓰기와 같은 트랜잭션에서 기록, CDC 태스크가 배치로 소비 후 삭제"""
+    __tablename__ = "catalog_change_outbox"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    entity_type = Column(String(20), nullable=False)  # brand / vehicle_line / model / trim / option
+    entity_id = Column(Integer, nullable=False)       # 스테이징 ID
+    operation = Column(String(10), nullable=False)    # upsert / delete
+    payload = Column(JSON, nullable=True)             # 삭제 시 메인 행을 찾기 위한 자연 키 + version_id
+    created_at = Column(DateTime, nullable=False, default=lambda: datetime.utcnow())
+    failed_at = Column(DateTime, nullable=True)       # 반영 실패 시각 - 설정되면 소비 대상에서 제외
+    error = Column(Text, nullable=True)               # 반영 실패 사유
+
 # ===== Staging 할인 정책 관리 =====
 
 class StagingDiscountPolicyORM(Base):
@@ -708,4 +724,8 @@ class BrandPrePurchaseORM(Base):
     updated_at = Column(DateTime, nullable=True, onupdate=datetime.utcnow)
     
     # 관계
-    policy = relationship("DiscountPolicyORM", back_populates="pre_purchases")
\ No newline at end of file
+    policy = relationship("DiscountPolicyORM", back_populates="pre_purchases")
+
+
+# 스테이징 카탈로그 쓰기 → 변경 outbox 기록 리스너 등록
+from . import change_outbox  # noqa: E402,F401
@@ -0,0 +1,132 @@
+"""
+DB 연결 풀 텔레메트리
+- checkout 대기 시간 / checked-out / overflow 히스토그램
+- connect / invalidate / timeout 카운트
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import List
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (스레드 안전)"""
+
+    def __init__(self, buckets: List[float]):
+        self.buckets = sorted(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            labels = [f"le_{b:g}" for b in self.buckets] + ["le_inf"]
+            return {
+                "buckets": dict(zip(labels, self.counts)),
+                "count": self.total,
+                "sum": round(self.sum, 3),
+                "avg": round(self.sum / self.total, 3) if self.total else 0.0,
+                "max": round(self.max, 3),
+            }
+
+
+class PoolMetrics:
+    """연결 풀 지표 모음"""
+
+    def __init__(self):
+        self.wait_ms = Histogram([1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 30000])
+        self.checked_out = Histogram([1, 2, 5, 10, 20, 30, 50, 100])
+        self.overflow = Histogram([0, 1, 2, 5, 10, 20, 30])
+        self.counters = {
+            "connect": 0,
+            "checkout": 0,
+            "checkin": 0,
+            "invalidate": 0,
+            "soft_invalidate": 0,
+            "timeout": 0,
+        }
+        self._lock = threading.Lock()
+
+    def incr(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """checkout 대기 시간을 측정하는 QueuePool"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            # 풀 대기 시간 초과만 timeout으로 집계 (연결 실패 등 다른 오류는 그대로 전파)
+            pool_metrics.incr("timeout")
+            raise
+        finally:
+            pool_metrics.wait_ms.observe((time.perf_counter() - started) * 1000)
+
+
+def instrument_engine(engine):
+    """엔진 풀 이벤트에 텔레메트리 리스너 등록"""
+    pool = engine.pool
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        pool_metrics.incr("connect")
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        pool_metrics.incr("checkout")
+        pool_metrics.checked_out.observe(pool.checkedout())
+        pool_metrics.overflow.observe(max(pool.overflow(), 0))
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        pool_metrics.incr("checkin")
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        pool_metrics.incr("invalidate")
+
+    @event.listens_for(pool, "soft_invalidate")
+    def _on_soft_invalidate(dbapi_connection, connection_record, exception):
+        pool_metrics.incr("soft_invalidate")
+
+
+def get_pool_snapshot(engine, profile: dict) -> dict:
+    """현재 풀 상태 + 누적 지표"""
+    pool = engine.pool
+    with pool_metrics._lock:
+        counters = dict(pool_metrics.counters)
+    return {
+        "profile": profile,
+        "current": {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        },
+        "counters": counters,
+        "checkout_wait_ms": pool_metrics.wait_ms.snapshot(),
+        "checked_out": pool_metrics.checked_out.snapshot(),
+        "overflow": pool_metrics.overflow.snapshot(),
+    }
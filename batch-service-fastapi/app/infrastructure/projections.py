@@ -0,0 +1,62 @@
+"""
+Projection 레이어 - 필요한 컬럼만 SELECT 하여 Row 매핑을 바로 응답 dict로 직렬화
+
+ORM 객체 하이드레이션 → 엔티티 변환 → dict 수동 구성의 3중 복사 대신
+컬럼 튜플을 한 번만 변환한다. 목록/트리 응답에 사용.
+"""
+from datetime import date, datetime
+from enum import Enum
+from typing import Iterable, List, Sequence
+
+from .orm_models import (
+    StagingBrandORM, StagingVehicleLineORM, StagingModelORM,
+    StagingTrimORM, StagingOptionORM
+)
+
+# 감사(audit) 컬럼 - 목록 응답 공통
+AUDIT_FIELDS = ("created_by", "created_by_username", "created_by_email", "created_at", "updated_at")
+
+# 엔티티별 목록 응답 필드
+BRAND_FIELDS = ("id", "name", "country", "logo_url", "manager", "version_id")
+VEHICLE_LINE_FIELDS = ("id", "name", "description", "brand_id")
+MODEL_FIELDS = ("id", "name", "code", "price", "foreign", "vehicle_line_id")
+TRIM_FIELDS = ("id", "name", "car_type", "fuel_name", "cc", "base_price", "model_id")
+OPTION_FIELDS = ("id", "name", "code", "description", "category", "price", "discounted_price", "trim_id")
+
+STAGING_LIST_FIELDS = {
+    StagingBrandORM: BRAND_FIELDS + AUDIT_FIELDS,
+    StagingVehicleLineORM: VEHICLE_LINE_FIELDS + AUDIT_FIELDS,
+    StagingModelORM: MODEL_FIELDS + AUDIT_FIELDS,
+    StagingTrimORM: TRIM_FIELDS + AUDIT_FIELDS,
+    StagingOptionORM: OPTION_FIELDS + AUDIT_FIELDS,
+}
+
+
+def columns(orm_class, fields: Sequence[str]) -> list:
+    """ORM 클래스에서 필드명 순서대로 컬럼 목록 반환"""
+    return [getattr(orm_class, name) for name in fields]
+
+
+def list_columns(orm_class) -> list:
+    """Staging 목록 응답용 컬럼 목록"""
+    return columns(orm_class, STAGING_LIST_FIELDS[orm_class])
+
+
+def serialize_value(value):
+    """JSON 응답용 값 변환 (datetime → ISO 문자열, Enum → value)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def to_dict(row) -> dict:
+    """Row(또는 RowMapping)를 응답 dict로 변환"""
+    mapping = row._mapping if hasattr(row, "_mapping") else row
+    return {key: serialize_value(value) for key, value in mapping.items()}
+
+
+def to_dicts(rows: Iterable) -> List[dict]:
+    """Row 목록을 응답 dict 목록으로 변환"""
+    return [to_dict(row) for row in rows]
@@ -0,0 +1,194 @@
+"""
+Search Cache - 검색 응답 캐시 (프로세스 내 LRU + TTL, 선택적 Redis 2차 캐시)
+
+- 키: (엔드포인트, 버전 또는 메인 카탈로그, revision, 정규화된 검색어, limit)
+  쓰기 경로에서 revision이 증가하면 이전 응답은 더 이상 조회되지 않는다.
+- revision을 알 수 없으면(Redis 장애) 캐시를 건너뛰고 DB에서 직접 조회한다 (fail-open).
+- 적중/실패 카운터는 /api/metrics/search-cache 로 조회한다.
+"""
+import functools
+import hashlib
+import json
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ..config import settings
+from .version_cache import get_redis, get_revision, get_main_revision, _mark_redis_down
+
+KEY_PREFIX = "scache"
+MAIN_SCOPE = "main"
+
+
+def _default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+class SearchCache:
+    """프로세스 내 LRU + TTL 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.counters = {
+            "hit_local": 0,
+            "hit_redis": 0,
+            "miss": 0,
+            "store": 0,
+            "evict": 0,
+            "expire": 0,
+            "bypass": 0,
+        }
+
+    def incr(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.counters["expire"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            self.counters["store"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.counters["evict"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counters = dict(self.counters)
+            size = len(self._entries)
+        hits = counters["hit_local"] + counters["hit_redis"]
+        lookups = hits + counters["miss"]
+        return {
+            "enabled": settings.search_cache_enabled,
+            "redis_tier": settings.search_cache_redis,
+            "entries": size,
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "counters": counters,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+search_cache = SearchCache(settings.search_cache_max_entries, settings.search_cache_ttl)
+
+
+def _redis_key(kind: str, scope, revision: int, query_key: str) -> str:
+    digest = hashlib.sha1(query_key.encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}:{scope}:{revision}:{kind}:{digest}"
+
+
+def _redis_get(key: str):
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        payload = client.get(key)
+        return None if payload is None else json.loads(zlib.decompress(payload))
+    except Exception as e:
+        _mark_redis_down(e)
+        return None
+
+
+def _redis_set(key: str, value: Any):
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        payload = zlib.compress(json.dumps(value, ensure_ascii=False, default=_default).encode("utf-8"))
+        client.set(key, payload, ex=int(search_cache.ttl))
+    except Exception as e:
+        _mark_redis_down(e)
+
+
+def cached_search(kind: str, version_id: Optional[int], query_key: str, builder: Callable[[], Any]) -> Any:
+    """
+    (kind, 버전/메인, revision, query_key) 검색 응답을 조회하고 없으면 builder()로 생성 후 저장
+
+    version_id가 None이면 메인 카탈로그 revision을 사용한다.
+    """
+    if not settings.search_cache_enabled:
+        return builder()
+    revision = get_main_revision() if version_id is None else get_revision(version_id)
+    if revision is None:
+        search_cache.incr("bypass")
+        return builder()
+
+    scope = MAIN_SCOPE if version_id is None else version_id
+    key = (kind, scope, revision, query_key)
+    found, value = search_cache.get(key)
+    if found:
+        search_cache.incr("hit_local")
+        return value
+
+    redis_key = _redis_key(kind, scope, revision, query_key) if settings.search_cache_redis else None
+    if redis_key is not None:
+        value = _redis_get(redis_key)
+        if value is not None:
+            search_cache.incr("hit_redis")
+            search_cache.put(key, value)
+            return value
+
+    search_cache.incr("miss")
+    value = builder()
+    # 조회 중 쓰기가 있었으면 저장하지 않음 (revision 재확인)
+    current = get_main_revision() if version_id is None else get_revision(version_id)
+    if current == revision:
+        search_cache.put(key, value)
+        if redis_key is not None:
+            _redis_set(redis_key, value)
+    return value
+
+
+def search_cached(
+    kind: str,
+    key: Callable[[Dict[str, Any]], str],
+    echo: Optional[Callable[[Dict[str, Any]], dict]] = None
+):
+    """
+    검색 응답 캐시 데코레이터
+
+    key: 엔드포인트 kwargs → 정규화된 검색 키 (limit 등 결과에 영향을 주는 파라미터 포함)
+    echo: 요청 원문을 그대로 돌려주는 응답 필드 (같은 키의 다른 표기 요청에 캐시 응답을 줄 때 덮어씀)
+    version_id 경로 파라미터가 없으면 메인 카탈로그 검색으로 본다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            result = cached_search(
+                kind, kwargs.get("version_id"), key(kwargs),
+                lambda: func(*args, **kwargs)
+            )
+            if echo is not None and isinstance(result, dict):
+                result = {**result, **echo(kwargs)}
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,446 @@
+"""
+Search Index - 버전별 인메모리 역색인 (한글 음절 bigram)
+
+- 브랜드/자동차 라인/모델/트림/옵션 이름을 정규화(소문자, 공백 제거)한 뒤 음절 단위
+  unigram + bigram으로 색인한다. 검색어의 bigram 교집합으로 후보를 좁히고 부분 문자열로 확인한다.
+- 첫 검색 시 레벨당 1쿼리로 구축하고, 이후에는 ORM 세션 커밋 시점의 변경분을 반영한다.
+- 다른 프로세스/벌크 쓰기는 버전 revision(version_cache)으로 감지하여 다시 구축한다.
+- 브랜드~트림 이름은 자동완성용 접두사 트라이(typeahead, 초성 포함)에도 함께 넣는다.
+- 트림 기본가격 / 옵션 가격은 (가격, id) 정렬 배열로 두고 가격 범위를 이분 탐색으로 조회한다.
+"""
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, literal
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from .orm_models import StagingBrandORM
+from .tree_loader import LEVELS, PARENT_KEYS, STAGING_TREE
+from .typeahead import TYPEAHEAD_LEVELS, Typeahead
+from .version_cache import get_revision, add_revision_listener
+
+# 레벨별 기본 점수 (기존 검색 API의 match_score와 동일한 기준)
+LEVEL_SCORES = {
+    "brand": 100,
+    "vehicle_line": 90,
+    "model": 80,
+    "trim": 70,
+    "option": 60,
+}
+
+# 가격 정렬 배열을 유지하는 레벨 → 가격 컬럼
+PRICE_COLUMNS = {
+    "trim": "base_price",
+    "option": "price",
+}
+
+_LEVEL_BY_CLASS = {orm_class: level for level, orm_class in STAGING_TREE.items()}
+_PARENT_LEVEL = {LEVELS[index]: LEVELS[index - 1] for index in range(1, len(LEVELS))}
+
+
+def normalize(text: Optional[str]) -> str:
+    """검색용 정규화 - 소문자 변환 + 공백 제거"""
+    return "".join((text or "").lower().split())
+
+
+def tokenize(text: str) -> Set[str]:
+    """정규화된 문자열의 음절 unigram + bigram"""
+    tokens = set(text)
+    tokens.update(text[index:index + 2] for index in range(len(text) - 1))
+    return tokens
+
+
+@dataclass(slots=True)
+class IndexedDoc:
+    level: str
+    id: int
+    name: str
+    norm: str
+    parent_id: Optional[int]
+    price: Optional[int] = None
+
+
+class VersionSearchIndex:
+    """한 버전의 역색인 (doc 키: (level, id))"""
+
+    def __init__(self, version_id: int, revision: Optional[int]):
+        self.version_id = version_id
+        self.revision = revision
+        self.built_at = time.monotonic()
+        self.pending_local = False  # 커밋 반영 후 아직 revision 증가를 받지 못한 상태
+        self.docs: Dict[Tuple[str, int], IndexedDoc] = {}
+        self.postings: Dict[str, Set[Tuple[str, int]]] = {}
+        self.children: Dict[Tuple[str, int], Set[Tuple[str, int]]] = {}
+        self.typeahead = Typeahead()
+        self.prices: Dict[str, List[Tuple[int, int]]] = {level: [] for level in PRICE_COLUMNS}  # (가격, id) 정렬 배열
+        self.lock = threading.RLock()
+
+    # ----- 구축 / 변경 -----
+
+    @classmethod
+    def build(cls, db: Session, version_id: int, revision: Optional[int]) -> "VersionSearchIndex":
+        index = cls(version_id, revision)
+        for level in LEVELS:
+            orm_class = STAGING_TREE[level]
+            parent_column = getattr(orm_class, PARENT_KEYS[level]) if level in PARENT_KEYS else orm_class.version_id
+            price_column = getattr(orm_class, PRICE_COLUMNS[level]) if level in PRICE_COLUMNS else literal(None)
+            query = db.query(orm_class.id, orm_class.name, parent_column, price_column)
+            current = orm_class
+            for child_index in range(LEVELS.index(level), 0, -1):
+                parent = STAGING_TREE[LEVELS[child_index - 1]]
+                query = query.join(parent, getattr(current, PARENT_KEYS[LEVELS[child_index]]) == parent.id)
+                current = parent
+            rows = query.filter(StagingBrandORM.version_id == version_id)
+            if level in PRICE_COLUMNS:
+                rows = rows.order_by(price_column, orm_class.id)
+            for entity_id, name, parent_id, price in rows:
+                index._add(level, entity_id, name, None if level == "brand" else parent_id, price)
+        return index
+
+    def _add(self, level: str, entity_id: int, name: str, parent_id: Optional[int], price: Optional[int] = None):
+        key = (level, entity_id)
+        norm = normalize(name)
+        self.docs[key] = IndexedDoc(level, entity_id, name, norm, parent_id, price)
+        if price is not None and level in self.prices:
+            # 구축 시에는 가격 순으로 들어오므로 끝에 추가 (insort 비용 없음)
+            prices = self.prices[level]
+            if not prices or prices[-1] <= (price, entity_id):
+                prices.append((price, entity_id))
+            else:
+                insort(prices, (price, entity_id))
+        for token in tokenize(norm):
+            self.postings.setdefault(token, set()).add(key)
+        if level in _PARENT_LEVEL:
+            self.children.setdefault((_PARENT_LEVEL[level], parent_id), set()).add(key)
+        if level in TYPEAHEAD_LEVELS:
+            self.typeahead.add(norm, key)
+
+    def _remove(self, level: str, entity_id: int):
+        key = (level, entity_id)
+        doc = self.docs.pop(key, None)
+        if doc is None:
+            return
+        for token in tokenize(doc.norm):
+            keys = self.postings.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.postings[token]
+        if level in TYPEAHEAD_LEVELS:
+            self.typeahead.remove(doc.norm, key)
+        if doc.price is not None and level in self.prices:
+            prices = self.prices[level]
+            position = bisect_left(prices, (doc.price, entity_id))
+            if position < len(prices) and prices[position] == (doc.price, entity_id):
+                del prices[position]
+        if level in _PARENT_LEVEL:
+            siblings = self.children.get((_PARENT_LEVEL[level], doc.parent_id))
+            if siblings is not None:
+                siblings.discard(key)
+
+    def upsert(self, level: str, entity_id: int, name: str, parent_id: Optional[int], price: Optional[int] = None):
+        with self.lock:
+            self._remove(level, entity_id)
+            self._add(level, entity_id, name, parent_id, price)
+
+    def remove(self, level: str, entity_id: int):
+        with self.lock:
+            self._remove(level, entity_id)
+
+    def contains(self, level: str, entity_id: Optional[int]) -> bool:
+        return (level, entity_id) in self.docs
+
+    # ----- 조회 -----
+
+    def lookup(self, term: str, levels: Iterable[str] = LEVELS) -> List[IndexedDoc]:
+        """이름에 term이 포함된 문서 목록 (점수 → 일치 정도 → 이름 길이 순)"""
+        norm = normalize(term)
+        levels = set(levels)
+        with self.lock:
+            if not norm:
+                candidates = list(self.docs.keys())
+            else:
+                tokens = tokenize(norm) if len(norm) < 2 else {norm[i:i + 2] for i in range(len(norm) - 1)}
+                posting_lists = sorted((self.postings.get(token, set()) for token in tokens), key=len)
+                if not posting_lists or not posting_lists[0]:
+                    return []
+                candidates = set(posting_lists[0])
+                for keys in posting_lists[1:]:
+                    candidates &= keys
+                    if not candidates:
+                        return []
+            docs = [
+                self.docs[key] for key in candidates
+                if key[0] in levels and norm in self.docs[key].norm and self._is_attached(self.docs[key])
+            ]
+        docs.sort(key=lambda doc: (
+            -LEVEL_SCORES[doc.level],
+            0 if doc.norm == norm else 1 if doc.norm.startswith(norm) else 2,
+            len(doc.norm),
+            doc.id,
+        ))
+        return docs
+
+    def search(self, level: str, terms: Dict[str, Any], limit: int) -> List[IndexedDoc]:
+        """
+        level 문서 중 레벨별 조건(terms: {레벨: 검색어 또는 검색어 목록})을 모두 만족하는 항목
+
+        level 자체 검색어가 없으면 가장 가까운 상위 조건의 일치 항목에서 하위로 내려가며 찾는다.
+        """
+        depth = LEVELS.index(level)
+        conditions = {}
+        for name, values in terms.items():
+            values = [values] if isinstance(values, str) or values is None else values
+            values = [normalize(value) for value in values if value and normalize(value)]
+            if values and LEVELS.index(name) <= depth:
+                # 가장 긴 검색어로 후보를 찾고 나머지는 포함 여부로 거른다
+                conditions[name] = sorted(values, key=len, reverse=True)
+        if level in conditions or not conditions:
+            docs = self.lookup(conditions[level][0] if level in conditions else "", [level])
+        else:
+            anchor_level = max(conditions, key=LEVELS.index)
+            with self.lock:
+                frontier = [(doc.level, doc.id) for doc in self.lookup(conditions[anchor_level][0], [anchor_level])]
+                for _ in range(depth - LEVELS.index(anchor_level)):
+                    frontier = [child for key in frontier for child in sorted(self.children.get(key, ()))]
+                docs = [self.docs[key] for key in frontier if key in self.docs]
+        results = []
+        for doc in docs:
+            if all(
+                (parent := self.ancestor(doc, name)) is not None
+                and all(value in parent.norm for value in values)
+                for name, values in conditions.items()
+            ):
+                results.append(doc)
+                if len(results) >= limit:
+                    break
+        return results
+
+    def suggest(self, query: str, limit: int, levels: Iterable[str] = TYPEAHEAD_LEVELS) -> List[Tuple[IndexedDoc, int]]:
+        """
+        자동완성 후보 - 이름별 (대표 문서, 같은 이름 문서 수) 목록
+
+        같은 레벨의 같은 이름(예: 여러 모델의 "모던" 트림)은 하나로 묶고,
+        짧은 이름 → 레벨 점수 순으로 정렬한다.
+        """
+        levels = set(levels)
+        with self.lock:
+            groups = self.typeahead.complete(normalize(query), limit * 4)
+            suggestions = []
+            for keys in groups:
+                by_level: Dict[str, List[IndexedDoc]] = {}
+                for key in keys:
+                    doc = self.docs.get(key)
+                    if doc is not None and doc.level in levels and self._is_attached(doc):
+                        by_level.setdefault(doc.level, []).append(doc)
+                for docs in by_level.values():
+                    suggestions.append((min(docs, key=lambda doc: doc.id), len(docs)))
+        suggestions.sort(key=lambda item: (len(item[0].norm), -LEVEL_SCORES[item[0].level], item[0].id))
+        return suggestions[:limit]
+
+    def price_range(
+        self,
+        level: str,
+        min_price: Optional[int],
+        max_price: Optional[int],
+        limit: int,
+        descending: bool = False,
+        after: Optional[Tuple[int, int]] = None
+    ) -> Tuple[List[IndexedDoc], int]:
+        """
+        min_price 이상 max_price 이하 가격의 level 문서 (가격 → id 순, 이분 탐색)
+
+        after: 이전 페이지 마지막 항목의 (가격, id) - 이 항목 다음부터 조회
+        반환: (문서 목록, 범위 전체 개수)
+        """
+        with self.lock:
+            prices = self.prices[level]
+            low = 0 if min_price is None else bisect_left(prices, (min_price,))
+            high = len(prices) if max_price is None else bisect_right(prices, (max_price, float("inf")))
+            total = max(high - low, 0)
+            if after is not None:
+                if descending:
+                    high = min(high, bisect_left(prices, after))
+                else:
+                    low = max(low, bisect_right(prices, after))
+            positions = range(high - 1, low - 1, -1) if descending else range(low, high)
+            docs = []
+            for position in positions:
+                doc = self.docs.get((level, prices[position][1]))
+                if doc is not None and self._is_attached(doc):
+                    docs.append(doc)
+                    if len(docs) >= limit:
+                        break
+        return docs, total
+
+    def _is_attached(self, doc: IndexedDoc) -> bool:
+        """상위 항목이 모두 색인에 있는지 (삭제된 부모 아래 남은 문서 제외)"""
+        while doc.level != "brand":
+            doc = self.docs.get((_PARENT_LEVEL[doc.level], doc.parent_id))
+            if doc is None:
+                return False
+        return True
+
+    def ancestor(self, doc: IndexedDoc, level: str) -> Optional[IndexedDoc]:
+        """doc의 상위 레벨 문서 (doc 자신이 해당 레벨이면 자신)"""
+        while doc is not None and doc.level != level:
+            if doc.level == "brand":
+                return None
+            doc = self.docs.get((_PARENT_LEVEL[doc.level], doc.parent_id))
+        return doc
+
+    def breadcrumb(self, doc: IndexedDoc) -> dict:
+        """검색 결과 항목 (기존 API 응답 형식: brand_id, brand_name, vehicle_line_id, ...)"""
+        item = {
+            "id": doc.id,
+            "name": doc.name,
+            "type": doc.level,
+            "match_score": LEVEL_SCORES[doc.level],
+        }
+        for level in LEVELS[:LEVELS.index(doc.level)]:
+            parent = self.ancestor(doc, level)
+            if parent is not None:
+                item[f"{level}_id"] = parent.id
+                item[f"{level}_name"] = parent.name
+        if doc.level == "brand":
+            item["brand_id"] = doc.id
+            item["brand_name"] = doc.name
+        return item
+
+
+# ===== 프로세스 내 색인 레지스트리 =====
+
+_indexes: "OrderedDict[int, VersionSearchIndex]" = OrderedDict()
+_registry_lock = threading.Lock()
+
+
+def get_index(db: Session, version_id: int) -> VersionSearchIndex:
+    """버전 색인 반환 (없거나 revision이 바뀌었으면 새로 구축)"""
+    revision = get_revision(version_id)
+    with _registry_lock:
+        index = _indexes.get(version_id)
+        if index is not None:
+            if revision is not None and index.revision == revision:
+                _indexes.move_to_end(version_id)
+                return index
+            if revision is None and time.monotonic() - index.built_at < settings.search_index_max_age:
+                _indexes.move_to_end(version_id)
+                return index
+
+    started = time.perf_counter()
+    index = VersionSearchIndex.build(db, version_id, revision)
+    print(f"[SEARCH] 버전 {version_id} 색인 구축: 문서 {len(index.docs)}개, "
+          f"토큰 {len(index.postings)}개, {(time.perf_counter() - started) * 1000:.1f}ms")
+
+    with _registry_lock:
+        _indexes[version_id] = index
+        _indexes.move_to_end(version_id)
+        while len(_indexes) > settings.search_index_max_versions:
+            _indexes.popitem(last=False)
+    return index
+
+
+def drop_index(version_id: Optional[int] = None):
+    """색인 폐기 (version_id가 없으면 전체)"""
+    with _registry_lock:
+        if version_id is None:
+            _indexes.clear()
+        else:
+            _indexes.pop(version_id, None)
+
+
+def _on_revision_bumped(version_id: int, revision: Optional[int]):
+    """
+    revision 증가 알림 처리
+
+    이 프로세스의 커밋 변경분을 이미 반영했고 revision이 1만 증가했다면 색인을 유지하고,
+    그 밖의 경우(벌크 쓰기, 다른 프로세스의 쓰기 포함)에는 폐기하여 다음 검색 때 다시 구축한다.
+    """
+    with _registry_lock:
+        index = _indexes.get(version_id)
+        if index is None:
+            return
+        if index.pending_local and (
+            revision is None or (index.revision is not None and revision == index.revision + 1)
+        ):
+            index.revision = revision
+            index.pending_local = False
+            return
+        _indexes.pop(version_id, None)
+
+
+add_revision_listener(_on_revision_bumped)
+
+
+# ===== ORM 세션 변경 추적 =====
+
+def _find_index(level: str, entity_id: Optional[int], parent_id: Optional[int], version_id: Optional[int]):
+    """변경된 엔티티가 속한 (로드된) 색인 찾기"""
+    with _registry_lock:
+        indexes = list(_indexes.values())
+    for index in indexes:
+        if level == "brand" and version_id is not None:
+            if index.version_id == version_id:
+                return index
+        elif index.contains(level, entity_id) or (
+            level in _PARENT_LEVEL and index.contains(_PARENT_LEVEL[level], parent_id)
+        ):
+            return index
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context):
+    if not _indexes:
+        return
+    changes = session.info.setdefault("search_index_changes", [])
+    for obj in list(session.new) + list(session.dirty):
+        level = _LEVEL_BY_CLASS.get(type(obj))
+        if level is not None:
+            parent_id = getattr(obj, PARENT_KEYS[level]) if level in PARENT_KEYS else None
+            price = getattr(obj, PRICE_COLUMNS[level]) if level in PRICE_COLUMNS else None
+            changes.append(("upsert", level, obj.id, obj.name, parent_id, getattr(obj, "version_id", None), price))
+    for obj in session.deleted:
+        level = _LEVEL_BY_CLASS.get(type(obj))
+        if level is not None:
+            parent_id = getattr(obj, PARENT_KEYS[level]) if level in PARENT_KEYS else None
+            changes.append(("remove", level, obj.id, None, parent_id, getattr(obj, "version_id", None), None))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_writes(orm_execute_state):
+    """query.update()/delete() 등 벌크 쓰기는 변경분을 알 수 없으므로 표시만 해 둔다"""
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        orm_execute_state.session.info["search_index_bulk"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_changes(session: Session):
+    changes = session.info.pop("search_index_changes", None)
+    bulk = session.info.pop("search_index_bulk", False)
+    if not changes:
+        return
+    for op, level, entity_id, name, parent_id, version_id, price in changes:
+        index = _find_index(level, entity_id, parent_id, version_id)
+        if index is None:
+            continue
+        if bulk:
+            # 벌크 쓰기와 섞인 커밋은 부분 반영 대신 재구축
+            drop_index(index.version_id)
+            continue
+        if op == "upsert":
+            index.upsert(level, entity_id, name, parent_id, price)
+        else:
+            index.remove(level, entity_id)
+        index.pending_local = True
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session):
+    session.info.pop("search_index_changes", None)
+    session.info.pop("search_index_bulk", None)
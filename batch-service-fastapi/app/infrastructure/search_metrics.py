@@ -0,0 +1,228 @@
+"""
+검색 텔레메트리
+- 엔드포인트별 전체 / DB / 직렬화 시간 히스토그램, 요청당 쿼리 수
+- 느린 검색 기록 (파싱된 검색어 포함, 최근 N건)
+- 결과 0건 검색어 카운트
+"""
+import contextvars
+import functools
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..config import settings
+from .pool_metrics import Histogram
+
+LATENCY_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+QUERY_COUNT_BUCKETS = [0, 1, 2, 3, 5, 10, 20, 50, 100]
+
+# 결과 수를 셀 응답 필드 (앞에서부터 처음 찾은 목록)
+RESULT_KEYS = ("results", "suggestions", "items", "trims", "brands", "models")
+
+# 검색 조건으로 기록하지 않는 파라미터
+IGNORED_PARAMS = ("db", "request", "current_user")
+
+# 결과 0건 검색어 최대 보관 수
+MAX_ZERO_RESULT_QUERIES = 500
+
+
+class SearchTrace:
+    """요청 하나의 측정값 (DB 시간은 엔진 이벤트에서, 직렬화 시간은 serialization.negotiated에서 기록)"""
+
+    __slots__ = ("db_ms", "db_queries", "serialize_ms", "payload", "_query_started")
+
+    def __init__(self):
+        self.db_ms = 0.0
+        self.db_queries = 0
+        self.serialize_ms = 0.0
+        self.payload = None
+        self._query_started = None
+
+
+_current_trace: contextvars.ContextVar[Optional[SearchTrace]] = contextvars.ContextVar("search_trace", default=None)
+
+
+def current_trace() -> Optional[SearchTrace]:
+    return _current_trace.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    trace = _current_trace.get()
+    if trace is not None:
+        trace._query_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    trace = _current_trace.get()
+    if trace is not None and trace._query_started is not None:
+        trace.db_ms += (time.perf_counter() - trace._query_started) * 1000
+        trace.db_queries += 1
+        trace._query_started = None
+
+
+class EndpointMetrics:
+    """엔드포인트 하나의 지표"""
+
+    def __init__(self):
+        self.total_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.db_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.serialize_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.db_queries = Histogram(QUERY_COUNT_BUCKETS)
+        self.counters = {"requests": 0, "errors": 0, "client_errors": 0, "zero_results": 0, "slow": 0}
+
+    def snapshot(self) -> dict:
+        return {
+            "counters": dict(self.counters),
+            "total_ms": self.total_ms.snapshot(),
+            "db_ms": self.db_ms.snapshot(),
+            "serialize_ms": self.serialize_ms.snapshot(),
+            "db_queries": self.db_queries.snapshot(),
+        }
+
+
+class SearchMetrics:
+    """검색 지표 모음"""
+
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+        self.slow_searches = deque(maxlen=settings.search_slow_capture_size)
+        self.zero_result_queries: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def endpoint(self, name: str) -> EndpointMetrics:
+        with self._lock:
+            metrics = self.endpoints.get(name)
+            if metrics is None:
+                metrics = self.endpoints[name] = EndpointMetrics()
+            return metrics
+
+    def incr(self, name: str, counter: str):
+        metrics = self.endpoint(name)
+        with self._lock:
+            metrics.counters[counter] += 1
+
+    def record_zero_result(self, name: str, query_key: str):
+        with self._lock:
+            key = (name, query_key)
+            self.zero_result_queries[key] = self.zero_result_queries.get(key, 0) + 1
+            if len(self.zero_result_queries) > MAX_ZERO_RESULT_QUERIES:
+                # 가장 적게 나온 검색어부터 정리
+                del self.zero_result_queries[min(self.zero_result_queries, key=self.zero_result_queries.get)]
+
+    def record_slow(self, entry: dict):
+        with self._lock:
+            self.slow_searches.append(entry)
+
+    def snapshot(self, top: int = 20) -> dict:
+        with self._lock:
+            endpoints = dict(self.endpoints)
+            slow = list(self.slow_searches)
+            zero = sorted(self.zero_result_queries.items(), key=lambda item: -item[1])[:top]
+        return {
+            "slow_threshold_ms": settings.search_slow_ms,
+            "endpoints": {name: metrics.snapshot() for name, metrics in sorted(endpoints.items())},
+            "slow_searches": slow[::-1],
+            "zero_result_queries": [
+                {"endpoint": name, "query": query_key, "count": count} for (name, query_key), count in zero
+            ],
+        }
+
+
+search_metrics = SearchMetrics()
+
+
+def _describe(kwargs: Dict[str, Any]) -> dict:
+    """검색 조건 (요청 파라미터 + 파싱된 검색어)"""
+    params = {
+        name: value for name, value in kwargs.items()
+        if name not in IGNORED_PARAMS and value is not None
+    }
+    if isinstance(kwargs.get("query"), str):
+        from .search_query import parse_search_query
+        parsed = parse_search_query(kwargs["query"])
+        params["parsed"] = {"filters": parsed.filters, "terms": parsed.terms}
+    return params
+
+
+def _query_key(kwargs: Dict[str, Any]) -> str:
+    """결과 0건 집계용 검색어 키 (페이지 파라미터 제외)"""
+    if isinstance(kwargs.get("query"), str):
+        from .search_query import parse_search_query
+        return parse_search_query(kwargs["query"]).cache_key
+    return "&".join(
+        f"{name}={value}" for name, value in sorted(kwargs.items())
+        if name not in IGNORED_PARAMS + ("version_id", "limit", "cursor", "sort") and value is not None
+    )
+
+
+def _result_count(payload) -> Optional[int]:
+    if isinstance(payload, list):
+        return len(payload)
+    if isinstance(payload, dict):
+        for key in RESULT_KEYS:
+            if isinstance(payload.get(key), list):
+                return len(payload[key])
+    return None
+
+
+def search_telemetry(name: str):
+    """
+    검색 엔드포인트 계측 데코레이터 (@router 바로 아래, @negotiated 위에 둔다)
+
+    전체 시간, DB 시간/쿼리 수, 직렬화 시간을 기록하고
+    느린 검색(search_slow_ms 이상)과 결과 0건 검색어를 남긴다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = SearchTrace()
+            token = _current_trace.set(trace)
+            started = time.perf_counter()
+            metrics = search_metrics.endpoint(name)
+            try:
+                response = func(*args, **kwargs)
+            except HTTPException as e:
+                search_metrics.incr(name, "errors" if e.status_code >= 500 else "client_errors")
+                raise
+            except Exception:
+                search_metrics.incr(name, "errors")
+                raise
+            finally:
+                _current_trace.reset(token)
+
+            total_ms = (time.perf_counter() - started) * 1000
+            payload = trace.payload if trace.payload is not None else response
+            result_count = _result_count(payload)
+
+            search_metrics.incr(name, "requests")
+            metrics.total_ms.observe(total_ms)
+            metrics.db_ms.observe(trace.db_ms)
+            metrics.serialize_ms.observe(trace.serialize_ms)
+            metrics.db_queries.observe(trace.db_queries)
+
+            if result_count == 0:
+                search_metrics.incr(name, "zero_results")
+                search_metrics.record_zero_result(name, _query_key(kwargs))
+            if total_ms >= settings.search_slow_ms:
+                search_metrics.incr(name, "slow")
+                search_metrics.record_slow({
+                    "endpoint": name,
+                    "at": datetime.utcnow().isoformat(),
+                    "total_ms": round(total_ms, 3),
+                    "db_ms": round(trace.db_ms, 3),
+                    "serialize_ms": round(trace.serialize_ms, 3),
+                    "db_queries": trace.db_queries,
+                    "result_count": result_count,
+                    "query": _describe(kwargs),
+                })
+            return response
+        return wrapper
+    return decorator
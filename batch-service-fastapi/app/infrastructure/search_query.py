@@ -0,0 +1,190 @@
+"""
+Search Query - 검색어 파서와 SQL 컴파일러
+
+검색어 문법:
+    brand:현대 vehicle_line:아반떼 model:"아반떼 하이브리드" trim:모던 가솔린
+- key:value 는 해당 레벨 이름 조건 (값에 공백이 있으면 큰따옴표로 감쌈)
+- 나머지 단어는 자유 검색어 - 결과 항목 자신의 이름에 모두 포함되어야 한다
+
+compile_search()는 검색 하나를 엔티티 유형별 SELECT의 UNION ALL + LIMIT인
+파라미터 바인딩 SQL 한 문장으로 만든다. relevance 식(FULLTEXT MATCH ... AGAINST)을 넘기면
+각 유형 SELECT에 관련도 컬럼을 두고 점수 다음으로 관련도 순으로 정렬한다.
+"""
+import shlex
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import func, literal, null, select, union_all, Integer, String
+
+from .search_index import LEVEL_SCORES
+from .tree_loader import LEVELS, PARENT_KEYS, STAGING_TREE, MAIN_TREE
+
+# 검색어에서 사용할 수 있는 필터 키 → 레벨
+FILTER_KEYS = {
+    "brand": "brand",
+    "vehicle_line": "vehicle_line",
+    "line": "vehicle_line",
+    "model": "model",
+    "trim": "trim",
+}
+
+# 결과 항목의 상위 레벨 컬럼 (UNION 컬럼 정렬용, 브랜드 항목은 자기 자신을 brand_id/brand_name으로)
+BREADCRUMB_LEVELS = ("brand", "vehicle_line", "model")
+
+
+@dataclass(slots=True)
+class ParsedQuery:
+    raw: str
+    filters: Dict[str, str] = field(default_factory=dict)  # 레벨 → 검색어
+    terms: List[str] = field(default_factory=list)         # 자유 검색어
+
+    @property
+    def cache_key(self) -> str:
+        """정규화된 검색 키 (대소문자, 자유 검색어 순서/중복 무시 - 같은 결과를 내는 검색은 같은 키)"""
+        filters = "&".join(f"{name}={value.lower()}" for name, value in sorted(self.filters.items()))
+        terms = " ".join(sorted({term.lower() for term in self.terms}))
+        return f"{filters}|{terms}"
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.filters and not self.terms
+
+    def conditions_for(self, level: str) -> Dict[str, List[str]]:
+        """level 항목에 적용할 레벨별 조건 (상위/자기 레벨 필터 + 자기 이름의 자유 검색어)"""
+        depth = LEVELS.index(level)
+        conditions = {
+            name: [value] for name, value in self.filters.items()
+            if LEVELS.index(name) <= depth
+        }
+        if self.terms:
+            conditions.setdefault(level, []).extend(self.terms)
+        return conditions
+
+
+def parse_search_query(text: str) -> ParsedQuery:
+    """검색어 문자열을 필터와 자유 검색어로 분리 (쿼리 파라미터는 FastAPI가 이미 디코딩함)"""
+    text = (text or "").strip()
+    try:
+        tokens = shlex.split(text)
+    except ValueError:
+        # 닫히지 않은 따옴표 등은 공백 기준으로 처리
+        tokens = text.replace('"', " ").split()
+
+    parsed = ParsedQuery(raw=text)
+    for token in tokens:
+        key, sep, value = token.partition(":")
+        level = FILTER_KEYS.get(key.lower()) if sep else None
+        if level and value.strip():
+            parsed.filters[level] = value.strip()
+        elif token.strip():
+            parsed.terms.append(token.strip())
+    return parsed
+
+
+def search_cache_key(kwargs: dict) -> str:
+    """검색 엔드포인트 캐시 키 (search_cache.search_cached용)"""
+    return f"{parse_search_query(kwargs['query']).cache_key}|{kwargs.get('limit')}"
+
+
+def search_echo(kwargs: dict) -> dict:
+    """검색 엔드포인트 응답의 요청 원문 필드"""
+    raw = (kwargs["query"] or "").strip()
+    return {"query": kwargs["query"], "decoded_query": raw, "search_query": raw}
+
+
+def like_condition(column, term: str):
+    return column.like(f"%{term}%")
+
+
+def compile_search(
+    parsed: ParsedQuery,
+    types: Sequence[str],
+    limit: int,
+    version_id: Optional[int] = None,
+    collapse_to: Optional[str] = None,
+    condition: Callable = like_condition,
+    relevance: Optional[Callable] = None
+):
+    """
+    검색을 SQL 한 문장으로 컴파일 (조건이 하나도 없는 유형은 제외, 모두 없으면 None)
+
+    types: 결과 엔티티 유형 (예: ("brand", "model", "trim"))
+    collapse_to: 하위 유형의 결과를 이 레벨 항목으로 묶음 (예: 트림 일치 → 해당 모델)
+    condition: (컬럼, 검색어) → WHERE 조건 (LIKE / FULLTEXT)
+    relevance: (컬럼, 검색어) → 관련도 식 또는 None - 주어지면 "relevance" 컬럼을 추가하고 관련도 순 정렬
+    """
+    tree = STAGING_TREE if version_id is not None else MAIN_TREE
+    branches = []
+    for level in types:
+        conditions = parsed.conditions_for(level)
+        if not conditions:
+            continue
+        depth = LEVELS.index(level)
+        result_level = collapse_to if collapse_to and LEVELS.index(collapse_to) < depth else level
+        result_class = tree[result_level]
+
+        columns = [
+            literal(result_level, String).label("type"),
+            result_class.id.label("id"),
+            result_class.name.label("name"),
+            literal(LEVEL_SCORES[level], Integer).label("match_score"),
+        ]
+        for name in BREADCRUMB_LEVELS:
+            if LEVELS.index(name) < LEVELS.index(result_level):
+                columns += [tree[name].id.label(f"{name}_id"), tree[name].name.label(f"{name}_name")]
+            elif name == result_level == "brand":
+                columns += [result_class.id.label(f"{name}_id"), result_class.name.label(f"{name}_name")]
+            else:
+                columns += [null().label(f"{name}_id"), null().label(f"{name}_name")]
+
+        branch = select(*columns).select_from(tree[level])
+        for index in range(depth, 0, -1):
+            child, parent = tree[LEVELS[index]], tree[LEVELS[index - 1]]
+            branch = branch.join(parent, getattr(child, PARENT_KEYS[LEVELS[index]]) == parent.id)
+        if version_id is not None:
+            branch = branch.where(tree["brand"].version_id == version_id)
+        scores = []
+        for name, values in conditions.items():
+            for value in values:
+                branch = branch.where(condition(tree[name].name, value))
+                score = relevance(tree[name].name, value) if relevance else None
+                if score is not None:
+                    scores.append(score)
+        branch_order = [result_class.id]
+        if relevance:
+            score = sum(scores[1:], scores[0]) if scores else literal(0)
+            branch = branch.add_columns(score.label("relevance"))
+            if scores:
+                branch_order.insert(0, score.desc())
+        if result_level != level:
+            # 묶인 항목 기준으로 LIMIT (트림이 많은 모델 하나가 한도를 채우지 않도록)
+            branch = branch.distinct()
+        # 유형별로도 LIMIT을 걸어 정렬 대상 행 수를 제한 (관련도가 있으면 관련도 높은 행부터)
+        branches.append(select(branch.order_by(*branch_order).limit(limit).subquery()))
+
+    if not branches:
+        return None
+    combined = (branches[0] if len(branches) == 1 else union_all(*branches)).subquery()
+
+    output = [combined.c.type, combined.c.id, combined.c.name]
+    breadcrumb = [combined.c[f"{name}_{suffix}"] for name in BREADCRUMB_LEVELS for suffix in ("id", "name")]
+    if collapse_to:
+        # 같은 항목이 여러 유형에서 일치하면 가장 높은 점수 하나만 (SQL에서 중복 제거)
+        score = func.max(combined.c.match_score).label("match_score")
+        scores = [score]
+        if relevance:
+            scores.append(func.max(combined.c.relevance).label("relevance"))
+        statement = select(*output, *scores, *breadcrumb).group_by(*output, *breadcrumb)
+    else:
+        score = combined.c.match_score
+        scores = [score]
+        if relevance:
+            scores.append(combined.c.relevance)
+        statement = select(*output, *scores, *breadcrumb)
+    order = [column.desc() for column in scores]
+    return statement.order_by(*order, combined.c.type, combined.c.id).limit(limit)
+
+
+def row_to_result(row) -> dict:
+    """결과 행 → 검색 응답 항목 (값이 없는 상위 레벨 키는 생략)"""
+    return {key: value for key, value in row.items() if value is not None}
@@ -0,0 +1,180 @@
+"""
+Tree Loader - brand → vehicle_line → model → trim → option 계층 조회
+
+레벨마다 부모 ID 목록으로 한 번씩만 조회(IN 쿼리)하고, 메모리에서 O(rows)로
+중첩 구조를 조립한다. 부모 1건당 1쿼리씩 내려가던 N+1 조회를 대체한다.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from .orm_models import (
+    StagingBrandORM, StagingVehicleLineORM, StagingModelORM,
+    StagingTrimORM, StagingOptionORM,
+    BrandORM, VehicleLineORM, ModelORM, TrimORM, OptionORM
+)
+from .projections import serialize_value
+
+# 계층 순서
+LEVELS = ("brand", "vehicle_line", "model", "trim", "option")
+
+# 레벨별 자식 목록 키
+CHILDREN_KEYS = {
+    "brand": "vehicle_lines",
+    "vehicle_line": "models",
+    "model": "trims",
+    "trim": "options",
+}
+
+# 레벨별 부모 FK 컬럼명
+PARENT_KEYS = {
+    "vehicle_line": "brand_id",
+    "model": "vehicle_line_id",
+    "trim": "model_id",
+    "option": "trim_id",
+}
+
+STAGING_TREE = {
+    "brand": StagingBrandORM,
+    "vehicle_line": StagingVehicleLineORM,
+    "model": StagingModelORM,
+    "trim": StagingTrimORM,
+    "option": StagingOptionORM,
+}
+
+MAIN_TREE = {
+    "brand": BrandORM,
+    "vehicle_line": VehicleLineORM,
+    "model": ModelORM,
+    "trim": TrimORM,
+    "option": OptionORM,
+}
+
+# 감사(audit) 컬럼 - 트리 응답용
+FULL_AUDIT_FIELDS = (
+    "created_by", "created_by_username", "created_by_email", "created_at",
+    "updated_by_username", "updated_by_email", "updated_at"
+)
+
+# IN 절 최대 길이
+IN_CHUNK_SIZE = 1000
+
+
+def _chunks(ids: Sequence[int], size: int = IN_CHUNK_SIZE) -> Iterable[Sequence[int]]:
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+class TreeLoader:
+    """레벨당 1쿼리로 계층 트리를 조회하는 로더"""
+
+    def __init__(
+        self,
+        db: Session,
+        fields: Dict[str, Sequence[str]],
+        tree: Dict[str, type] = STAGING_TREE,
+        order_by: str = "id"
+    ):
+        """
+        fields: 레벨별 응답 필드 (예: {"brand": ("id", "name"), ...})
+        tree: 레벨별 ORM 클래스 (STAGING_TREE / MAIN_TREE)
+        order_by: 각 레벨 정렬 기준 ("id" 또는 "name")
+        """
+        self.db = db
+        self.fields = fields
+        self.tree = tree
+        self.order_by = order_by
+        self.counts: Dict[str, int] = {}
+
+    def load(
+        self,
+        root_level: str,
+        root_ids: Sequence[int],
+        depth: str = "option"
+    ) -> List[dict]:
+        """
+        root_level의 root_ids부터 depth 레벨까지 트리를 조회하여 루트 노드 목록 반환
+        (루트 순서는 order_by 기준)
+        """
+        start = LEVELS.index(root_level)
+        end = LEVELS.index(depth)
+        self.counts = {level: 0 for level in LEVELS[start:end + 1]}
+
+        roots = self._fetch(root_level, "id", list(root_ids), has_children=start < end)
+        self.counts[root_level] = len(roots)
+
+        parents = {node["id"]: node for node in roots}
+        for index in range(start + 1, end + 1):
+            level = LEVELS[index]
+            if not parents:
+                break
+            parent_key = CHILDREN_KEYS[LEVELS[index - 1]]
+            rows = self._fetch(level, PARENT_KEYS[level], list(parents.keys()), has_children=index < end, keep_parent=True)
+            self.counts[level] = len(rows)
+
+            next_parents = {}
+            for node in rows:
+                parent = parents.get(node.pop("__parent_id"))
+                if parent is not None:
+                    parent[parent_key].append(node)
+                    next_parents[node["id"]] = node
+            parents = next_parents
+
+        return roots
+
+    def _fetch(
+        self,
+        level: str,
+        filter_key: str,
+        ids: List[int],
+        has_children: bool,
+        keep_parent: bool = False
+    ) -> List[dict]:
+        """한 레벨을 IN 쿼리로 조회하여 dict 노드 목록 반환"""
+        if not ids:
+            return []
+        orm_class = self.tree[level]
+        field_names = tuple(self.fields[level])
+        columns = [getattr(orm_class, name) for name in field_names]
+        if "id" not in field_names:
+            columns.append(orm_class.id)
+            field_names = field_names + ("id",)
+        if keep_parent:
+            columns.append(getattr(orm_class, PARENT_KEYS[level]).label("__parent_id"))
+
+        filter_column = getattr(orm_class, filter_key)
+        order_column = getattr(orm_class, self.order_by)
+        children_key = CHILDREN_KEYS.get(level) if has_children else None
+
+        nodes = []
+        for chunk in _chunks(ids):
+            rows = self.db.query(*columns).filter(
+                filter_column.in_(chunk)
+            ).order_by(order_column, orm_class.id).all()
+            for row in rows:
+                node = {name: serialize_value(value) for name, value in zip(field_names, row)}
+                if keep_parent:
+                    node["__parent_id"] = row[-1]
+                if children_key:
+                    node[children_key] = []
+                nodes.append(node)
+
+        if len(ids) > IN_CHUNK_SIZE:
+            # 청크별 정렬 결과를 전체 기준으로 재정렬
+            nodes.sort(key=lambda node: (node.get(self.order_by) is None, node.get(self.order_by), node["id"]))
+        return nodes
+
+
+def find_version_id(db: Session, level: str, entity_id: int) -> Optional[int]:
+    """스테이징 엔티티가 속한 버전 ID 조회 (상위 레벨 JOIN 1쿼리)"""
+    if not entity_id:
+        return None
+    index = LEVELS.index(level)
+    orm_class = STAGING_TREE[level]
+    query = db.query(StagingBrandORM.version_id).select_from(orm_class)
+    for child_index in range(index, 0, -1):
+        child = STAGING_TREE[LEVELS[child_index]]
+        parent = STAGING_TREE[LEVELS[child_index - 1]]
+        query = query.join(parent, getattr(child, PARENT_KEYS[LEVELS[child_index]]) == parent.id)
+    row = query.filter(orm_class.id == entity_id).first()
+    return row[0] if row else None
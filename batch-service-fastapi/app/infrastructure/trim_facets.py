@@ -0,0 +1,188 @@
+"""
+Trim Facets - 스테이징 버전 트림 패싯 검색
+
+브랜드 / 차종(car_type) / 연료(fuel_name) / 배기량(cc) / 가격대 필터와 패싯별 개수.
+패싯 개수는 해당 패싯 자신의 선택을 제외한 나머지 필터로 집계한다 (다중 선택 drill-down).
+모든 패싯 개수와 전체 개수는 GROUP BY 집계의 UNION ALL 한 문장으로 조회한다.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from sqlalchemy import String, case, cast, func, literal, null, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from .orm_models import StagingBrandORM, StagingVehicleLineORM, StagingModelORM, StagingTrimORM
+
+FACETS = ("brand", "car_type", "fuel_name", "cc", "price_band")
+
+# 가격대 (하한 이상, 상한 미만 / 원)
+PRICE_BANDS = (
+    (None, 20_000_000, "2천만원 미만"),
+    (20_000_000, 30_000_000, "2천만원대"),
+    (30_000_000, 40_000_000, "3천만원대"),
+    (40_000_000, 50_000_000, "4천만원대"),
+    (50_000_000, 70_000_000, "5천~7천만원"),
+    (70_000_000, 100_000_000, "7천만~1억원"),
+    (100_000_000, None, "1억원 이상"),
+)
+UNKNOWN_PRICE_BAND = "unknown"
+
+
+def price_band_key(low: Optional[int], high: Optional[int]) -> str:
+    return f"{low or ''}-{high or ''}"
+
+
+PRICE_BAND_LABELS = {price_band_key(low, high): label for low, high, label in PRICE_BANDS}
+PRICE_BAND_LABELS[UNKNOWN_PRICE_BAND] = "가격 미정"
+
+
+@dataclass(slots=True)
+class FacetFilters:
+    brand: List[int] = field(default_factory=list)
+    car_type: List[str] = field(default_factory=list)
+    fuel_name: List[str] = field(default_factory=list)
+    cc: List[str] = field(default_factory=list)
+    price_band: List[str] = field(default_factory=list)
+    q: Optional[str] = None
+
+    @property
+    def cache_key(self) -> str:
+        parts = [f"{name}={','.join(sorted(str(value) for value in getattr(self, name)))}" for name in FACETS]
+        return "&".join(parts + [f"q={(self.q or '').strip().lower()}"])
+
+    def to_dict(self) -> dict:
+        return {**{name: getattr(self, name) for name in FACETS}, "q": self.q}
+
+
+def facet_filters(params: dict) -> FacetFilters:
+    """엔드포인트 쿼리 파라미터 → FacetFilters"""
+    return FacetFilters(
+        brand=list(params.get("brand_id") or []),
+        car_type=list(params.get("car_type") or []),
+        fuel_name=list(params.get("fuel_name") or []),
+        cc=list(params.get("cc") or []),
+        price_band=list(params.get("price_band") or []),
+        q=params.get("q"),
+    )
+
+
+def _price_band_expression():
+    price = StagingTrimORM.base_price
+    whens = [(price.is_(None), UNKNOWN_PRICE_BAND)]
+    for low, high, _ in PRICE_BANDS:
+        conditions = []
+        if low is not None:
+            conditions.append(price >= low)
+        if high is not None:
+            conditions.append(price < high)
+        whens.append((conditions[0] if len(conditions) == 1 else conditions[0] & conditions[1], price_band_key(low, high)))
+    return case(*whens, else_=UNKNOWN_PRICE_BAND)
+
+
+# 패싯별 그룹 값 컬럼
+FACET_COLUMNS = {
+    "brand": StagingBrandORM.id,
+    "car_type": StagingTrimORM.car_type,
+    "fuel_name": StagingTrimORM.fuel_name,
+    "cc": StagingTrimORM.cc,
+    "price_band": _price_band_expression(),
+}
+
+
+def _joined(statement, version_id: int):
+    """트림 → 모델 → 라인 → 브랜드 조인 + 버전 조건"""
+    return statement.select_from(StagingTrimORM).join(
+        StagingModelORM, StagingTrimORM.model_id == StagingModelORM.id
+    ).join(
+        StagingVehicleLineORM, StagingModelORM.vehicle_line_id == StagingVehicleLineORM.id
+    ).join(
+        StagingBrandORM, StagingVehicleLineORM.brand_id == StagingBrandORM.id
+    ).where(StagingBrandORM.version_id == version_id)
+
+
+def filter_conditions(filters: FacetFilters, exclude: Optional[str] = None) -> list:
+    """필터 → WHERE 조건 목록 (exclude 패싯의 선택은 제외)"""
+    conditions = []
+    for name in FACETS:
+        values = getattr(filters, name)
+        if values and name != exclude:
+            conditions.append(FACET_COLUMNS[name].in_(values))
+    if filters.q and filters.q.strip():
+        term = f"%{filters.q.strip()}%"
+        conditions.append(or_(StagingTrimORM.name.like(term), StagingModelORM.name.like(term)))
+    return conditions
+
+
+def facet_counts(db: Session, version_id: int, filters: FacetFilters) -> dict:
+    """전체 개수 + 패싯별 (값, 라벨, 개수) - 집계 UNION ALL 1쿼리"""
+    branches = [
+        _joined(select(
+            literal("_total", String).label("facet"),
+            null().label("value"),
+            null().label("label"),
+            func.count(StagingTrimORM.id).label("count"),
+        ), version_id).where(*filter_conditions(filters))
+    ]
+    for name in FACETS:
+        value = cast(FACET_COLUMNS[name], String)
+        label = cast(StagingBrandORM.name, String) if name == "brand" else value
+        branches.append(
+            _joined(select(
+                literal(name, String).label("facet"),
+                value.label("value"),
+                label.label("label"),
+                func.count(StagingTrimORM.id).label("count"),
+            ), version_id).where(*filter_conditions(filters, exclude=name)).group_by(value, label)
+        )
+
+    total = 0
+    facets: Dict[str, List[dict]] = {name: [] for name in FACETS}
+    for row in db.execute(union_all(*branches)).mappings():
+        if row["facet"] == "_total":
+            total = row["count"]
+            continue
+        value, label = row["value"], row["label"]
+        if row["facet"] == "brand":
+            value = int(value)
+        elif row["facet"] == "price_band":
+            label = PRICE_BAND_LABELS.get(value, value)
+        facets[row["facet"]].append({
+            "value": value,
+            "label": label,
+            "count": row["count"],
+            "selected": value in getattr(filters, row["facet"]),
+        })
+
+    band_order = [price_band_key(low, high) for low, high, _ in PRICE_BANDS] + [UNKNOWN_PRICE_BAND]
+    for name, items in facets.items():
+        if name == "price_band":
+            items.sort(key=lambda item: band_order.index(item["value"]) if item["value"] in band_order else len(band_order))
+        else:
+            items.sort(key=lambda item: (-item["count"], item["label"] is None, item["label"] or ""))
+    return {"total_count": total, "facets": facets}
+
+
+def trim_query(db: Session, version_id: int, filters: FacetFilters):
+    """필터에 맞는 트림 목록 쿼리 (상위 레벨 이름 포함, pagination.paginate용)"""
+    query = db.query(
+        StagingTrimORM.id,
+        StagingTrimORM.name,
+        StagingTrimORM.car_type,
+        StagingTrimORM.fuel_name,
+        StagingTrimORM.cc,
+        StagingTrimORM.base_price,
+        StagingTrimORM.model_id,
+        StagingModelORM.name.label("model_name"),
+        StagingVehicleLineORM.id.label("vehicle_line_id"),
+        StagingVehicleLineORM.name.label("vehicle_line_name"),
+        StagingBrandORM.id.label("brand_id"),
+        StagingBrandORM.name.label("brand_name"),
+    ).join(
+        StagingModelORM, StagingTrimORM.model_id == StagingModelORM.id
+    ).join(
+        StagingVehicleLineORM, StagingModelORM.vehicle_line_id == StagingVehicleLineORM.id
+    ).join(
+        StagingBrandORM, StagingVehicleLineORM.brand_id == StagingBrandORM.id
+    ).filter(StagingBrandORM.version_id == version_id)
+    conditions = filter_conditions(filters)
+    return query.filter(*conditions) if conditions else query
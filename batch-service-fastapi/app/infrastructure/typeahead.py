@@ -0,0 +1,160 @@
+"""
+Typeahead - 자동완성용 접두사 트라이 (한글 초성 검색 지원)
+
+이름(정규화 문자열)과 그 초성 문자열("아반떼" → "ㅇㅂㄸ")을 각각 트라이에 넣어
+"아반", "ㅇㅂㄸ", "아반ㄸ" 같은 입력 중 접두사를 찾는다.
+버전 검색 색인(search_index.VersionSearchIndex)이 문서 추가/삭제 시 함께 갱신한다.
+"""
+from collections import deque
+from typing import Callable, Dict, Hashable, List, Optional, Set
+
+# 자동완성 대상 레벨 (옵션 제외)
+TYPEAHEAD_LEVELS = ("brand", "vehicle_line", "model", "trim")
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = frozenset(CHOSEONG)
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_SYLLABLES_PER_CHOSEONG = 21 * 28
+
+
+def choseong_of(ch: str) -> str:
+    """한글 음절의 초성 (음절이 아니면 그대로)"""
+    code = ord(ch)
+    if _HANGUL_BASE <= code <= _HANGUL_LAST:
+        return CHOSEONG[(code - _HANGUL_BASE) // _SYLLABLES_PER_CHOSEONG]
+    return ch
+
+
+def to_choseong(text: str) -> str:
+    return "".join(choseong_of(ch) for ch in text)
+
+
+def has_choseong(text: str) -> bool:
+    return any(ch in _CHOSEONG_SET for ch in text)
+
+
+def matches_prefix(query: str, word: str) -> bool:
+    """query(음절/초성 혼합)가 word의 접두사인지 - 초성 자리는 음절의 초성과 비교"""
+    if len(query) > len(word):
+        return False
+    for q, w in zip(query, word):
+        if q != w and not (q in _CHOSEONG_SET and choseong_of(w) == q):
+            return False
+    return True
+
+
+class _Node:
+    __slots__ = ("children", "words")
+
+    def __init__(self):
+        self.children: Optional[Dict[str, "_Node"]] = None
+        self.words: Optional[Dict[str, Set[Hashable]]] = None  # 원래 이름(정규화) → 문서 키
+
+
+class PrefixTrie:
+    """문자 단위 트라이 - 경로 문자열로 넣고, 끝 노드에 원래 단어별 문서 키를 보관"""
+
+    def __init__(self):
+        self.root = _Node()
+        self.size = 0
+
+    def insert(self, path: str, word: str, key: Hashable):
+        node = self.root
+        for ch in path:
+            if node.children is None:
+                node.children = {}
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = _Node()
+            node = child
+        if node.words is None:
+            node.words = {}
+        keys = node.words.setdefault(word, set())
+        if key not in keys:
+            keys.add(key)
+            self.size += 1
+
+    def remove(self, path: str, word: str, key: Hashable):
+        trail = [self.root]
+        for ch in path:
+            children = trail[-1].children
+            if not children or ch not in children:
+                return
+            trail.append(children[ch])
+        node = trail[-1]
+        keys = node.words.get(word) if node.words else None
+        if not keys or key not in keys:
+            return
+        keys.discard(key)
+        self.size -= 1
+        if not keys:
+            del node.words[word]
+            if not node.words:
+                node.words = None
+        # 비어 있는 꼬리 노드 정리
+        for depth in range(len(path), 0, -1):
+            node = trail[depth]
+            if node.words or node.children:
+                break
+            parent = trail[depth - 1]
+            del parent.children[path[depth - 1]]
+            if not parent.children:
+                parent.children = None
+
+    def complete(
+        self,
+        prefix: str,
+        limit: int,
+        accept: Optional[Callable[[str], bool]] = None
+    ) -> List[Set[Hashable]]:
+        """prefix로 시작하는 단어의 문서 키 집합 목록 (짧은 단어부터, 최대 limit개 단어)"""
+        node = self.root
+        for ch in prefix:
+            if not node.children or ch not in node.children:
+                return []
+            node = node.children[ch]
+
+        results = []
+        queue = deque([node])
+        while queue and len(results) < limit:
+            node = queue.popleft()
+            if node.words:
+                for word, keys in node.words.items():
+                    if accept is None or accept(word):
+                        results.append(keys)
+                        if len(results) >= limit:
+                            break
+            if node.children:
+                queue.extend(node.children.values())
+        return results
+
+
+class Typeahead:
+    """음절 트라이 + 초성 트라이"""
+
+    def __init__(self):
+        self.names = PrefixTrie()
+        self.initials = PrefixTrie()
+
+    def add(self, norm: str, key: Hashable):
+        if norm:
+            self.names.insert(norm, norm, key)
+            self.initials.insert(to_choseong(norm), norm, key)
+
+    def remove(self, norm: str, key: Hashable):
+        if norm:
+            self.names.remove(norm, norm, key)
+            self.initials.remove(to_choseong(norm), norm, key)
+
+    def complete(self, query: str, limit: int) -> List[Set[Hashable]]:
+        """정규화된 입력의 자동완성 후보 (단어별 문서 키 집합, 짧은 단어부터)"""
+        if not query:
+            return []
+        if not has_choseong(query):
+            return self.names.complete(query, limit)
+        # 초성이 섞인 입력은 초성 트라이에서 찾고 음절 자리를 다시 확인
+        return self.initials.complete(
+            to_choseong(query), limit,
+            accept=lambda word: matches_prefix(query, word)
+        )
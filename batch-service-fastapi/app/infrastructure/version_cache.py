@@ -0,0 +1,249 @@
+"""
+Version Snapshot Cache - 버전 트리 응답을 Redis에 (version_id, revision) 단위로 저장
+
+- revision: 버전별 쓰기 카운터. 스테이징 CRUD / 엑셀 임포트 / 승인 등 쓰기 경로에서
+  bump_revision()을 호출하면 이전 revision의 스냅샷은 더 이상 조회되지 않는다.
+- 용량 기반 축출: 전체 스냅샷 크기 합계가 snapshot_cache_max_bytes를 넘으면
+  가장 오래 사용되지 않은 스냅샷부터 삭제한다. 스냅샷에는 TTL을 두지 않는다 -
+  만료로 사라진 키는 크기 인덱스(SIZES/LRU/TOTAL)에 남아 합계가 실제보다 커지므로,
+  삭제는 revision 증가 시 정리와 LRU 축출 두 경로로만 한다.
+- 저장 값은 캐시 적중/미스와 무관하게 같은 형태(JSON 디코딩 결과)로 반환한다.
+- 메인 카탈로그도 별도 revision(bump_main_revision)을 가지며 ETag 계산에 사용된다.
+- Redis 장애 시에는 캐시를 건너뛰고 DB에서 직접 조회한다 (fail-open).
+"""
+import functools
+import json
+import threading
+import time
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Callable, Optional
+
+from ..config import settings
+
+KEY_PREFIX = "vsnap"
+LRU_KEY = f"{KEY_PREFIX}:lru"            # ZSET: 스냅샷 키 → 마지막 사용 시각
+SIZES_KEY = f"{KEY_PREFIX}:sizes"        # HASH: 스냅샷 키 → 바이트 크기
+TOTAL_KEY = f"{KEY_PREFIX}:total_bytes"  # 전체 스냅샷 크기 합계
+MAIN_REVISION_KEY = f"{KEY_PREFIX}:rev:main"  # 메인 카탈로그 revision
+STAGING_REVISION_KEY = f"{KEY_PREFIX}:rev:staging"  # 전체 스테이징 revision (버전 revision 증가 시 함께 증가)
+
+# Redis 연결 실패 후 재시도까지 대기 시간 (초)
+REDIS_RETRY_INTERVAL = 30
+
+_redis_client = None
+_redis_down_until = 0.0
+_redis_lock = threading.Lock()
+_revision_listeners = []
+
+
+def get_redis():
+    """Redis 클라이언트 반환 (연결 실패 직후에는 None)"""
+    global _redis_client
+    if not settings.snapshot_cache_enabled or time.monotonic() < _redis_down_until:
+        return None
+    if _redis_client is None:
+        with _redis_lock:
+            if _redis_client is None:
+                import redis
+                _redis_client = redis.Redis.from_url(
+                    settings.redis_url,
+                    socket_connect_timeout=0.2,
+                    socket_timeout=0.5
+                )
+    return _redis_client
+
+
+def _mark_redis_down(error: Exception):
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + REDIS_RETRY_INTERVAL
+    print(f"[CACHE] Redis 사용 불가, {REDIS_RETRY_INTERVAL}초 동안 캐시 생략: {str(error)}")
+
+
+def _revision_key(version_id: int) -> str:
+    return f"{KEY_PREFIX}:rev:{version_id}"
+
+
+def _version_keys_key(version_id: int) -> str:
+    return f"{KEY_PREFIX}:keys:{version_id}"
+
+
+def get_revision(version_id: int) -> Optional[int]:
+    """버전의 현재 revision (Redis 사용 불가 시 None)"""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        value = client.get(_revision_key(version_id))
+        return int(value) if value else 0
+    except Exception as e:
+        _mark_redis_down(e)
+        return None
+
+
+def get_staging_revision() -> Optional[int]:
+    """전체 스테이징 revision - 어느 버전이든 쓰기가 있으면 증가 (Redis 사용 불가 시 None)"""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        value = client.get(STAGING_REVISION_KEY)
+        return int(value) if value else 0
+    except Exception as e:
+        _mark_redis_down(e)
+        return None
+
+
+def get_main_revision() -> Optional[int]:
+    """메인 카탈로그 revision (Redis 사용 불가 시 None)"""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        value = client.get(MAIN_REVISION_KEY)
+        return int(value) if value else 0
+    except Exception as e:
+        _mark_redis_down(e)
+        return None
+
+
+def bump_main_revision() -> None:
+    """메인 카탈로그 revision 증가 (메인 DB 쓰기 경로에서 호출)"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.incr(MAIN_REVISION_KEY)
+    except Exception as e:
+        _mark_redis_down(e)
+
+
+def add_revision_listener(listener: Callable[[int, Optional[int]], None]) -> None:
+    """revision 증가 알림 등록 - listener(version_id, 새 revision 또는 None)"""
+    _revision_listeners.append(listener)
+
+
+def bump_revision(version_id: Optional[int]) -> None:
+    """버전 revision 증가 + 이전 revision 스냅샷 정리 (쓰기 경로에서 호출)"""
+    if not version_id:
+        return
+    revision = None
+    client = get_redis()
+    if client is not None:
+        try:
+            revision = client.incr(_revision_key(version_id))
+            client.incr(STAGING_REVISION_KEY)
+            stale_keys = [key.decode() for key in client.smembers(_version_keys_key(version_id))]
+            if stale_keys:
+                _delete_snapshots(client, stale_keys)
+            client.delete(_version_keys_key(version_id))
+        except Exception as e:
+            _mark_redis_down(e)
+    for listener in _revision_listeners:
+        listener(version_id, revision)
+
+
+def _delete_snapshots(client, keys: list) -> None:
+    """스냅샷 키 삭제 + 용량 인덱스 갱신"""
+    sizes = client.hmget(SIZES_KEY, keys)
+    freed = sum(int(size) for size in sizes if size)
+    pipe = client.pipeline()
+    pipe.delete(*keys)
+    pipe.hdel(SIZES_KEY, *keys)
+    pipe.zrem(LRU_KEY, *keys)
+    if freed:
+        pipe.decrby(TOTAL_KEY, freed)
+    pipe.execute()
+
+
+def _evict(client) -> None:
+    """전체 크기가 한도를 넘으면 가장 오래 사용되지 않은 스냅샷부터 삭제"""
+    max_bytes = settings.snapshot_cache_max_bytes
+    total = int(client.get(TOTAL_KEY) or 0)
+    while total > max_bytes:
+        oldest = [key.decode() for key in client.zrange(LRU_KEY, 0, 0)]
+        if not oldest:
+            client.set(TOTAL_KEY, 0)
+            return
+        _delete_snapshots(client, oldest)
+        total = int(client.get(TOTAL_KEY) or 0)
+
+
+def _json_default(value):
+    """JSON 직렬화기가 처리하지 못하는 값 변환 (jsonable_encoder와 같은 규칙)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _snapshot_key(version_id: int, revision: int, kind: str, params: dict) -> str:
+    param_str = "&".join(f"{name}={params[name]}" for name in sorted(params))
+    return f"{KEY_PREFIX}:{version_id}:{revision}:{kind}:{param_str}"
+
+
+def cached_snapshot(version_id: int, kind: str, params: dict, builder: Callable[[], dict]) -> dict:
+    """
+    (version_id, revision, kind, params) 스냅샷을 조회하고 없으면 builder()로 생성 후 저장
+    """
+    revision = get_revision(version_id)
+    if revision is None:
+        return builder()
+
+    client = get_redis()
+    key = _snapshot_key(version_id, revision, kind, params)
+    try:
+        payload = client.get(key)
+        if payload is not None:
+            client.zadd(LRU_KEY, {key: time.time()})
+            return json.loads(zlib.decompress(payload))
+    except Exception as e:
+        _mark_redis_down(e)
+        return builder()
+
+    # 적중 시와 같은 형태로 반환하도록 직렬화 결과를 디코딩해 사용
+    encoded = json.dumps(builder(), ensure_ascii=False, default=_json_default)
+    result = json.loads(encoded)
+
+    try:
+        payload = zlib.compress(encoded.encode("utf-8"))
+        size = len(payload)
+        if size > settings.snapshot_cache_max_entry_bytes:
+            return result
+        # 빌드 중 쓰기가 있었으면 저장하지 않음 (revision 재확인)
+        if get_revision(version_id) != revision:
+            return result
+        # 동시 미스로 같은 키를 다시 저장하면 이전 크기만큼 빼서 합계 중복 방지
+        previous = int(client.hget(SIZES_KEY, key) or 0)
+        pipe = client.pipeline()
+        pipe.set(key, payload)
+        pipe.hset(SIZES_KEY, key, size)
+        pipe.zadd(LRU_KEY, {key: time.time()})
+        pipe.incrby(TOTAL_KEY, size - previous)
+        pipe.sadd(_version_keys_key(version_id), key)
+        pipe.execute()
+        _evict(client)
+    except Exception as e:
+        _mark_redis_down(e)
+    return result
+
+
+def version_snapshot(kind: str, params: tuple = ()):
+    """
+    버전 스냅샷 캐시 데코레이터 (version_id 경로 파라미터를 가진 GET 엔드포인트용)
+    
+    params: 캐시 키에 포함할 쿼리 파라미터 이름
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            version_id = kwargs["version_id"]
+            key_params = {name: kwargs.get(name) for name in params}
+            return cached_snapshot(version_id, kind, key_params, lambda: func(*args, **kwargs))
+        return wrapper
+    return decorator
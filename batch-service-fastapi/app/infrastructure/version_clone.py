@@ -0,0 +1,148 @@
+"""
+Version Clone - 스테이징 버전 전체 계층을 서버에서 복제
+
+테이블마다 INSERT ... SELECT 1문으로 복사하며 행은 Python을 거치지 않는다.
+새 ID는 "원본 ID + 테이블별 오프셋"으로 미리 정해 두고, 자식 행의 FK도 부모 테이블의
+오프셋만큼 더해 재매핑한다. 오프셋 계산 시 MAX(id)를 FOR UPDATE로 읽어 복제가 끝날 때까지
+다른 트랜잭션이 해당 ID 구간에 삽입하지 못하게 한다. 전체 복제는 호출자의 트랜잭션 하나에서 수행된다.
+"""
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from .orm_models import (
+    StagingVersionORM, StagingBrandORM, StagingVehicleLineORM, StagingModelORM,
+    StagingTrimORM, StagingOptionORM, StagingOptionTitleORM, StagingOptionPriceORM,
+    StagingDiscountPolicyORM, StagingBrandCardBenefitORM, StagingBrandPromoORM,
+    StagingBrandInventoryDiscountORM, StagingBrandPrePurchaseORM
+)
+
+# 복제 순서 (부모 테이블이 먼저) - (ORM, 버전 범위를 찾기 위한 부모 FK 컬럼, 부모 ORM)
+# 부모 FK가 None이면 version_id 컬럼으로 직접 필터
+CLONE_PLAN = (
+    (StagingBrandORM, None, None),
+    (StagingVehicleLineORM, "brand_id", StagingBrandORM),
+    (StagingModelORM, "vehicle_line_id", StagingVehicleLineORM),
+    (StagingTrimORM, "model_id", StagingModelORM),
+    (StagingOptionORM, "trim_id", StagingTrimORM),
+    (StagingOptionTitleORM, "trim_id", StagingTrimORM),
+    (StagingOptionPriceORM, "option_title_id", StagingOptionTitleORM),
+    (StagingDiscountPolicyORM, None, None),
+    (StagingBrandCardBenefitORM, "discount_policy_id", StagingDiscountPolicyORM),
+    (StagingBrandPromoORM, "discount_policy_id", StagingDiscountPolicyORM),
+    (StagingBrandInventoryDiscountORM, "discount_policy_id", StagingDiscountPolicyORM),
+    (StagingBrandPrePurchaseORM, "discount_policy_id", StagingDiscountPolicyORM),
+)
+
+_SCOPE_PARENTS = {orm_class: (fk, parent) for orm_class, fk, parent in CLONE_PLAN}
+
+# 복제 행에 새로 기록하는 감사 컬럼
+CREATED_FIELDS = ("created_by", "created_by_username", "created_by_email")
+RESET_FIELDS = ("updated_by_username", "updated_by_email")
+
+
+def _scoped_select(orm_class, source_version_id: int, *columns):
+    """원본 버전에 속한 행만 고르는 SELECT (상위 테이블 JOIN)"""
+    query = select(*columns).select_from(orm_class)
+    current = orm_class
+    while _SCOPE_PARENTS[current][0] is not None:
+        fk, parent = _SCOPE_PARENTS[current]
+        query = query.join(parent, getattr(current, fk) == parent.id)
+        current = parent
+    return query.where(current.version_id == source_version_id)
+
+
+def clone_version_rows(
+    db: Session,
+    source_version_id: int,
+    target_version_id: int,
+    user: Optional[dict] = None
+) -> Dict[str, int]:
+    """
+    source 버전의 스테이징 계층을 target 버전으로 복사 (커밋은 호출자 담당)
+
+    반환: 테이블별 복사 행 수
+    """
+    user = user or {}
+    audit_values = {
+        "created_by": user.get("username") or "system",
+        "created_by_username": user.get("username"),
+        "created_by_email": user.get("email") or "system",
+    }
+    now = datetime.utcnow()
+    offsets: Dict[type, int] = {}
+    counts: Dict[str, int] = {}
+
+    for orm_class, _, _ in CLONE_PLAN:
+        table = orm_class.__table__
+        counts[table.name] = 0
+
+        min_id = db.execute(_scoped_select(orm_class, source_version_id, func.min(orm_class.id))).scalar()
+        if min_id is None:
+            continue
+        # 테이블 끝 구간 잠금 - 복제 중 다른 삽입이 새 ID 구간과 겹치지 않도록
+        max_id = db.execute(select(func.max(orm_class.id)).with_for_update()).scalar() or 0
+        offset = max_id + 1 - min_id
+        offsets[orm_class] = offset
+
+        target_columns = []
+        select_columns = []
+        for column in table.columns:
+            source = getattr(orm_class, column.key)
+            if column.key == "id":
+                value = source + offset
+            elif column.key == "version_id":
+                value = literal(target_version_id)
+            elif column.foreign_keys:
+                parent_table = next(iter(column.foreign_keys)).column.table
+                parent_class = next(
+                    (cls for cls in offsets if cls.__table__ is parent_table), None
+                )
+                value = source + offsets[parent_class] if parent_class else source
+            elif column.key in CREATED_FIELDS:
+                value = literal(audit_values[column.key])
+            elif column.key == "created_at":
+                value = literal(now)
+            elif column.key in RESET_FIELDS:
+                value = literal(None, type_=column.type)
+            elif column.key == "updated_at":
+                value = literal(now) if not column.nullable else literal(None, type_=column.type)
+            else:
+                value = source
+            target_columns.append(column.key)
+            select_columns.append(value)
+
+        statement = insert(table).from_select(
+            target_columns,
+            _scoped_select(orm_class, source_version_id, *select_columns)
+        )
+        counts[table.name] = db.execute(statement).rowcount
+
+    return counts
+
+
+def clone_version(
+    db: Session,
+    source_version_id: int,
+    version_name: str,
+    description: Optional[str] = None,
+    user: Optional[dict] = None
+) -> Tuple[StagingVersionORM, Dict[str, int]]:
+    """새 버전을 만들고 source 버전 계층을 복사한 뒤 한 번에 커밋 - (새 버전, 테이블별 행 수) 반환"""
+    user = user or {}
+    try:
+        new_version = StagingVersionORM(
+            version_name=version_name,
+            description=description,
+            created_by=user.get("username") or "system"
+        )
+        db.add(new_version)
+        db.flush()
+        counts = clone_version_rows(db, source_version_id, new_version.id, user)
+        db.commit()
+        return new_version, counts
+    except Exception:
+        db.rollback()
+        raise
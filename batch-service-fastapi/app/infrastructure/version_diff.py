@@ -0,0 +1,202 @@
+"""
+Version Diff - 두 카탈로그(스테이징 버전 또는 메인 DB)를 자연키 기준으로 비교
+
+- 레벨(브랜드 → 자동차 라인 → 모델 → 트림 → 옵션)마다 한쪽당 1쿼리로 필요한 컬럼만 조회
+- 행의 자연키 경로(예: 현대 / 아반떼 / 아반떼 LPI / 모던)로 매칭하고,
+  내용 컬럼 해시가 다른 행만 변경으로 판단하여 필드별 변경값과 가격 차이를 계산
+- ID는 버전마다 새로 발급되므로 비교에 사용하지 않는다
+"""
+import hashlib
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from .orm_models import StagingBrandORM
+from .tree_loader import LEVELS, PARENT_KEYS, STAGING_TREE, MAIN_TREE
+from .projections import serialize_value
+
+# 레벨별 자연키 컬럼 (부모 경로 + 아래 컬럼으로 행을 식별)
+NATURAL_KEYS = {
+    "brand": ("name",),
+    "vehicle_line": ("name",),
+    "model": ("name",),
+    "trim": ("name",),
+    "option": ("category", "name"),
+}
+
+# 레벨별 비교 대상 내용 컬럼
+CONTENT_FIELDS = {
+    "brand": ("country", "logo_url", "manager"),
+    "vehicle_line": ("description",),
+    "model": ("code", "release_year", "price", "foreign"),
+    "trim": ("car_type", "fuel_name", "cc", "base_price", "description"),
+    "option": ("code", "description", "price", "discounted_price"),
+}
+
+# 가격 차이를 계산할 컬럼
+PRICE_FIELDS = {
+    "model": ("price",),
+    "trim": ("base_price",),
+    "option": ("price", "discounted_price"),
+}
+
+# 결과 응답 키 (레벨 → 복수형)
+RESULT_KEYS = {
+    "brand": "brands",
+    "vehicle_line": "vehicle_lines",
+    "model": "models",
+    "trim": "trims",
+    "option": "options",
+}
+
+# 서버 사이드 커서 배치 크기
+YIELD_PER = 5000
+
+MAIN = "main"
+
+
+class _Side:
+    """비교 한쪽(버전 ID 또는 메인 DB)의 레벨별 조회"""
+
+    def __init__(self, db: Session, source):
+        self.db = db
+        self.source = source
+        self.tree = MAIN_TREE if source == MAIN else STAGING_TREE
+
+    def rows(self, level: str):
+        """(id, parent_id, 자연키..., 내용...) 행 반복자"""
+        orm_class = self.tree[level]
+        columns = [orm_class.id]
+        columns.append(getattr(orm_class, PARENT_KEYS[level]) if level in PARENT_KEYS else orm_class.id)
+        columns += [getattr(orm_class, name) for name in NATURAL_KEYS[level] + CONTENT_FIELDS[level]]
+
+        query = self.db.query(*columns)
+        if self.source != MAIN:
+            # 상위 레벨을 JOIN하여 버전 필터 (레벨당 1쿼리)
+            index = LEVELS.index(level)
+            for child_index in range(index, 0, -1):
+                child = self.tree[LEVELS[child_index]]
+                parent = self.tree[LEVELS[child_index - 1]]
+                query = query.join(parent, getattr(child, PARENT_KEYS[LEVELS[child_index]]) == parent.id)
+            query = query.filter(StagingBrandORM.version_id == self.source)
+        return query.order_by(orm_class.id).execution_options(yield_per=YIELD_PER)
+
+
+def _content_hash(values: tuple) -> str:
+    return hashlib.blake2b(repr(values).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _index_level(
+    side: _Side,
+    level: str,
+    parent_paths: Dict[int, tuple]
+) -> Tuple[Dict[int, tuple], Dict[tuple, tuple]]:
+    """
+    한 레벨을 조회하여 (id → 자연키 경로, 자연키 경로 → (id, 내용, 해시)) 반환
+
+    같은 부모 아래 자연키가 중복되면 순번을 붙여 구분한다.
+    """
+    key_count = len(NATURAL_KEYS[level])
+    paths: Dict[int, tuple] = {}
+    entries: Dict[tuple, tuple] = {}
+    for row in side.rows(level):
+        entity_id, parent_id = row[0], row[1]
+        if level in PARENT_KEYS:
+            parent_path = parent_paths.get(parent_id)
+            if parent_path is None:
+                continue
+        else:
+            parent_path = ()
+        label = _key_label(row[2:2 + key_count])
+        content = tuple(serialize_value(value) for value in row[2 + key_count:])
+        path = parent_path + (label,)
+        occurrence = 1
+        while path in entries:
+            occurrence += 1
+            path = parent_path + (f"{label}#{occurrence}",)
+        paths[entity_id] = path
+        entries[path] = (entity_id, content, _content_hash(content))
+    return paths, entries
+
+
+def _key_label(natural_key) -> str:
+    """자연키 컬럼값을 경로 요소 문자열로 변환 (옵션: "[카테고리] 이름")"""
+    if len(natural_key) == 1:
+        return str(natural_key[0])
+    category, name = natural_key
+    return f"[{category}] {name}" if category else str(name)
+
+
+def _describe(level: str, path: tuple, entity_id: int, content: tuple) -> dict:
+    item = {"path": list(path), "id": entity_id}
+    for name, value in zip(CONTENT_FIELDS[level], content):
+        if name in PRICE_FIELDS.get(level, ()):
+            item[name] = value
+    return item
+
+
+def diff_catalogs(db: Session, base, target, limit: Optional[int] = 500) -> dict:
+    """
+    base → target 변경 사항 계산
+
+    base/target: 스테이징 버전 ID 또는 "main"
+    limit: 레벨·구분(added/removed/changed)별 반환 항목 수 상한 (건수 합계는 항상 전체 기준)
+    """
+    base_side, target_side = _Side(db, base), _Side(db, target)
+    base_paths: Dict[int, tuple] = {}
+    target_paths: Dict[int, tuple] = {}
+    result = {"base": base, "target": target, "summary": {}}
+
+    for level in LEVELS:
+        base_paths, base_entries = _index_level(base_side, level, base_paths)
+        target_paths, target_entries = _index_level(target_side, level, target_paths)
+
+        added, removed, changed = [], [], []
+        added_count = removed_count = changed_count = unchanged_count = 0
+
+        for path, (target_id, target_content, target_hash) in target_entries.items():
+            base_entry = base_entries.get(path)
+            if base_entry is None:
+                added_count += 1
+                if limit is None or len(added) < limit:
+                    added.append(_describe(level, path, target_id, target_content))
+                continue
+            base_id, base_content, base_hash = base_entry
+            if base_hash == target_hash:
+                unchanged_count += 1
+                continue
+            changed_count += 1
+            if limit is not None and len(changed) >= limit:
+                continue
+            fields = {}
+            price_delta = {}
+            for name, old, new in zip(CONTENT_FIELDS[level], base_content, target_content):
+                if old == new:
+                    continue
+                fields[name] = {"from": old, "to": new}
+                if name in PRICE_FIELDS.get(level, ()) and old is not None and new is not None:
+                    price_delta[name] = new - old
+            changed.append({
+                "path": list(path),
+                "base_id": base_id,
+                "target_id": target_id,
+                "fields": fields,
+                "price_delta": price_delta,
+            })
+
+        for path, (base_id, base_content, _) in base_entries.items():
+            if path not in target_entries:
+                removed_count += 1
+                if limit is None or len(removed) < limit:
+                    removed.append(_describe(level, path, base_id, base_content))
+
+        key = RESULT_KEYS[level]
+        result["summary"][key] = {
+            "added": added_count,
+            "removed": removed_count,
+            "changed": changed_count,
+            "unchanged": unchanged_count,
+        }
+        result[key] = {"added": added, "removed": removed, "changed": changed}
+
+    return result
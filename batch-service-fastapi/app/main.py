@@ -1,26 +1,60 @@
 """
 FastAPI Main Application - Hexagonal Architecture + Celery
+
+라우터 모듈은 기동 시 모두 import 하지만, 무거운 의존성(pandas/openpyxl - 엑셀 파싱, pyarrow - Arrow 응답,
+Celery 태스크 모듈)은 사용하는 함수 안에서만 import 한다. 기동 후 이들이 로드되어 있으면 리포트에 경고를 남긴다.
 """
+import importlib
+import sys
+import time
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .infrastructure.database import Base, engine
-from .presentation.api.car import brands
-from .presentation.api.car import models, trims
-from .presentation.api.betch import excel, jobs
-from .presentation.api.staging_car import staging, versions
-from .presentation.api.staging_car import simple_search
-from .presentation.api.staging_car.brands import router as staging_brands_router
-from .presentation.api.staging_car.vehicle_lines import router as staging_vehicle_lines_router
-from .presentation.api.staging_car.models import router as staging_models_router
-from .presentation.api.staging_car.trims import router as staging_trims_router
-from .presentation.api.staging_car.options import router as staging_options_router
-from .presentation.api.auth import auth, users, permissions
-from .presentation.api.main_db import router as main_db_router
-from .presentation.api.staging_discount_car import router as discount_router
+from fastapi.middleware.gzip import GZipMiddleware
 from .config import settings
+from .presentation.http_cache import ConditionalGetMiddleware
+
+# 스키마 생성은 import 시점이 아니라 `python -m app.bootstrap` 명령으로 분리
+
+# 라우터 모듈 목록 (등록 순서 유지) - (모듈 경로, 라우터 속성명)
+ROUTER_MODULES = [
+    ("app.presentation.api.auth.auth", "router"),  # ✅ 인증 API (로그인, 회원가입)
+    ("app.presentation.api.auth.users", "router"),  # ✅ 사용자 관리 API
+    ("app.presentation.api.auth.permissions", "router"),  # ✅ 권한 관리 API
+    ("app.presentation.api.car.brands", "router"),
+    ("app.presentation.api.car.models", "router"),
+    ("app.presentation.api.car.trims", "router"),
+    ("app.presentation.api.betch.excel", "router"),
+    ("app.presentation.api.betch.jobs", "router"),  # ✅ 작업 상태 조회 API
+    ("app.presentation.api.staging_car.staging", "router"),  # ✅ Staging 데이터 CRUD & 승인 API
+    ("app.presentation.api.staging_car.versions", "router"),  # ✅ 간단한 버전 관리 API
+    ("app.presentation.api.staging_car.simple_search", "router"),  # ✅ 간단한 검색 API
+    ("app.presentation.api.main_db", "router"),  # ✅ 메인 DB 현황 API
+    ("app.presentation.api.staging_discount_car", "router"),  # ✅ 할인 정책 API
+    ("app.presentation.api.metrics", "router"),  # ✅ 운영 지표 API (연결 풀 등)
+    # Staging CRUD API 라우터들
+    ("app.presentation.api.staging_car.brands", "router"),  # ✅ Staging Brands CRUD API
+    ("app.presentation.api.staging_car.vehicle_lines", "router"),  # ✅ Staging Vehicle Lines CRUD API
+    ("app.presentation.api.staging_car.models", "router"),  # ✅ Staging Models CRUD API
+    ("app.presentation.api.staging_car.trims", "router"),  # ✅ Staging Trims CRUD API
+    ("app.presentation.api.staging_car.options", "router"),  # ✅ Staging Options CRUD API
+]
+
+# 기동 시 로드되지 않아야 하는 무거운 모듈 (사용 시점 import 대상)
+DEFERRED_MODULES = ("pandas", "openpyxl", "pyarrow", "celery")
+
+# 기동 시간 리포트 (모듈별 import 소요 시간, ms)
+STARTUP_REPORT = {"imports": [], "total_ms": 0.0, "deferred_loaded": []}
+
+
+def _load_router(module_path: str, attr: str):
+    """라우터 모듈을 import 하면서 소요 시간을 기록"""
+    started = time.perf_counter()
+    module = importlib.import_module(module_path)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    STARTUP_REPORT["imports"].append({"module": module_path, "ms": round(elapsed_ms, 2)})
+    return getattr(module, attr)
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -29,6 +63,12 @@ app = FastAPI(
     version="2.0.0"
 )
 
+# 조건부 GET (revision 기반 ETag → 304) - CORS 안쪽에 두어 304 응답에도 CORS 헤더 적용
+app.add_middleware(ConditionalGetMiddleware)
+
+# 응답 압축 (1KB 이상, Accept-Encoding: gzip 요청에 한함)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # CORS 설정 (강화)
 app.add_middleware(
     CORSMiddleware,
@@ -39,27 +79,22 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
-# 라우터 등록
-app.include_router(auth.router)  # ✅ 인증 API (로그인, 회원가입)
-app.include_router(users.router)  # ✅ 사용자 관리 API
-app.include_router(permissions.router)  # ✅ 권한 관리 API
-app.include_router(brands.router)
-app.include_router(models.router)
-app.include_router(trims.router)
-app.include_router(excel.router)
-app.include_router(jobs.router)  # ✅ 작업 상태 조회 API
-app.include_router(staging.router)  # ✅ Staging 데이터 CRUD & 승인 API
-app.include_router(versions.router)  # ✅ 간단한 버전 관리 API
-app.include_router(simple_search.router)  # ✅ 간단한 검색 API
-app.include_router(main_db_router)  # ✅ 메인 DB 현황 API
-app.include_router(discount_router)  # ✅ 할인 정책 API
-
-# Staging CRUD API 라우터들
-app.include_router(staging_brands_router)  # ✅ Staging Brands CRUD API
-app.include_router(staging_vehicle_lines_router)  # ✅ Staging Vehicle Lines CRUD API
-app.include_router(staging_models_router)  # ✅ Staging Models CRUD API
-app.include_router(staging_trims_router)  # ✅ Staging Trims CRUD API
-app.include_router(staging_options_router)  # ✅ Staging Options CRUD API
+# 라우터 등록 (import 시간 측정)
+_startup_started = time.perf_counter()
+for _module_path, _attr in ROUTER_MODULES:
+    app.include_router(_load_router(_module_path, _attr))
+STARTUP_REPORT["total_ms"] = round((time.perf_counter() - _startup_started) * 1000, 2)
+STARTUP_REPORT["deferred_loaded"] = [name for name in DEFERRED_MODULES if name in sys.modules]
+
+
+@app.on_event("startup")
+def print_startup_report():
+    """느린 import 순으로 기동 시간 리포트 출력"""
+    print(f"[STARTUP] 라우터 import 총 {STARTUP_REPORT['total_ms']}ms")
+    for item in sorted(STARTUP_REPORT["imports"], key=lambda x: x["ms"], reverse=True)[:10]:
+        print(f"[STARTUP]   {item['ms']:>8.2f}ms  {item['module']}")
+    if STARTUP_REPORT["deferred_loaded"]:
+        print(f"[STARTUP] 경고: 기동 시 무거운 모듈 로드됨 {STARTUP_REPORT['deferred_loaded']}")
 
 
 @app.get("/")
@@ -88,3 +123,13 @@ def health_check():
         "async_tasks": "celery",
         "message_broker": "redis"
     }
+
+
+@app.get("/health/startup")
+def startup_report():
+    """기동 시간 리포트 (모듈별 import 소요 시간)"""
+    return {
+        "total_ms": STARTUP_REPORT["total_ms"],
+        "deferred_loaded": STARTUP_REPORT["deferred_loaded"],
+        "imports": sorted(STARTUP_REPORT["imports"], key=lambda x: x["ms"], reverse=True)
+    }
@@ -11,8 +11,6 @@ from datetime import datetime
 from app.infrastructure.database import get_db
 from app.infrastructure.orm_models import BatchJobORM
 from app.domain.entities import JobStatus, JobType
-from app.tasks.excel_tasks import process_excel_file
-from app.tasks.crawler_tasks import crawl_vehicle_data
 from ...schemas import JobResponse, JobCreateRequest, JobListResponse
 
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
@@ -52,7 +50,8 @@ async def upload_excel_async(
         db.add(job)
         db.commit()
         
-        # Celery Task 실행 (파일 내용을 직접 전달)
+        # Celery Task 실행 (파일 내용을 직접 전달) - 태스크 모듈은 호출 시점에만 로드
+        from app.tasks.excel_tasks import process_excel_file
         task = process_excel_file.delay(contents, job.id)
         
         # Celery Task ID 업데이트
@@ -100,6 +99,7 @@ async def start_crawler_job(
         db.commit()
         
         # Celery Task 실행
+        from app.tasks.crawler_tasks import crawl_vehicle_data
         task = crawl_vehicle_data.delay(request.parameters, job_id)
         
         # Task ID 업데이트
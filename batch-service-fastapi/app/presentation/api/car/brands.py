@@ -2,9 +2,11 @@
 Brand API Router
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from dataclasses import asdict
 from typing import List
 from app.application.use_cases import BrandService
 from app.domain.entities import Brand
+from app.infrastructure.version_cache import bump_main_revision
 from ...dependencies import get_brand_service
 from ...schemas import BrandRequest, BrandResponse
 
@@ -19,7 +21,7 @@ def get_brands(
 ):
     """브랜드 목록 조회"""
     brands = service.get_brands(skip=skip, limit=limit)
-    return [BrandResponse(**brand.__dict__) for brand in brands]
+    return [BrandResponse(**asdict(brand)) for brand in brands]
 
 
 @router.get("/{brand_id}", response_model=BrandResponse)
@@ -31,7 +33,7 @@ def get_brand(
     brand = service.get_brand_by_id(brand_id)
     if not brand:
         raise HTTPException(status_code=404, detail="Brand not found")
-    return BrandResponse(**brand.__dict__)
+    return BrandResponse(**asdict(brand))
 
 
 @router.post("/", response_model=BrandResponse, status_code=status.HTTP_201_CREATED)
@@ -45,7 +47,8 @@ def create_brand(
             name=brand_data.name,
             description=brand_data.description
         )
-        return BrandResponse(**brand.__dict__)
+        bump_main_revision()
+        return BrandResponse(**asdict(brand))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -63,9 +66,10 @@ def update_brand(
             name=brand_data.name,
             description=brand_data.description
         )
+        bump_main_revision()
         if not brand:
             raise HTTPException(status_code=404, detail="Brand not found")
-        return BrandResponse(**brand.__dict__)
+        return BrandResponse(**asdict(brand))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -78,4 +82,5 @@ def delete_brand(
     """브랜드 삭제"""
     success = service.delete_brand(brand_id)
     if not success:
-        raise HTTPException(status_code=404, detail="Brand not found")
\ No newline at end of file
+        raise HTTPException(status_code=404, detail="Brand not found")
+    bump_main_revision()
\ No newline at end of file
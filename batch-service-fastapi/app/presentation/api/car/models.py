@@ -2,9 +2,11 @@
 Model API Router
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from dataclasses import asdict
 from typing import List
 from app.application.use_cases import ModelService
 from app.domain.entities import Model
+from app.infrastructure.version_cache import bump_main_revision
 from ...dependencies import get_model_service
 from ...schemas import ModelRequest, ModelResponse
 
@@ -19,7 +21,7 @@ def get_all_models(
 ):
     """모든 모델 조회"""
     models = service.get_all_models(skip, limit)
-    return [ModelResponse(**m.__dict__) for m in models]
+    return [ModelResponse(**asdict(m)) for m in models]
 
 
 @router.get("/{model_id}", response_model=ModelResponse)
@@ -31,7 +33,7 @@ def get_model(
     model = service.get_model_by_id(model_id)
     if not model:
         raise HTTPException(status_code=404, detail="Model not found")
-    return ModelResponse(**model.__dict__)
+    return ModelResponse(**asdict(model))
 
 
 @router.post("", response_model=ModelResponse, status_code=status.HTTP_201_CREATED)
@@ -43,7 +45,8 @@ def create_model(
     try:
         model = Model(**request.model_dump())
         created_model = service.create_model(model)
-        return ModelResponse(**created_model.__dict__)
+        bump_main_revision()
+        return ModelResponse(**asdict(created_model))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -58,9 +61,10 @@ def update_model(
     try:
         model = Model(**request.model_dump())
         updated_model = service.update_model(model_id, model)
+        bump_main_revision()
         if not updated_model:
             raise HTTPException(status_code=404, detail="Model not found")
-        return ModelResponse(**updated_model.__dict__)
+        return ModelResponse(**asdict(updated_model))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -74,5 +78,6 @@ def delete_model(
     success = service.delete_model(model_id)
     if not success:
         raise HTTPException(status_code=404, detail="Model not found")
+    bump_main_revision()
     return None
 
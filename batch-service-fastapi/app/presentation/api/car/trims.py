@@ -1,10 +1,12 @@
 """
 Trim API Router
 """
+from dataclasses import asdict
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from typing import List, Optional
 from app.application.use_cases import TrimService
 from app.domain.entities import Trim
+from app.infrastructure.version_cache import bump_main_revision
 from ...dependencies import get_trim_service
 from ...schemas import TrimRequest, TrimResponse
 
@@ -20,7 +22,7 @@ def get_all_trims(
 ):
     """모든 트림 조회 (모델 ID로 필터링 가능)"""
     trims = service.get_all_trims(model_id, skip, limit)
-    return [TrimResponse(**t.__dict__) for t in trims]
+    return [TrimResponse(**asdict(t)) for t in trims]
 
 
 @router.get("/{trim_id}", response_model=TrimResponse)
@@ -32,7 +34,7 @@ def get_trim(
     trim = service.get_trim_by_id(trim_id)
     if not trim:
         raise HTTPException(status_code=404, detail="Trim not found")
-    return TrimResponse(**trim.__dict__)
+    return TrimResponse(**asdict(trim))
 
 
 @router.post("", response_model=TrimResponse, status_code=status.HTTP_201_CREATED)
@@ -44,7 +46,8 @@ def create_trim(
     try:
         trim = Trim(**request.model_dump())
         created_trim = service.create_trim(trim)
-        return TrimResponse(**created_trim.__dict__)
+        bump_main_revision()
+        return TrimResponse(**asdict(created_trim))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -59,9 +62,10 @@ def update_trim(
     try:
         trim = Trim(**request.model_dump())
         updated_trim = service.update_trim(trim_id, trim)
+        bump_main_revision()
         if not updated_trim:
             raise HTTPException(status_code=404, detail="Trim not found")
-        return TrimResponse(**updated_trim.__dict__)
+        return TrimResponse(**asdict(updated_trim))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -75,5 +79,6 @@ def delete_trim(
     success = service.delete_trim(trim_id)
     if not success:
         raise HTTPException(status_code=404, detail="Trim not found")
+    bump_main_revision()
     return None
 
@@ -1,13 +1,28 @@
 """
 메인 DB 관련 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from datetime import datetime
+from app.infrastructure.tree_loader import TreeLoader, MAIN_TREE
+from app.infrastructure.version_cache import bump_main_revision
+from app.infrastructure.search_cache import search_cached
+from app.infrastructure.search_metrics import search_telemetry
 from ..dependencies import get_db, get_current_user
+from ..serialization import negotiated
 
 router = APIRouter(prefix="/api/main-db", tags=["main-db"])
 
+# 브랜드 상세 트리 응답 필드 (TreeLoader 레벨별 필드)
+BRAND_DETAIL_TREE_FIELDS = {
+    "brand": ("id", "name", "country", "manager"),
+    "vehicle_line": ("id", "name", "description"),
+    "model": ("id", "name", "code", "description", "release_year", "price", "foreign"),
+    "trim": ("id", "name", "car_type", "fuel_name", "cc", "base_price", "description"),
+    "option": ("id", "name", "code", "description", "price", "discounted_price", "category"),
+}
+
 
 @router.get("/status")
 def get_main_db_status(
@@ -27,25 +42,27 @@ def get_main_db_status(
         trims_count = db.query(TrimORM).count()
         options_count = db.query(OptionORM).count()
         
-        # 브랜드별 상세 정보 조회
-        brands = db.query(BrandORM).all()
-        brands_data = []
-        
-        for brand in brands:
-            vehicle_lines = db.query(VehicleLineORM).filter(VehicleLineORM.brand_id == brand.id).all()
-            models_count_for_brand = 0
-            
-            for vehicle_line in vehicle_lines:
-                models_count_for_brand += db.query(ModelORM).filter(ModelORM.vehicle_line_id == vehicle_line.id).count()
-            
-            brands_data.append({
+        # 브랜드별 상세 정보 조회 (차량 라인/모델 수는 GROUP BY 집계 2쿼리)
+        vehicle_line_counts = dict(
+            db.query(VehicleLineORM.brand_id, func.count(VehicleLineORM.id))
+            .group_by(VehicleLineORM.brand_id).all()
+        )
+        model_counts = dict(
+            db.query(VehicleLineORM.brand_id, func.count(ModelORM.id))
+            .join(ModelORM, ModelORM.vehicle_line_id == VehicleLineORM.id)
+            .group_by(VehicleLineORM.brand_id).all()
+        )
+        brands_data = [
+            {
                 "id": brand.id,
                 "name": brand.name,
                 "country": brand.country,
                 "manager": brand.manager,
-                "vehicle_lines_count": len(vehicle_lines),
-                "models_count": models_count_for_brand
-            })
+                "vehicle_lines_count": vehicle_line_counts.get(brand.id, 0),
+                "models_count": model_counts.get(brand.id, 0)
+            }
+            for brand in db.query(BrandORM.id, BrandORM.name, BrandORM.country, BrandORM.manager).all()
+        ]
         
         # 데이터가 없는 경우 빈 상태 응답
         if brands_count == 0:
@@ -83,6 +100,7 @@ def get_main_db_status(
 
 
 @router.get("/brands/{brand_id}/details")
+@negotiated
 def get_brand_details(
     brand_id: int,
     db: Session = Depends(get_db),
@@ -91,90 +109,15 @@ def get_brand_details(
     """브랜드별 상세 데이터 조회"""
     try:
         print(f"브랜드 {brand_id} 상세 데이터 조회 시작")
-        from app.infrastructure.orm_models import (
-            BrandORM, VehicleLineORM, ModelORM, TrimORM, OptionORM
-        )
         
-        # 브랜드 조회
-        brand = db.query(BrandORM).filter(BrandORM.id == brand_id).first()
-        if not brand:
+        # 브랜드 → 차량 라인 → 모델 → 트림 → 옵션을 레벨당 1쿼리로 조회
+        brands = TreeLoader(db, BRAND_DETAIL_TREE_FIELDS, tree=MAIN_TREE).load("brand", [brand_id])
+        if not brands:
             raise HTTPException(status_code=404, detail="브랜드를 찾을 수 없습니다.")
         
-        print(f"브랜드 찾음: {brand.name}")
-        
-        # 차량 라인별 데이터 조회
-        vehicle_lines = db.query(VehicleLineORM).filter(VehicleLineORM.brand_id == brand_id).all()
-        print(f"차량 라인 {len(vehicle_lines)}개 찾음")
-        vehicle_lines_data = []
-        
-        for vehicle_line in vehicle_lines:
-            print(f"차량 라인 처리 중: {vehicle_line.name}")
-            # 모델 조회
-            models = db.query(ModelORM).filter(ModelORM.vehicle_line_id == vehicle_line.id).all()
-            print(f"모델 {len(models)}개 찾음")
-            models_data = []
-            
-            for model in models:
-                print(f"모델 처리 중: {model.name}")
-                # 트림 조회
-                trims = db.query(TrimORM).filter(TrimORM.model_id == model.id).all()
-                print(f"트림 {len(trims)}개 찾음")
-                trims_data = []
-                
-                for trim in trims:
-                    print(f"트림 처리 중: {trim.name}")
-                    # 옵션 조회
-                    options = db.query(OptionORM).filter(OptionORM.trim_id == trim.id).all()
-                    print(f"옵션 {len(options)}개 찾음")
-                    options_data = []
-                    
-                    for option in options:
-                        options_data.append({
-                            "id": option.id,
-                            "name": option.name,
-                            "code": option.code,
-                            "description": option.description,
-                            "price": option.price,
-                            "discounted_price": option.discounted_price,
-                            "category": option.category
-                        })
-                    
-                    trims_data.append({
-                        "id": trim.id,
-                        "name": trim.name,
-                        "car_type": trim.car_type,
-                        "fuel_name": trim.fuel_name,
-                        "cc": trim.cc,
-                        "base_price": trim.base_price,
-                        "description": trim.description,
-                        "options": options_data
-                    })
-                
-                models_data.append({
-                    "id": model.id,
-                    "name": model.name,
-                    "code": model.code,
-                    "description": model.description,
-                    "release_year": model.release_year,
-                    "price": model.price,
-                    "foreign": model.foreign,
-                    "trims": trims_data
-                })
-            
-            vehicle_lines_data.append({
-                "id": vehicle_line.id,
-                "name": vehicle_line.name,
-                "description": vehicle_line.description,
-                "models": models_data
-            })
-        
-        result = {
-            "id": brand.id,
-            "name": brand.name,
-            "country": brand.country,
-            "manager": brand.manager,
-            "vehicle_lines": vehicle_lines_data
-        }
+        result = brands[0]
+        vehicle_lines_data = result["vehicle_lines"]
+        print(f"브랜드 찾음: {result['name']}")
         
         print(f"브랜드 {brand_id} 상세 데이터 조회 완료: {len(vehicle_lines_data)}개 차량 라인")
         return result
@@ -189,82 +132,43 @@ def get_brand_details(
 
 
 @router.get("/search")
+@search_telemetry("main-search")
+@negotiated
+@search_cached("main-search", key=lambda kwargs: f"{kwargs['q'].lower()}|{kwargs['limit']}")
 def search_main_db(
     q: str,
+    limit: int = Query(100, ge=1, le=1000, description="레벨별 검색 결과 개수 제한"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """메인 DB 검색"""
     try:
-        from app.infrastructure.orm_models import (
-            BrandORM, VehicleLineORM, ModelORM, TrimORM, OptionORM
-        )
+        from app.infrastructure.catalog_search import search_level
         
         if not q or len(q.strip()) < 2:
             return {"results": []}
         
-        search_query = f"%{q.strip()}%"
+        # 레벨별 1쿼리 - 상위 레벨(브랜드/라인/모델/트림) 이름을 같은 행으로 조회
+        # (FULLTEXT 백엔드는 MATCH ... AGAINST 관련도 순, 그 밖에는 LIKE)
         results = []
-        
-        # 모델 검색
-        models = db.query(ModelORM).join(VehicleLineORM).join(BrandORM).filter(
-            ModelORM.name.ilike(search_query)
-        ).all()
-        
-        for model in models:
-            vehicle_line = db.query(VehicleLineORM).filter(VehicleLineORM.id == model.vehicle_line_id).first()
-            brand = db.query(BrandORM).filter(BrandORM.id == vehicle_line.brand_id).first()
-            
-            results.append({
-                "type": "model",
-                "id": model.id,
-                "name": model.name,
-                "brand": brand.name,
-                "vehicle_line": vehicle_line.name,
-                "details": f"{brand.name} • {vehicle_line.name}"
-            })
-        
-        # 트림 검색
-        trims = db.query(TrimORM).join(ModelORM).join(VehicleLineORM).join(BrandORM).filter(
-            TrimORM.name.ilike(search_query)
-        ).all()
-        
-        for trim in trims:
-            model = db.query(ModelORM).filter(ModelORM.id == trim.model_id).first()
-            vehicle_line = db.query(VehicleLineORM).filter(VehicleLineORM.id == model.vehicle_line_id).first()
-            brand = db.query(BrandORM).filter(BrandORM.id == vehicle_line.brand_id).first()
-            
-            results.append({
-                "type": "trim",
-                "id": trim.id,
-                "name": trim.name,
-                "brand": brand.name,
-                "model": model.name,
-                "vehicle_line": vehicle_line.name,
-                "details": f"{brand.name} • {model.name} • {vehicle_line.name}"
-            })
-        
-        # 옵션 검색
-        options = db.query(OptionORM).join(TrimORM).join(ModelORM).join(VehicleLineORM).join(BrandORM).filter(
-            OptionORM.name.ilike(search_query)
-        ).all()
-        
-        for option in options:
-            trim = db.query(TrimORM).filter(TrimORM.id == option.trim_id).first()
-            model = db.query(ModelORM).filter(ModelORM.id == trim.model_id).first()
-            vehicle_line = db.query(VehicleLineORM).filter(VehicleLineORM.id == model.vehicle_line_id).first()
-            brand = db.query(BrandORM).filter(BrandORM.id == vehicle_line.brand_id).first()
-            
-            results.append({
-                "type": "option",
-                "id": option.id,
-                "name": option.name,
-                "brand": brand.name,
-                "model": model.name,
-                "trim": trim.name,
-                "vehicle_line": vehicle_line.name,
-                "details": f"{brand.name} • {model.name} • {trim.name} • {vehicle_line.name}"
-            })
+        for level in ("model", "trim", "option"):
+            for item in search_level(db, level, {level: q.strip()}, limit):
+                result = {
+                    "type": level,
+                    "id": item["id"],
+                    "name": item["name"],
+                    "brand": item["brand_name"],
+                    "vehicle_line": item["vehicle_line_name"],
+                    "relevance": item["relevance"]
+                }
+                if level != "model":
+                    result["model"] = item["model_name"]
+                if level == "option":
+                    result["trim"] = item["trim_name"]
+                result["details"] = " • ".join(
+                    result[key] for key in ("brand", "model", "trim", "vehicle_line") if key in result
+                )
+                results.append(result)
         
         return {"results": results}
         
@@ -291,6 +195,7 @@ def create_brand(
         )
         db.add(new_brand)
         db.commit()
+        bump_main_revision()
         db.refresh(new_brand)
         
         return {"id": new_brand.id, "message": "브랜드가 생성되었습니다."}
@@ -328,6 +233,7 @@ def update_brand(
         brand.updated_at = datetime.utcnow()
         
         db.commit()
+        bump_main_revision()
         db.refresh(brand)
         
         return {
@@ -370,6 +276,7 @@ def delete_brand(
         
         db.delete(brand)
         db.commit()
+        bump_main_revision()
         return {"message": "브랜드가 삭제되었습니다."}
     except HTTPException:
         raise
@@ -395,6 +302,7 @@ def create_vehicle_line(
         )
         db.add(new_vehicle_line)
         db.commit()
+        bump_main_revision()
         db.refresh(new_vehicle_line)
         
         return {"id": new_vehicle_line.id, "message": "차량 라인이 생성되었습니다."}
@@ -430,6 +338,7 @@ def update_vehicle_line(
         vehicle_line.updated_at = datetime.utcnow()
         
         db.commit()
+        bump_main_revision()
         db.refresh(vehicle_line)
         
         return {
@@ -472,6 +381,7 @@ def delete_vehicle_line(
         
         db.delete(vehicle_line)
         db.commit()
+        bump_main_revision()
         return {"message": "차량 라인이 삭제되었습니다."}
     except HTTPException:
         raise
@@ -501,6 +411,7 @@ def create_model(
         )
         db.add(new_model)
         db.commit()
+        bump_main_revision()
         db.refresh(new_model)
         
         return {"id": new_model.id, "message": "모델이 생성되었습니다."}
@@ -560,6 +471,7 @@ def update_model(
         model.updated_at = datetime.utcnow()
         
         db.commit()
+        bump_main_revision()
         db.refresh(model)
         
         return {
@@ -606,6 +518,7 @@ def delete_model(
         
         db.delete(model)
         db.commit()
+        bump_main_revision()
         return {"message": "모델이 삭제되었습니다."}
     except HTTPException:
         raise
@@ -635,6 +548,7 @@ def create_trim(
         )
         db.add(new_trim)
         db.commit()
+        bump_main_revision()
         db.refresh(new_trim)
         
         return {"id": new_trim.id, "message": "트림이 생성되었습니다."}
@@ -686,6 +600,7 @@ def update_trim(
         trim.updated_at = datetime.utcnow()
         
         db.commit()
+        bump_main_revision()
         db.refresh(trim)
         
         return {
@@ -732,6 +647,7 @@ def delete_trim(
         
         db.delete(trim)
         db.commit()
+        bump_main_revision()
         return {"message": "트림이 삭제되었습니다."}
     except HTTPException:
         raise
@@ -761,6 +677,7 @@ def create_option(
         )
         db.add(new_option)
         db.commit()
+        bump_main_revision()
         db.refresh(new_option)
         
         return {"id": new_option.id, "message": "옵션이 생성되었습니다."}
@@ -820,6 +737,7 @@ def update_option(
         option.updated_at = datetime.utcnow()
         
         db.commit()
+        bump_main_revision()
         db.refresh(option)
         
         return {
@@ -866,6 +784,7 @@ def delete_option(
         
         db.delete(option)
         db.commit()
+        bump_main_revision()
         return {"message": "옵션이 삭제되었습니다."}
     except HTTPException:
         raise
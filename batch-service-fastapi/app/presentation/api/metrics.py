@@ -0,0 +1,40 @@
+"""
+Metrics API - 운영 지표 조회
+"""
+from fastapi import APIRouter, HTTPException
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+@router.get("/db-pool")
+def get_db_pool_metrics():
+    """DB 연결 풀 지표 (현재 상태, 대기 시간/사용량 히스토그램, connect/invalidate 카운트)"""
+    try:
+        from app.infrastructure.database import engine, pool_profile
+        from app.infrastructure.pool_metrics import get_pool_snapshot
+
+        return get_pool_snapshot(engine, pool_profile)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"연결 풀 지표 조회 실패: {str(e)}")
+
+
+@router.get("/search-cache")
+def get_search_cache_metrics():
+    """검색 응답 캐시 지표 (항목 수, 로컬/Redis 적중, 실패, 축출, 적중률)"""
+    try:
+        from app.infrastructure.search_cache import search_cache
+
+        return search_cache.snapshot()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"검색 캐시 지표 조회 실패: {str(e)}")
+
+
+@router.get("/search")
+def get_search_metrics(top: int = 20):
+    """검색 지표 (엔드포인트별 전체/DB/직렬화 시간, 쿼리 수, 느린 검색, 결과 0건 검색어)"""
+    try:
+        from app.infrastructure.search_metrics import search_metrics
+
+        return search_metrics.snapshot(top=top)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"검색 지표 조회 실패: {str(e)}")
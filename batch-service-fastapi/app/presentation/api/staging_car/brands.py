@@ -10,6 +10,10 @@ from datetime import datetime
 from app.infrastructure.database import get_db
 from app.infrastructure.orm_models import StagingBrandORM
 from app.presentation.dependencies import get_current_user
+from app.infrastructure.projections import list_columns, to_dicts
+from app.infrastructure.tree_loader import find_version_id
+from app.infrastructure.version_cache import bump_revision
+from .pagination import paginate, invalidate_count_cache
 
 router = APIRouter(prefix="/api/staging/brands", tags=["staging-brands"])
 
@@ -19,40 +23,30 @@ def get_staging_brands(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     version_id: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None, description="키셋 커서 (빈 값이면 cursor 모드 첫 페이지)"),
+    include_total: bool = Query(True, description="총 개수 포함 여부 (캐시 사용)"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """스테이징 브랜드 목록 조회"""
     try:
-        query = db.query(StagingBrandORM)
+        # 응답에 필요한 컬럼만 조회 (ORM 객체 하이드레이션 생략)
+        query = db.query(*list_columns(StagingBrandORM))
         
         if version_id:
             query = query.filter(StagingBrandORM.version_id == version_id)
         
-        total_count = query.count()
-        brands = query.offset(skip).limit(limit).all()
+        brands, page = paginate(
+            query, StagingBrandORM, StagingBrandORM.version_id,
+            skip, limit, cursor, include_total, parent_id=version_id
+        )
         
         return {
-            "items": [
-                {
-                    "id": brand.id,
-                    "name": brand.name,
-                    "country": brand.country,
-                    "logo_url": brand.logo_url,
-                    "manager": brand.manager,
-                    "version_id": brand.version_id,
-                    "created_by": brand.created_by,
-                    "created_by_username": brand.created_by_username,
-                    "created_by_email": brand.created_by_email,
-                    "created_at": brand.created_at.isoformat() if brand.created_at else None,
-                    "updated_at": brand.updated_at.isoformat() if brand.updated_at else None
-                }
-                for brand in brands
-            ],
-            "total_count": total_count,
-            "skip": skip,
-            "limit": limit
+            "items": to_dicts(brands),
+            **page
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"브랜드 목록 조회 실패: {str(e)}")
 
@@ -113,6 +107,8 @@ def create_staging_brand(
         
         db.add(new_brand)
         db.commit()
+        invalidate_count_cache(StagingBrandORM.__tablename__)
+        bump_revision(find_version_id(db, "brand", new_brand.id))
         db.refresh(new_brand)
         
         return {
@@ -164,6 +160,7 @@ def update_staging_brand(
         brand.updated_at = datetime.utcnow()
         
         db.commit()
+        bump_revision(find_version_id(db, "brand", brand.id))
         db.refresh(brand)
         
         return {
@@ -204,8 +201,11 @@ def delete_staging_brand(
                 detail="브랜드를 찾을 수 없습니다"
             )
         
+        version_id = find_version_id(db, "brand", brand.id)
         db.delete(brand)
         db.commit()
+        invalidate_count_cache(StagingBrandORM.__tablename__)
+        bump_revision(version_id)
         
         return {
             "success": True,
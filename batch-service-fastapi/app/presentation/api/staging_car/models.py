@@ -8,8 +8,12 @@ from typing import List, Optional
 from datetime import datetime
 
 from app.infrastructure.database import get_db
-from app.infrastructure.orm_models import StagingModelORM
+from app.infrastructure.orm_models import StagingModelORM, StagingVehicleLineORM
 from app.presentation.dependencies import get_current_user
+from app.infrastructure.projections import list_columns, to_dicts
+from app.infrastructure.tree_loader import find_version_id
+from app.infrastructure.version_cache import bump_revision
+from .pagination import paginate, invalidate_count_cache
 
 router = APIRouter(prefix="/api/staging/models", tags=["staging-models"])
 
@@ -19,41 +23,32 @@ def get_staging_models(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     vehicle_line_id: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None, description="키셋 커서 (빈 값이면 cursor 모드 첫 페이지)"),
+    include_total: bool = Query(True, description="총 개수 포함 여부 (캐시 사용)"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """스테이징 모델 목록 조회"""
     try:
-        query = db.query(StagingModelORM)
+        # 응답에 필요한 컬럼만 조회 (brand_id는 차량 라인에서 가져옴)
+        query = db.query(*list_columns(StagingModelORM), StagingVehicleLineORM.brand_id).join(
+            StagingVehicleLineORM, StagingModelORM.vehicle_line_id == StagingVehicleLineORM.id
+        )
         
         if vehicle_line_id:
             query = query.filter(StagingModelORM.vehicle_line_id == vehicle_line_id)
         
-        total_count = query.count()
-        models = query.offset(skip).limit(limit).all()
+        models, page = paginate(
+            query, StagingModelORM, StagingModelORM.vehicle_line_id,
+            skip, limit, cursor, include_total, parent_id=vehicle_line_id
+        )
         
         return {
-            "items": [
-                {
-                    "id": model.id,
-                    "name": model.name,
-                    "code": model.code,
-                    "price": model.price,
-                    "foreign": model.foreign,
-                    "vehicle_line_id": model.vehicle_line_id,
-                    "brand_id": model.brand_id,
-                    "created_by": model.created_by,
-                    "created_by_username": model.created_by_username,
-                    "created_by_email": model.created_by_email,
-                    "created_at": model.created_at.isoformat() if model.created_at else None,
-                    "updated_at": model.updated_at.isoformat() if model.updated_at else None
-                }
-                for model in models
-            ],
-            "total_count": total_count,
-            "skip": skip,
-            "limit": limit
+            "items": to_dicts(models),
+            **page
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"모델 목록 조회 실패: {str(e)}")
 
@@ -120,6 +115,8 @@ def create_staging_model(
         
         db.add(new_model)
         db.commit()
+        invalidate_count_cache(StagingModelORM.__tablename__)
+        bump_revision(find_version_id(db, "model", new_model.id))
         db.refresh(new_model)
         
         return {
@@ -187,6 +184,7 @@ def update_staging_model(
         model.updated_at = datetime.utcnow()
         
         db.commit()
+        bump_revision(find_version_id(db, "model", model.id))
         db.refresh(model)
         
         return {
@@ -228,8 +226,11 @@ def delete_staging_model(
                 detail="모델을 찾을 수 없습니다"
             )
         
+        version_id = find_version_id(db, "model", model.id)
         db.delete(model)
         db.commit()
+        invalidate_count_cache(StagingModelORM.__tablename__)
+        bump_revision(version_id)
         
         return {
             "success": True,
@@ -10,6 +10,10 @@ from datetime import datetime
 from app.infrastructure.database import get_db
 from app.infrastructure.orm_models import StagingOptionORM
 from app.presentation.dependencies import get_current_user
+from app.infrastructure.projections import list_columns, to_dicts
+from app.infrastructure.tree_loader import find_version_id
+from app.infrastructure.version_cache import bump_revision
+from .pagination import paginate, invalidate_count_cache
 
 router = APIRouter(prefix="/api/staging/options", tags=["staging-options"])
 
@@ -19,42 +23,30 @@ def get_staging_options(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     trim_id: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None, description="키셋 커서 (빈 값이면 cursor 모드 첫 페이지)"),
+    include_total: bool = Query(True, description="총 개수 포함 여부 (캐시 사용)"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """스테이징 옵션 목록 조회"""
     try:
-        query = db.query(StagingOptionORM)
+        # 응답에 필요한 컬럼만 조회 (ORM 객체 하이드레이션 생략)
+        query = db.query(*list_columns(StagingOptionORM))
         
         if trim_id:
             query = query.filter(StagingOptionORM.trim_id == trim_id)
         
-        total_count = query.count()
-        options = query.offset(skip).limit(limit).all()
+        options, page = paginate(
+            query, StagingOptionORM, StagingOptionORM.trim_id,
+            skip, limit, cursor, include_total, parent_id=trim_id
+        )
         
         return {
-            "items": [
-                {
-                    "id": option.id,
-                    "name": option.name,
-                    "code": option.code,
-                    "description": option.description,
-                    "category": option.category,
-                    "price": option.price,
-                    "discounted_price": option.discounted_price,
-                    "trim_id": option.trim_id,
-                    "created_by": option.created_by,
-                    "created_by_username": option.created_by_username,
-                    "created_by_email": option.created_by_email,
-                    "created_at": option.created_at.isoformat() if option.created_at else None,
-                    "updated_at": option.updated_at.isoformat() if option.updated_at else None
-                }
-                for option in options
-            ],
-            "total_count": total_count,
-            "skip": skip,
-            "limit": limit
+            "items": to_dicts(options),
+            **page
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"옵션 목록 조회 실패: {str(e)}")
 
@@ -126,6 +118,8 @@ def create_staging_option(
         
         db.add(new_option)
         db.commit()
+        invalidate_count_cache(StagingOptionORM.__tablename__)
+        bump_revision(find_version_id(db, "option", new_option.id))
         db.refresh(new_option)
         
         return {
@@ -208,6 +202,7 @@ def update_staging_option(
         option.updated_at = datetime.utcnow()
         
         db.commit()
+        bump_revision(find_version_id(db, "option", option.id))
         db.refresh(option)
         
         return {
@@ -254,8 +249,11 @@ def delete_staging_option(
                 detail="옵션을 찾을 수 없습니다"
             )
         
+        version_id = find_version_id(db, "option", option.id)
         db.delete(option)
         db.commit()
+        invalidate_count_cache(StagingOptionORM.__tablename__)
+        bump_revision(version_id)
         
         return {
             "success": True,
@@ -0,0 +1,116 @@
+"""
+Staging 목록 페이지네이션 헬퍼
+- offset 모드: 기존 skip/limit
+- cursor 모드: (parent_id, id) 키셋 + 불투명 next_cursor
+- total_count: 선택적, 짧은 TTL 캐시 사용 (깊은 페이지도 첫 페이지와 동일 비용)
+  캐시 키에 전체 스테이징 revision을 포함하므로 다른 프로세스(엑셀 임포트 워커, 복제, 승인 등)의
+  쓰기도 bump_revision()만 호출하면 다음 조회부터 반영된다.
+"""
+import base64
+import json
+import threading
+import time
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+from app.infrastructure.version_cache import get_staging_revision
+
+# 목록 총 개수 캐시 TTL (초)
+COUNT_CACHE_TTL = 30
+
+_count_cache = {}
+_count_cache_lock = threading.Lock()
+
+
+def encode_cursor(parent_id: int, last_id: int) -> str:
+    """(parent_id, id)를 불투명 커서 문자열로 인코딩"""
+    raw = json.dumps([parent_id, last_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """커서 문자열을 (parent_id, id)로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parent_id, last_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return int(parent_id), int(last_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+
+def cached_count(query, cache_key: tuple) -> int:
+    """query.count() 결과를 짧은 TTL 동안 캐시 (스테이징 revision이 바뀌면 새로 계산)"""
+    cache_key = cache_key + (get_staging_revision(),)
+    now = time.monotonic()
+    with _count_cache_lock:
+        cached = _count_cache.get(cache_key)
+        if cached and cached[1] > now:
+            return cached[0]
+    total_count = query.count()
+    with _count_cache_lock:
+        # 만료된 항목 정리 (이전 revision 키도 TTL 이후 제거됨)
+        for key in [k for k, v in _count_cache.items() if v[1] <= now]:
+            del _count_cache[key]
+        _count_cache[cache_key] = (total_count, now + COUNT_CACHE_TTL)
+    return total_count
+
+
+def invalidate_count_cache(table_name: str):
+    """해당 테이블의 총 개수 캐시 무효화 (생성/삭제 시 호출)"""
+    with _count_cache_lock:
+        for key in [k for k in _count_cache if k[0] == table_name]:
+            del _count_cache[key]
+
+
+def paginate(
+    query,
+    orm_class,
+    parent_column,
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+    include_total: bool,
+    parent_id: Optional[int] = None
+) -> Tuple[list, dict]:
+    """
+    목록 조회 (offset 또는 cursor 모드)
+    
+    cursor가 None이면 offset 모드, 빈 문자열이면 cursor 모드 첫 페이지.
+    반환: (rows, 페이지 메타 정보)
+    """
+    total_count = None
+    if include_total:
+        total_count = cached_count(query, (orm_class.__tablename__, parent_id))
+
+    if cursor is None:
+        rows = query.order_by(parent_column, orm_class.id).offset(skip).limit(limit).all()
+        return rows, {"total_count": total_count, "skip": skip, "limit": limit}
+
+    if cursor:
+        last_parent_id, last_id = decode_cursor(cursor)
+        if parent_id:
+            # 부모가 고정되어 있으면 id만 비교
+            query = query.filter(orm_class.id > last_id)
+        else:
+            query = query.filter(or_(
+                parent_column > last_parent_id,
+                and_(parent_column == last_parent_id, orm_class.id > last_id)
+            ))
+
+    # limit + 1개 조회로 다음 페이지 존재 여부 판단 (추가 count 쿼리 없음)
+    rows = query.order_by(parent_column, orm_class.id).limit(limit + 1).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_next and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, parent_column.key), last.id)
+
+    return rows, {
+        "total_count": total_count,
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "has_next": has_next
+    }
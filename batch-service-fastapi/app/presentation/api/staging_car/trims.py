@@ -10,6 +10,10 @@ from datetime import datetime
 from app.infrastructure.database import get_db
 from app.infrastructure.orm_models import StagingTrimORM
 from app.presentation.dependencies import get_current_user
+from app.infrastructure.projections import list_columns, to_dicts
+from app.infrastructure.tree_loader import find_version_id
+from app.infrastructure.version_cache import bump_revision
+from .pagination import paginate, invalidate_count_cache
 
 router = APIRouter(prefix="/api/staging/trims", tags=["staging-trims"])
 
@@ -19,41 +23,30 @@ def get_staging_trims(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     model_id: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None, description="키셋 커서 (빈 값이면 cursor 모드 첫 페이지)"),
+    include_total: bool = Query(True, description="총 개수 포함 여부 (캐시 사용)"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """스테이징 트림 목록 조회"""
     try:
-        query = db.query(StagingTrimORM)
+        # 응답에 필요한 컬럼만 조회 (ORM 객체 하이드레이션 생략)
+        query = db.query(*list_columns(StagingTrimORM))
         
         if model_id:
             query = query.filter(StagingTrimORM.model_id == model_id)
         
-        total_count = query.count()
-        trims = query.offset(skip).limit(limit).all()
+        trims, page = paginate(
+            query, StagingTrimORM, StagingTrimORM.model_id,
+            skip, limit, cursor, include_total, parent_id=model_id
+        )
         
         return {
-            "items": [
-                {
-                    "id": trim.id,
-                    "name": trim.name,
-                    "car_type": trim.car_type,
-                    "fuel_name": trim.fuel_name,
-                    "cc": trim.cc,
-                    "base_price": trim.base_price,
-                    "model_id": trim.model_id,
-                    "created_by": trim.created_by,
-                    "created_by_username": trim.created_by_username,
-                    "created_by_email": trim.created_by_email,
-                    "created_at": trim.created_at.isoformat() if trim.created_at else None,
-                    "updated_at": trim.updated_at.isoformat() if trim.updated_at else None
-                }
-                for trim in trims
-            ],
-            "total_count": total_count,
-            "skip": skip,
-            "limit": limit
+            "items": to_dicts(trims),
+            **page
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"트림 목록 조회 실패: {str(e)}")
 
@@ -120,6 +113,8 @@ def create_staging_trim(
         
         db.add(new_trim)
         db.commit()
+        invalidate_count_cache(StagingTrimORM.__tablename__)
+        bump_revision(find_version_id(db, "trim", new_trim.id))
         db.refresh(new_trim)
         
         return {
@@ -189,6 +184,7 @@ def update_staging_trim(
         trim.updated_at = datetime.utcnow()
         
         db.commit()
+        bump_revision(find_version_id(db, "trim", trim.id))
         db.refresh(trim)
         
         return {
@@ -227,8 +223,11 @@ def delete_staging_trim(
                 detail="트림을 찾을 수 없습니다"
             )
         
+        version_id = find_version_id(db, "trim", trim.id)
         db.delete(trim)
         db.commit()
+        invalidate_count_cache(StagingTrimORM.__tablename__)
+        bump_revision(version_id)
         
         return {
             "success": True,
@@ -10,6 +10,10 @@ from datetime import datetime
 from app.infrastructure.database import get_db
 from app.infrastructure.orm_models import StagingVehicleLineORM
 from app.presentation.dependencies import get_current_user
+from app.infrastructure.projections import list_columns, to_dicts
+from app.infrastructure.tree_loader import find_version_id
+from app.infrastructure.version_cache import bump_revision
+from .pagination import paginate, invalidate_count_cache
 
 router = APIRouter(prefix="/api/staging/vehicle-lines", tags=["staging-vehicle-lines"])
 
@@ -19,38 +23,30 @@ def get_staging_vehicle_lines(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     brand_id: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None, description="키셋 커서 (빈 값이면 cursor 모드 첫 페이지)"),
+    include_total: bool = Query(True, description="총 개수 포함 여부 (캐시 사용)"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """스테이징 자동차 라인 목록 조회"""
     try:
-        query = db.query(StagingVehicleLineORM)
+        # 응답에 필요한 컬럼만 조회 (ORM 객체 하이드레이션 생략)
+        query = db.query(*list_columns(StagingVehicleLineORM))
         
         if brand_id:
             query = query.filter(StagingVehicleLineORM.brand_id == brand_id)
         
-        total_count = query.count()
-        vehicle_lines = query.offset(skip).limit(limit).all()
+        vehicle_lines, page = paginate(
+            query, StagingVehicleLineORM, StagingVehicleLineORM.brand_id,
+            skip, limit, cursor, include_total, parent_id=brand_id
+        )
         
         return {
-            "items": [
-                {
-                    "id": vehicle_line.id,
-                    "name": vehicle_line.name,
-                    "description": vehicle_line.description,
-                    "brand_id": vehicle_line.brand_id,
-                    "created_by": vehicle_line.created_by,
-                    "created_by_username": vehicle_line.created_by_username,
-                    "created_by_email": vehicle_line.created_by_email,
-                    "created_at": vehicle_line.created_at.isoformat() if vehicle_line.created_at else None,
-                    "updated_at": vehicle_line.updated_at.isoformat() if vehicle_line.updated_at else None
-                }
-                for vehicle_line in vehicle_lines
-            ],
-            "total_count": total_count,
-            "skip": skip,
-            "limit": limit
+            "items": to_dicts(vehicle_lines),
+            **page
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"자동차 라인 목록 조회 실패: {str(e)}")
 
@@ -109,6 +105,8 @@ def create_staging_vehicle_line(
         
         db.add(new_vehicle_line)
         db.commit()
+        invalidate_count_cache(StagingVehicleLineORM.__tablename__)
+        bump_revision(find_version_id(db, "vehicle_line", new_vehicle_line.id))
         db.refresh(new_vehicle_line)
         
         return {
@@ -158,6 +156,7 @@ def update_staging_vehicle_line(
         vehicle_line.updated_at = datetime.utcnow()
         
         db.commit()
+        bump_revision(find_version_id(db, "vehicle_line", vehicle_line.id))
         db.refresh(vehicle_line)
         
         return {
@@ -198,8 +197,11 @@ def delete_staging_vehicle_line(
                 detail="자동차 라인을 찾을 수 없습니다"
             )
         
+        version_id = find_version_id(db, "vehicle_line", vehicle_line.id)
         db.delete(vehicle_line)
         db.commit()
+        invalidate_count_cache(StagingVehicleLineORM.__tablename__)
+        bump_revision(version_id)
         
         return {
             "success": True,
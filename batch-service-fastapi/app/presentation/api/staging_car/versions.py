@@ -17,11 +17,72 @@ from app.infrastructure.database import get_db
 from app.infrastructure.repositories import SQLAlchemyStagingVersionRepository
 from app.infrastructure.orm_models import BatchJobORM
 from app.domain.entities import StagingVersion, JobStatus, JobType
+from app.infrastructure.projections import (
+    columns, to_dicts,
+    BRAND_FIELDS, VEHICLE_LINE_FIELDS, MODEL_FIELDS, TRIM_FIELDS, OPTION_FIELDS
+)
+from app.infrastructure.tree_loader import (
+    TreeLoader, FULL_AUDIT_FIELDS, LEVELS, PARENT_KEYS, STAGING_TREE, find_version_id
+)
+from app.infrastructure.version_cache import bump_revision, version_snapshot, bump_main_revision
 from app.presentation.dependencies import get_current_user
-from app.tasks.excel_tasks import process_excel_file
+from app.presentation.serialization import negotiated
+from app.infrastructure.search_cache import search_cached
+from app.infrastructure.search_metrics import search_telemetry
+from app.infrastructure.search_query import search_cache_key, search_echo
+from app.infrastructure.trim_facets import facet_filters
 
 router = APIRouter(prefix="/api/versions", tags=["versions"])
 
+# ===== 트리 응답 필드 (TreeLoader 레벨별 필드) =====
+VEHICLE_LINE_TREE_FIELDS = {
+    "vehicle_line": ("id", "name", "description", "brand_id"),
+    "model": ("id", "name", "code", "release_year", "price", "foreign") + FULL_AUDIT_FIELDS,
+    "trim": ("id", "name", "description", "car_type", "fuel_name", "cc", "base_price") + FULL_AUDIT_FIELDS,
+    "option": ("id", "name", "code", "description", "category", "price", "discounted_price") + FULL_AUDIT_FIELDS,
+}
+
+BRAND_TREE_FIELDS = {
+    "brand": ("id", "name", "country", "logo_url", "manager", "created_at"),
+    "vehicle_line": ("id", "name", "description"),
+    "model": ("id", "name", "code", "release_year", "price", "foreign"),
+    "trim": ("id", "name", "car_type", "fuel_name", "cc", "base_price", "description"),
+    "option": ("id", "name", "code", "price", "discounted_price", "category", "created_at"),
+}
+
+FILTERED_TREE_FIELDS = {
+    "brand": ("id", "name", "country", "logo_url") + FULL_AUDIT_FIELDS,
+    "vehicle_line": ("id", "name") + FULL_AUDIT_FIELDS,
+    "model": ("id", "name", "code", "price", "foreign") + FULL_AUDIT_FIELDS,
+    "trim": ("id", "name", "car_type", "fuel_name", "cc", "base_price") + FULL_AUDIT_FIELDS,
+    "option": ("id", "name", "code", "description", "category", "price", "discounted_price") + FULL_AUDIT_FIELDS,
+}
+
+SEARCH_TREE_FIELDS = {
+    "brand": ("id", "name"),
+    "vehicle_line": ("id", "name"),
+    "model": ("id", "name"),
+    "trim": ("id", "name", "base_price"),
+    "option": ("id", "name", "price"),
+}
+
+# 레벨별 탐색(browse) 응답 필드
+BROWSE_FIELDS = {
+    "brand": BRAND_FIELDS,
+    "vehicle_line": VEHICLE_LINE_FIELDS,
+    "model": MODEL_FIELDS,
+    "trim": TRIM_FIELDS,
+    "option": OPTION_FIELDS,
+}
+
+SEARCH_FILTERED_TREE_FIELDS = {
+    "brand": ("id", "name"),
+    "vehicle_line": ("id", "name"),
+    "model": ("id", "name"),
+    "trim": ("id", "name"),
+    "option": ("id", "name"),
+}
+
 
 @router.get("/")
 def get_versions(
@@ -107,6 +168,78 @@ def get_versions(
         raise HTTPException(status_code=500, detail=f"버전 목록 조회 실패: {str(e)}")
 
 
+# 정적 경로는 "/{version_id}"보다 먼저 선언 (경로 파라미터에 먼저 매칭되지 않도록)
+@router.get("/search-performance-info")
+def get_search_performance_info(db: Session = Depends(get_db)):
+    """검색 성능 정보 조회"""
+    try:
+        from sqlalchemy import text
+        
+        # 인덱스 정보 조회 (MySQL information_schema - 8.0은 컬럼명을 대문자로 반환하므로 별칭 지정)
+        index_query = text("""
+            SELECT 
+                table_name AS table_name,
+                index_name AS index_name,
+                index_type AS index_type,
+                non_unique AS non_unique,
+                GROUP_CONCAT(column_name ORDER BY seq_in_index) AS columns
+            FROM information_schema.statistics 
+            WHERE table_schema = DATABASE()
+            AND table_name LIKE 'staging\\_%'
+            GROUP BY table_name, index_name, index_type, non_unique
+            ORDER BY table_name, index_name
+        """)
+        
+        result = db.execute(index_query)
+        indexes = [dict(row._mapping) for row in result.fetchall()]
+        
+        # 테이블별 행 수 조회
+        table_stats_query = text("""
+            SELECT 
+                'staging_brand' as table_name,
+                COUNT(*) as row_count
+            FROM staging_brand
+            UNION ALL
+            SELECT 
+                'staging_vehicle_line' as table_name,
+                COUNT(*) as row_count
+            FROM staging_vehicle_line
+            UNION ALL
+            SELECT 
+                'staging_model' as table_name,
+                COUNT(*) as row_count
+            FROM staging_model
+            UNION ALL
+            SELECT 
+                'staging_trim' as table_name,
+                COUNT(*) as row_count
+            FROM staging_trim
+            UNION ALL
+            SELECT 
+                'staging_option' as table_name,
+                COUNT(*) as row_count
+            FROM staging_option
+        """)
+        
+        stats_result = db.execute(table_stats_query)
+        table_stats = [dict(row._mapping) for row in stats_result.fetchall()]
+        
+        from app.config import settings
+        from app.infrastructure.search_metrics import search_metrics
+        
+        return {
+            "indexes": indexes,
+            "table_stats": table_stats,
+            "total_indexes": len(indexes),
+            "search_backend": settings.search_backend,
+            "search_optimized": any(index["index_type"] == "FULLTEXT" for index in indexes),
+            "telemetry": search_metrics.snapshot(top=10)
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"성능 정보 조회 실패: {str(e)}")
+
+
 @router.get("/{version_id}")
 def get_version(
     version_id: int,
@@ -185,6 +318,70 @@ def create_version(
         raise HTTPException(status_code=500, detail=f"버전 생성 실패: {str(e)}")
 
 
+@router.post("/{version_id}/clone")
+def clone_version(
+    version_id: int,
+    version_data: dict,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    버전 복제 - 기존 버전의 전체 스테이징 데이터(할인 정책 포함)를 새 버전으로 복사
+
+    엑셀 재업로드 없이 다음 달 가격 작업을 시작할 때 사용한다. (서버 측 INSERT ... SELECT, 단일 트랜잭션)
+    """
+    try:
+        from app.infrastructure.orm_models import StagingVersionORM
+        from app.infrastructure.version_clone import clone_version as clone_version_data
+
+        version_name = version_data.get('name') or version_data.get('version_name')
+        if not version_name:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="버전명은 필수입니다"
+            )
+
+        source = db.query(StagingVersionORM.id, StagingVersionORM.version_name).filter(
+            StagingVersionORM.id == version_id
+        ).first()
+        if not source:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="버전을 찾을 수 없습니다"
+            )
+        if db.query(StagingVersionORM.id).filter(StagingVersionORM.version_name == version_name).first():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 존재하는 버전명입니다"
+            )
+
+        started = datetime.now()
+        new_version, counts = clone_version_data(
+            db,
+            source_version_id=version_id,
+            version_name=version_name,
+            description=version_data.get('description') or f"{source.version_name} 복제본",
+            user=current_user
+        )
+        elapsed = (datetime.now() - started).total_seconds()
+        bump_revision(new_version.id)  # 목록 총 개수 캐시 무효화 (스테이징 revision 증가)
+        print(f"[DEBUG] 버전 복제 완료: {version_id} → {new_version.id} ({elapsed:.2f}초) {counts}")
+
+        return {
+            "id": new_version.id,
+            "version_name": new_version.version_name,
+            "description": new_version.description,
+            "approval_status": new_version.approval_status.value if new_version.approval_status else None,
+            "source_version_id": version_id,
+            "copied": counts,
+            "elapsed_seconds": round(elapsed, 3)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"버전 복제 실패: {str(e)}")
+
+
 @router.put("/{version_id}")
 def update_version(
     version_id: int,
@@ -221,6 +418,7 @@ def update_version(
         # updated_at은 자동으로 업데이트됨
         
         updated_version = version_repo.update(version_id, existing_version)
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         
         return {
             "success": True,
@@ -259,6 +457,7 @@ def delete_version(
             )
         
         version_repo.delete(version_id)
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         return {"message": "버전이 성공적으로 삭제되었습니다"}
     except HTTPException:
         raise
@@ -270,6 +469,8 @@ def delete_version(
 
 # 자동차 라인별 전체 데이터 조회 - 무한스크롤용 (각 자동차 라인의 모든 브랜드/모델/트림/옵션 포함)
 @router.get("/{version_id}/vehicle-lines-with-full-data")
+@negotiated
+@version_snapshot("vehicle-lines-with-full-data", params=("page", "limit"))
 def get_vehicle_lines_with_full_data(
     version_id: int, 
     page: int = Query(1, ge=1, description="페이지 번호"),
@@ -301,7 +502,7 @@ def get_vehicle_lines_with_full_data(
 
         # 2. 페이지네이션을 사용하여 자동차 라인 목록 가져오기 (브랜드를 통해 조회)
         skip = (page - 1) * limit
-        vehicle_lines_list = db.query(StagingVehicleLineORM).join(StagingBrandORM).filter(StagingBrandORM.version_id == version_id).offset(skip).limit(limit).all()
+        vehicle_lines_list = db.query(StagingVehicleLineORM.id).join(StagingBrandORM).filter(StagingBrandORM.version_id == version_id).order_by(StagingVehicleLineORM.id).offset(skip).limit(limit).all()
         
         # 페이지네이션 정보 계산
         total_pages = (total_vehicle_lines_count + limit - 1) // limit
@@ -334,118 +535,31 @@ def get_vehicle_lines_with_full_data(
                 }
             }
         
-        # 3. 각 자동차 라인의 브랜드, 모델, 트림, 옵션 데이터 가져오기
-        print(f"[DEBUG] 자동라인 ID 목록: {[vl.id for vl in vehicle_lines_list]}")
+        # 3. 자동차 라인 → 모델 → 트림 → 옵션을 레벨당 1쿼리로 조회
+        vehicle_line_ids = [row.id for row in vehicle_lines_list]
+        print(f"[DEBUG] 자동라인 ID 목록: {vehicle_line_ids}")
         
-        vehicle_lines_data = []
-        total_brands = 0
-        total_models = 0
-        total_trims = 0
-        total_options = 0
+        loader = TreeLoader(db, VEHICLE_LINE_TREE_FIELDS)
+        vehicle_lines_data = loader.load("vehicle_line", vehicle_line_ids)
         
-        for vehicle_line in vehicle_lines_list:
-            # 자동차 라인 기본 정보
-            vehicle_line_data = {
-                "id": vehicle_line.id,
-                "name": vehicle_line.name,
-                "description": vehicle_line.description,
-                "brand": None,  # 자동차 라인은 하나의 브랜드에만 속함
-                "models": []
-            }
-            
-            # 해당 자동차 라인의 브랜드 조회 (자동차 라인은 하나의 브랜드에만 속함)
-            brand = db.query(StagingBrandORM).filter(StagingBrandORM.id == vehicle_line.brand_id).first()
-            
-            if brand:
-                vehicle_line_data["brand"] = {
-                    "id": brand.id,
-                    "name": brand.name,
-                    "country": brand.country,
-                    "logo_url": brand.logo_url,
-                    "manager": brand.manager,
-                    "created_by": brand.created_by,
-                    "created_by_username": brand.created_by_username,
-                    "created_by_email": brand.created_by_email,
-                    "created_at": brand.created_at.isoformat() if brand.created_at else None,
-                    "updated_by_username": brand.updated_by_username,
-                    "updated_by_email": brand.updated_by_email,
-                    "updated_at": brand.updated_at.isoformat() if brand.updated_at else None
-                }
+        # 자동차 라인의 브랜드 조회 (자동차 라인은 하나의 브랜드에만 속함) - 1쿼리
+        brand_ids = {vl["brand_id"] for vl in vehicle_lines_data}
+        brands_by_id = {
+            row["id"]: row
+            for row in to_dicts(db.query(
+                *columns(StagingBrandORM, ("id", "name", "country", "logo_url", "manager") + FULL_AUDIT_FIELDS)
+            ).filter(StagingBrandORM.id.in_(brand_ids)).all())
+        } if brand_ids else {}
+        
+        total_brands = 0
+        for vehicle_line_data in vehicle_lines_data:
+            vehicle_line_data["brand"] = brands_by_id.get(vehicle_line_data.pop("brand_id"))
+            if vehicle_line_data["brand"]:
                 total_brands += 1
-            
-            # 해당 자동차 라인의 모델들 조회
-            models_list = db.query(StagingModelORM).filter(StagingModelORM.vehicle_line_id == vehicle_line.id).all()
-           
-            for model in models_list:
-                model_data = {
-                    "id": model.id,
-                    "name": model.name,
-                    "code": model.code,
-                    "release_year": model.release_year,
-                    "price": model.price,
-                    "foreign": model.foreign,
-                    "created_by": model.created_by,
-                    "created_by_username": model.created_by_username,
-                    "created_by_email": model.created_by_email,
-                    "created_at": model.created_at.isoformat() if model.created_at else None,
-                    "updated_by_username": model.updated_by_username,
-                    "updated_by_email": model.updated_by_email,
-                    "updated_at": model.updated_at.isoformat() if model.updated_at else None,
-                    "trims": []
-                }
-                total_models += 1
-                
-                # 해당 모델의 트림들 조회
-                trims_list = db.query(StagingTrimORM).filter(StagingTrimORM.model_id == model.id).all()
-                
-                for trim in trims_list:
-                    trim_data = {
-                        "id": trim.id,
-                        "name": trim.name,
-                        "description": trim.description,
-                        "car_type": trim.car_type,
-                        "fuel_name": trim.fuel_name,
-                        "cc": trim.cc,
-                        "base_price": trim.base_price,
-                        "created_by": trim.created_by,
-                        "created_by_username": trim.created_by_username,
-                        "created_by_email": trim.created_by_email,
-                        "created_at": trim.created_at.isoformat() if trim.created_at else None,
-                        "updated_by_username": trim.updated_by_username,
-                        "updated_by_email": trim.updated_by_email,
-                        "updated_at": trim.updated_at.isoformat() if trim.updated_at else None,
-                        "options": []
-                    }
-                    total_trims += 1
-                    
-                    # 해당 트림의 옵션들 조회
-                    options_list = db.query(StagingOptionORM).filter(StagingOptionORM.trim_id == trim.id).all()
-
-                    for option in options_list:
-                        option_data = {
-                            "id": option.id,
-                            "name": option.name,
-                            "code": option.code,
-                            "description": option.description,
-                            "category": option.category,
-                            "price": option.price,
-                            "discounted_price": option.discounted_price,
-                            "created_by": option.created_by,
-                            "created_by_username": option.created_by_username,
-                            "created_by_email": option.created_by_email,
-                            "created_at": option.created_at.isoformat() if option.created_at else None,
-                            "updated_by_username": option.updated_by_username,
-                            "updated_by_email": option.updated_by_email,
-                            "updated_at": option.updated_at.isoformat() if option.updated_at else None
-                        }
-                        trim_data["options"].append(option_data)
-                        total_options += 1
-                    
-                    model_data["trims"].append(trim_data)
-                
-                vehicle_line_data["models"].append(model_data)
-            
-            vehicle_lines_data.append(vehicle_line_data)
+        
+        total_models = loader.counts.get("model", 0)
+        total_trims = loader.counts.get("trim", 0)
+        total_options = loader.counts.get("option", 0)
         
         print(f"[DEBUG] 데이터 통계 - 브랜드: {total_brands}, 모델: {total_models}, 트림: {total_trims}, 옵션: {total_options}")
         
@@ -481,6 +595,8 @@ def get_vehicle_lines_with_full_data(
 
 # 브랜드별 전체 데이터 조회 (모델/트림/옵션 포함)
 @router.get("/{version_id}/brands-with-full-data")
+@negotiated
+@version_snapshot("brands-with-full-data", params=("brand_name", "page", "limit"))
 def get_brands_with_full_data(
     version_id: int,
     brand_name: Optional[str] = Query(None, description="브랜드명 필터"),
@@ -515,87 +631,12 @@ def get_brands_with_full_data(
         # 전체 브랜드 수 계산
         total_brands = brand_query.count()
         
-        # 페이지네이션 적용
+        # 페이지네이션 적용 (현재 페이지의 브랜드 ID만 조회)
         offset = (page - 1) * limit
-        brands = brand_query.offset(offset).limit(limit).all()
+        brand_ids = [row.id for row in brand_query.with_entities(StagingBrandORM.id).order_by(StagingBrandORM.id).offset(offset).limit(limit).all()]
         
-        brands_data = []
-        for brand in brands:
-            # 해당 브랜드의 모든 차량 라인 조회
-            vehicle_lines = db.query(StagingVehicleLineORM).filter(
-                StagingVehicleLineORM.brand_id == brand.id
-            ).all()
-            
-            vehicle_lines_data = []
-            for vehicle_line in vehicle_lines:
-                # 해당 차량 라인의 모든 모델 조회
-                models = db.query(StagingModelORM).filter(
-                    StagingModelORM.vehicle_line_id == vehicle_line.id
-                ).all()
-                
-                models_data = []
-                for model in models:
-                    # 해당 모델의 모든 트림 조회
-                    trims = db.query(StagingTrimORM).filter(
-                        StagingTrimORM.model_id == model.id
-                    ).all()
-                    
-                    trims_data = []
-                    for trim in trims:
-                        # 해당 트림의 모든 옵션 조회
-                        options = db.query(StagingOptionORM).filter(
-                            StagingOptionORM.trim_id == trim.id
-                        ).all()
-                        
-                        options_data = []
-                        for option in options:
-                            options_data.append({
-                                "id": option.id,
-                                "name": option.name,
-                                "code": option.code,
-                                "price": option.price,
-                                "discounted_price": option.discounted_price,
-                                "category": option.category,
-                                "created_at": option.created_at.isoformat() if option.created_at else None
-                            })
-                        
-                        trims_data.append({
-                            "id": trim.id,
-                            "name": trim.name,
-                            "car_type": trim.car_type,
-                            "fuel_name": trim.fuel_name,
-                            "cc": trim.cc,
-                            "base_price": trim.base_price,
-                            "description": trim.description,
-                            "options": options_data
-                        })
-                    
-                    models_data.append({
-                        "id": model.id,
-                        "name": model.name,
-                        "code": model.code,
-                        "release_year": model.release_year,
-                        "price": model.price,
-                        "foreign": model.foreign,
-                        "trims": trims_data
-                    })
-                
-                vehicle_lines_data.append({
-                    "id": vehicle_line.id,
-                    "name": vehicle_line.name,
-                    "description": vehicle_line.description,
-                    "models": models_data
-                })
-            
-            brands_data.append({
-                "id": brand.id,
-                "name": brand.name,
-                "country": brand.country,
-                "logo_url": brand.logo_url,
-                "manager": brand.manager,
-                "vehicle_lines": vehicle_lines_data,
-                "created_at": brand.created_at.isoformat() if brand.created_at else None
-            })
+        # 브랜드 → 차량 라인 → 모델 → 트림 → 옵션을 레벨당 1쿼리로 조회
+        brands_data = TreeLoader(db, BRAND_TREE_FIELDS).load("brand", brand_ids)
         
         # 페이지네이션 정보 계산
         total_pages = (total_brands + limit - 1) // limit
@@ -625,6 +666,8 @@ def get_brands_with_full_data(
 
 # 디버깅용: 버전의 모든 브랜드 목록 조회
 @router.get("/{version_id}/brands-summary")
+@negotiated
+@version_snapshot("brands-summary")
 def get_brands_summary(
     version_id: int,
     db: Session = Depends(get_db)
@@ -643,18 +686,10 @@ def get_brands_summary(
                 detail="버전을 찾을 수 없습니다"
             )
         
-        # 해당 버전의 모든 브랜드 조회
-        brands = db.query(StagingBrandORM).filter(StagingBrandORM.version_id == version_id).all()
-        
-        brands_summary = []
-        for brand in brands:
-            brands_summary.append({
-                "id": brand.id,
-                "name": brand.name,
-                "country": brand.country,
-                "manager": brand.manager,
-                "created_at": brand.created_at.isoformat() if brand.created_at else None
-            })
+        # 해당 버전의 모든 브랜드 조회 (필요한 컬럼만)
+        brands_summary = to_dicts(db.query(
+            *columns(StagingBrandORM, ("id", "name", "country", "manager", "created_at"))
+        ).filter(StagingBrandORM.version_id == version_id).all())
         
         return {
             "version": {
@@ -690,18 +725,17 @@ def get_brands_list(
                 detail="버전을 찾을 수 없습니다"
             )
         
-        # 해당 버전의 모든 브랜드 조회
-        brands = db.query(StagingBrandORM).filter(
+        # 해당 버전의 모든 브랜드 조회 (필요한 컬럼만)
+        brands = to_dicts(db.query(
+            *columns(StagingBrandORM, ("id", "name", "country"))
+        ).filter(
             StagingBrandORM.version_id == version_id
-        ).all()
+        ).all())
         
         return {
             "version_id": version_id,
             "version_name": version.version_name,
-            "brands": [
-                {"id": b.id, "name": b.name, "country": b.country}
-                for b in brands
-            ],
+            "brands": brands,
             "total": len(brands)
         }
     except HTTPException:
@@ -744,19 +778,18 @@ def get_brand_vehicle_lines(
                 detail="브랜드를 찾을 수 없습니다"
             )
         
-        # 해당 브랜드의 모든 Vehicle Line 조회
-        vehicle_lines = db.query(StagingVehicleLineORM).filter(
+        # 해당 브랜드의 모든 Vehicle Line 조회 (필요한 컬럼만)
+        vehicle_lines = to_dicts(db.query(
+            *columns(StagingVehicleLineORM, ("id", "name", "description"))
+        ).filter(
             StagingVehicleLineORM.brand_id == brand_id
-        ).all()
+        ).all())
         
         return {
             "version_id": version_id,
             "brand_id": brand_id,
             "brand_name": brand.name,
-            "vehicle_lines": [
-                {"id": vl.id, "name": vl.name, "description": vl.description}
-                for vl in vehicle_lines
-            ],
+            "vehicle_lines": vehicle_lines,
             "total": len(vehicle_lines)
         }
     except HTTPException:
@@ -799,8 +832,12 @@ def get_brand_trims(
                 detail="브랜드를 찾을 수 없습니다"
             )
         
-        # 해당 브랜드의 모든 트림 조회 (JOIN with model)
-        trims_data = db.query(StagingTrimORM, StagingModelORM).join(
+        # 해당 브랜드의 모든 트림 조회 (JOIN with model, 필요한 컬럼만)
+        trims_result = to_dicts(db.query(
+            StagingTrimORM.id, StagingTrimORM.name,
+            StagingModelORM.name.label("model_name"),
+            StagingTrimORM.car_type, StagingTrimORM.fuel_name, StagingTrimORM.base_price
+        ).join(
             StagingModelORM, StagingTrimORM.model_id == StagingModelORM.id
         ).join(
             StagingVehicleLineORM, StagingModelORM.vehicle_line_id == StagingVehicleLineORM.id
@@ -809,19 +846,7 @@ def get_brand_trims(
         ).filter(
             StagingBrandORM.version_id == version_id,
             StagingBrandORM.id == brand_id
-        ).all()
-        
-        # 트림 데이터 구성
-        trims_result = []
-        for trim, model in trims_data:
-            trims_result.append({
-                "id": trim.id,
-                "name": trim.name,
-                "model_name": model.name if model else None,
-                "car_type": trim.car_type.value if hasattr(trim.car_type, 'value') else str(trim.car_type),
-                "fuel_name": trim.fuel_name,
-                "base_price": trim.base_price
-            })
+        ).all())
         
         return {
             "version_id": version_id,
@@ -891,24 +916,16 @@ def get_vehicle_line_trims(
                 detail="Vehicle Line을 찾을 수 없습니다"
             )
         
-        # 해당 Vehicle Line의 모든 트림 조회 (JOIN with model)
-        trims_data = db.query(StagingTrimORM, StagingModelORM).join(
+        # 해당 Vehicle Line의 모든 트림 조회 (JOIN with model, 필요한 컬럼만)
+        trims_result = to_dicts(db.query(
+            StagingTrimORM.id, StagingTrimORM.name,
+            StagingModelORM.name.label("model_name"),
+            StagingTrimORM.car_type, StagingTrimORM.fuel_name, StagingTrimORM.base_price
+        ).join(
             StagingModelORM, StagingTrimORM.model_id == StagingModelORM.id
         ).filter(
             StagingModelORM.vehicle_line_id == vehicle_line_id
-        ).all()
-        
-        # 트림 데이터 구성
-        trims_result = []
-        for trim, model in trims_data:
-            trims_result.append({
-                "id": trim.id,
-                "name": trim.name,
-                "model_name": model.name if model else None,
-                "car_type": trim.car_type.value if hasattr(trim.car_type, 'value') else str(trim.car_type),
-                "fuel_name": trim.fuel_name,
-                "base_price": trim.base_price
-            })
+        ).all())
         
         return {
             "version_id": version_id,
@@ -935,7 +952,85 @@ def get_vehicle_line_trims(
         raise HTTPException(status_code=500, detail=f"Vehicle Line 트림 목록 조회 실패: {str(e)}")
 
 
+@router.get("/{version_id}/browse")
+def browse_version_level(
+    version_id: int,
+    level: str = Query("brand", description="조회 레벨 (brand, vehicle_line, model, trim, option)"),
+    parent_id: Optional[int] = Query(None, description="부모 ID (brand 레벨 외 필수)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (첫 페이지는 생략)"),
+    limit: int = Query(50, ge=1, le=500, description="페이지 크기"),
+    include_total: bool = Query(False, description="총 개수 포함 여부"),
+    db: Session = Depends(get_db)
+):
+    """
+    카탈로그 레벨별 탐색 - 트리 뷰의 노드 펼치기용
+
+    한 번에 한 레벨만 조회하고 각 항목의 하위 개수(child_count)를 함께 반환한다.
+    (페이지 조회 1쿼리 + 하위 개수 GROUP BY 1쿼리)
+    """
+    try:
+        from sqlalchemy import func
+        from .pagination import paginate
+
+        if level not in LEVELS:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 레벨입니다: {level}")
+
+        orm_class = STAGING_TREE[level]
+        if level == "brand":
+            parent_column = orm_class.version_id
+            parent_value = version_id
+        else:
+            if parent_id is None:
+                raise HTTPException(status_code=400, detail="parent_id가 필요합니다")
+            parent_level = LEVELS[LEVELS.index(level) - 1]
+            if find_version_id(db, parent_level, parent_id) != version_id:
+                raise HTTPException(status_code=404, detail="부모 항목을 찾을 수 없습니다")
+            parent_column = getattr(orm_class, PARENT_KEYS[level])
+            parent_value = parent_id
+
+        query = db.query(*columns(orm_class, BROWSE_FIELDS[level])).filter(parent_column == parent_value)
+        rows, page = paginate(
+            query, orm_class, parent_column,
+            skip=0, limit=limit, cursor=cursor or "",
+            include_total=include_total, parent_id=parent_value
+        )
+        items = to_dicts(rows)
+
+        # 하위 개수 (페이지 항목에 대해서만 GROUP BY 1쿼리)
+        child_level = LEVELS[LEVELS.index(level) + 1] if level != LEVELS[-1] else None
+        if child_level and items:
+            child_class = STAGING_TREE[child_level]
+            child_parent = getattr(child_class, PARENT_KEYS[child_level])
+            counts = dict(
+                db.query(child_parent, func.count(child_class.id))
+                .filter(child_parent.in_([item["id"] for item in items]))
+                .group_by(child_parent)
+                .all()
+            )
+            for item in items:
+                item["child_count"] = counts.get(item["id"], 0)
+
+        return {
+            "level": level,
+            "parent_id": parent_value if level != "brand" else None,
+            "child_level": child_level,
+            "items": items,
+            **page
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"카탈로그 탐색 실패: {str(e)}")
+
+
 @router.get("/{version_id}/filtered-data")
+@search_telemetry("filtered-data")
+@negotiated
+@search_cached(
+    "filtered-data",
+    key=lambda kwargs: "&".join(f"{name}={(kwargs.get(name) or '').lower()}" for name in ("brand", "model", "trim")),
+    echo=lambda kwargs: {"filters": {name: kwargs.get(name) for name in ("brand", "model", "trim")}}
+)
 def get_filtered_data(
     version_id: int,
     brand: str = Query(None, description="브랜드명"),
@@ -1022,202 +1117,8 @@ def get_filtered_data(
         
         logger.info(f"[DEBUG] 매칭된 브랜드 ID들: {matching_brand_ids}")
         
-        # 매칭된 브랜드들의 전체 데이터 조회
-        brands_query = text("""
-            SELECT 
-                sb.id as brand_id,
-                sb.name as brand_name,
-                sb.country as brand_country,
-                sb.logo_url as brand_logo_url,
-                sb.created_by as brand_created_by,
-                sb.created_by_username as brand_created_by_username,
-                sb.created_by_email as brand_created_by_email,
-                sb.created_at as brand_created_at,
-                sb.updated_by_username as brand_updated_by_username,
-                sb.updated_by_email as brand_updated_by_email,
-                sb.updated_at as brand_updated_at
-            FROM staging_brand sb
-            WHERE sb.id IN :brand_ids
-            ORDER BY sb.name
-        """)
-        
-        brands_result = db.execute(brands_query, {"brand_ids": tuple(matching_brand_ids)})
-        brands_data = []
-        
-        for brand_row in brands_result.fetchall():
-            # 각 브랜드의 차량라인, 모델, 트림, 옵션 데이터 조회
-            vehicle_lines_query = text("""
-                SELECT 
-                    svl.id as vehicle_line_id,
-                    svl.name as vehicle_line_name,
-                    svl.created_by as vehicle_line_created_by,
-                    svl.created_by_username as vehicle_line_created_by_username,
-                    svl.created_by_email as vehicle_line_created_by_email,
-                    svl.created_at as vehicle_line_created_at,
-                    svl.updated_by_username as vehicle_line_updated_by_username,
-                    svl.updated_by_email as vehicle_line_updated_by_email,
-                    svl.updated_at as vehicle_line_updated_at
-                FROM staging_vehicle_line svl
-                WHERE svl.brand_id = :brand_id
-                ORDER BY svl.name
-            """)
-            
-            vehicle_lines_result = db.execute(vehicle_lines_query, {"brand_id": brand_row.brand_id})
-            vehicle_lines_data = []
-            
-            for vl_row in vehicle_lines_result.fetchall():
-                # 각 차량라인의 모델 데이터 조회
-                models_query = text("""
-                    SELECT 
-                        sm.id as model_id,
-                        sm.name as model_name,
-                        sm.code as model_code,
-                        sm.price as model_price,
-                        sm.foreign as model_foreign,
-                        sm.created_by as model_created_by,
-                        sm.created_by_username as model_created_by_username,
-                        sm.created_by_email as model_created_by_email,
-                        sm.created_at as model_created_at,
-                        sm.updated_by_username as model_updated_by_username,
-                        sm.updated_by_email as model_updated_by_email,
-                        sm.updated_at as model_updated_at
-                    FROM staging_model sm
-                    WHERE sm.vehicle_line_id = :vehicle_line_id
-                    ORDER BY sm.name
-                """)
-                
-                models_result = db.execute(models_query, {"vehicle_line_id": vl_row.vehicle_line_id})
-                models_data = []
-                
-                for model_row in models_result.fetchall():
-                    # 각 모델의 트림 데이터 조회
-                    trims_query = text("""
-                        SELECT 
-                            st.id as trim_id,
-                            st.name as trim_name,
-                            st.car_type as trim_car_type,
-                            st.fuel_name as trim_fuel_name,
-                            st.cc as trim_cc,
-                            st.base_price as trim_base_price,
-                            st.created_by as trim_created_by,
-                            st.created_by_username as trim_created_by_username,
-                            st.created_by_email as trim_created_by_email,
-                            st.created_at as trim_created_at,
-                            st.updated_by_username as trim_updated_by_username,
-                            st.updated_by_email as trim_updated_by_email,
-                            st.updated_at as trim_updated_at
-                        FROM staging_trim st
-                        WHERE st.model_id = :model_id
-                        ORDER BY st.name
-                    """)
-                    
-                    trims_result = db.execute(trims_query, {"model_id": model_row.model_id})
-                    trims_data = []
-                    
-                    for trim_row in trims_result.fetchall():
-                        # 각 트림의 옵션 데이터 조회
-                        options_query = text("""
-                            SELECT 
-                                so.id as option_id,
-                                so.name as option_name,
-                                so.code as option_code,
-                                so.description as option_description,
-                                so.category as option_category,
-                                so.price as option_price,
-                                so.discounted_price as option_discounted_price,
-                                so.created_by as option_created_by,
-                                so.created_by_username as option_created_by_username,
-                                so.created_by_email as option_created_by_email,
-                                so.created_at as option_created_at,
-                                so.updated_by_username as option_updated_by_username,
-                                so.updated_by_email as option_updated_by_email,
-                                so.updated_at as option_updated_at
-                            FROM staging_option so
-                            WHERE so.trim_id = :trim_id
-                            ORDER BY so.name
-                        """)
-                        
-                        options_result = db.execute(options_query, {"trim_id": trim_row.trim_id})
-                        options_data = []
-                        
-                        for option_row in options_result.fetchall():
-                            options_data.append({
-                                "id": option_row.option_id,
-                                "name": option_row.option_name,
-                                "code": option_row.option_code,
-                                "description": option_row.option_description,
-                                "category": option_row.option_category,
-                                "price": option_row.option_price,
-                                "discounted_price": option_row.option_discounted_price,
-                                "created_by": option_row.option_created_by,
-                                "created_by_username": option_row.option_created_by_username,
-                                "created_by_email": option_row.option_created_by_email,
-                                "created_at": option_row.option_created_at.isoformat() if option_row.option_created_at else None,
-                                "updated_by_username": option_row.option_updated_by_username,
-                                "updated_by_email": option_row.option_updated_by_email,
-                                "updated_at": option_row.option_updated_at.isoformat() if option_row.option_updated_at else None
-                            })
-                        
-                        trims_data.append({
-                            "id": trim_row.trim_id,
-                            "name": trim_row.trim_name,
-                            "car_type": trim_row.trim_car_type,
-                            "fuel_name": trim_row.trim_fuel_name,
-                            "cc": trim_row.trim_cc,
-                            "base_price": trim_row.trim_base_price,
-                            "created_by": trim_row.trim_created_by,
-                            "created_by_username": trim_row.trim_created_by_username,
-                            "created_by_email": trim_row.trim_created_by_email,
-                            "created_at": trim_row.trim_created_at.isoformat() if trim_row.trim_created_at else None,
-                            "updated_by_username": trim_row.trim_updated_by_username,
-                            "updated_by_email": trim_row.trim_updated_by_email,
-                            "updated_at": trim_row.trim_updated_at.isoformat() if trim_row.trim_updated_at else None,
-                            "options": options_data
-                        })
-                    
-                    models_data.append({
-                        "id": model_row.model_id,
-                        "name": model_row.model_name,
-                        "code": model_row.model_code,
-                        "price": model_row.model_price,
-                        "foreign": model_row.model_foreign,
-                        "created_by": model_row.model_created_by,
-                        "created_by_username": model_row.model_created_by_username,
-                        "created_by_email": model_row.model_created_by_email,
-                        "created_at": model_row.model_created_at.isoformat() if model_row.model_created_at else None,
-                        "updated_by_username": model_row.model_updated_by_username,
-                        "updated_by_email": model_row.model_updated_by_email,
-                        "updated_at": model_row.model_updated_at.isoformat() if model_row.model_updated_at else None,
-                        "trims": trims_data
-                    })
-                
-                vehicle_lines_data.append({
-                    "id": vl_row.vehicle_line_id,
-                    "name": vl_row.vehicle_line_name,
-                    "created_by": vl_row.vehicle_line_created_by,
-                    "created_by_username": vl_row.vehicle_line_created_by_username,
-                    "created_by_email": vl_row.vehicle_line_created_by_email,
-                    "created_at": vl_row.vehicle_line_created_at.isoformat() if vl_row.vehicle_line_created_at else None,
-                    "updated_by_username": vl_row.vehicle_line_updated_by_username,
-                    "updated_by_email": vl_row.vehicle_line_updated_by_email,
-                    "updated_at": vl_row.vehicle_line_updated_at.isoformat() if vl_row.vehicle_line_updated_at else None,
-                    "models": models_data
-                })
-            
-            brands_data.append({
-                "id": brand_row.brand_id,
-                "name": brand_row.brand_name,
-                "country": brand_row.brand_country,
-                "logo_url": brand_row.brand_logo_url,
-                "created_by": brand_row.brand_created_by,
-                "created_by_username": brand_row.brand_created_by_username,
-                "created_by_email": brand_row.brand_created_by_email,
-                "created_at": brand_row.brand_created_at.isoformat() if brand_row.brand_created_at else None,
-                "updated_by_username": brand_row.brand_updated_by_username,
-                "updated_by_email": brand_row.brand_updated_by_email,
-                "updated_at": brand_row.brand_updated_at.isoformat() if brand_row.brand_updated_at else None,
-                "vehicle_lines": vehicle_lines_data
-            })
+        # 매칭된 브랜드들의 전체 데이터 조회 (레벨당 1쿼리, 이름순)
+        brands_data = TreeLoader(db, FILTERED_TREE_FIELDS, order_by="name").load("brand", matching_brand_ids)
         
         logger.info(f"[DEBUG] 반환할 브랜드 수: {len(brands_data)}")
         
@@ -1240,19 +1141,17 @@ def get_filtered_data(
 
 
 @router.get("/{version_id}/search")
+@search_telemetry("search")
+@negotiated
+@search_cached("search", key=search_cache_key, echo=search_echo)
 def search_version_data(
     version_id: int,
     query: str = Query(..., description="검색어"),
     limit: int = Query(20, description="검색 결과 개수 제한"),
     db: Session = Depends(get_db)
 ):
-    """버전 데이터 검색 - URL 인코딩 자동 처리"""
+    """버전 데이터 검색 (brand:/vehicle_line:/model:/trim: 필터 + 자유 검색어)"""
     try:
-        from app.infrastructure.orm_models import (
-            StagingBrandORM, StagingVehicleLineORM, 
-            StagingModelORM, StagingTrimORM, StagingOptionORM
-        )
-        
         # 버전 존재 확인
         version_repo = SQLAlchemyStagingVersionRepository(db)
         version = version_repo.find_by_id(version_id)
@@ -1263,227 +1162,17 @@ def search_version_data(
             )
         
         print(f"[DEBUG] 검색 시작 - version_id: {version_id}, query: '{query}'")
-        print(f"[DEBUG] 검색어 타입: {type(query)}, 길이: {len(query)}")
-        print(f"[DEBUG] 검색어 바이트: {query.encode('utf-8')}")
-        
-        # URL 디코딩 (완전한 처리)
-        import urllib.parse
-        
-        decoded_query = query
-        
-        try:
-            # 1차: FastAPI 자동 디코딩 (이미 처리됨)
-            # 2차: 수동 디코딩으로 확실히 처리
-            decoded_query = urllib.parse.unquote_plus(query)
-            
-            # 3차: 특수 문자 수동 변환 (완전 보장)
-            decoded_query = decoded_query.replace('%3A', ':')
-            decoded_query = decoded_query.replace('%20', ' ')
-            decoded_query = decoded_query.replace('%2B', '+')
-            decoded_query = decoded_query.replace('%2F', '/')
-            decoded_query = decoded_query.replace('%3F', '?')
-            decoded_query = decoded_query.replace('%26', '&')
-            decoded_query = decoded_query.replace('%3D', '=')
-            
-            # 4차: 한글 인코딩 문제 해결
-            try:
-                decoded_query = decoded_query.encode('utf-8').decode('utf-8')
-            except:
-                pass
-            
-            print(f"[DEBUG] 원본 쿼리: '{query}'")
-            print(f"[DEBUG] 디코딩된 쿼리: '{decoded_query}'")
-            print(f"[DEBUG] 디코딩 성공!")
-            
-        except Exception as e:
-            print(f"[ERROR] URL 디코딩 실패: {e}")
-            # 원본 쿼리에서 특수 문자만 수동 변환
-            decoded_query = query.replace('%3A', ':').replace('%20', ' ')
-            print(f"[DEBUG] 수동 변환된 쿼리: '{decoded_query}'")
-        
-        # 검색어 파싱 (brand:현대, model:아반떼, trim:1.6L 형태 처리)
-        try:
-            search_parts = decoded_query.split()
-            brand_name = None
-            model_name = None
-            trim_name = None
-            vehicle_line_name = None
-            
-            for part in search_parts:
-                if part.startswith('brand:'):
-                    brand_name = part.replace('brand:', '')
-                elif part.startswith('model:'):
-                    model_name = part.replace('model:', '')
-                elif part.startswith('trim:'):
-                    trim_name = part.replace('trim:', '')
-                elif part.startswith('vehicle_line:'):
-                    vehicle_line_name = part.replace('vehicle_line:', '')
-            
-            print(f"[DEBUG] 파싱된 검색어 - brand: {brand_name}, model: {model_name}, trim: {trim_name}, vehicle_line: {vehicle_line_name}")
-            
-        except Exception as e:
-            print(f"[ERROR] 검색어 파싱 실패: {e}")
-            brand_name = None
-            model_name = None
-            trim_name = None
-            vehicle_line_name = None
-        
-        results = []
-        
-        # 1. 브랜드 검색
-        try:
-            if brand_name:
-                # 특정 브랜드 검색
-                print(f"[DEBUG] 특정 브랜드 검색: '{brand_name}'")
-                brand_term = f"%{brand_name}%"
-                brands = db.query(StagingBrandORM).filter(
-                    StagingBrandORM.version_id == version_id,
-                    StagingBrandORM.name.like(brand_term)
-                ).limit(limit).all()
-            else:
-                # 일반 검색어로 브랜드 검색
-                search_term = f"%{decoded_query}%"
-                print(f"[DEBUG] 일반 브랜드 검색 - search_term: '{search_term}'")
-                brands = db.query(StagingBrandORM).filter(
-                    StagingBrandORM.version_id == version_id,
-                    StagingBrandORM.name.like(search_term)
-                ).limit(limit).all()
-        except Exception as e:
-            print(f"[ERROR] 브랜드 검색 실패: {e}")
-            brands = []
-        
-        print(f"[DEBUG] 브랜드 검색 쿼리 결과: {len(brands)}개")
-        for brand in brands:
-            print(f"[DEBUG] 브랜드 발견: {brand.name} (ID: {brand.id})")
-            results.append({
-                "id": brand.id,
-                "name": brand.name,
-                "type": "brand",
-                "match_score": 100,
-                "brand_id": brand.id,
-                "brand_name": brand.name
-            })
-        
-        print(f"[DEBUG] 브랜드 검색 결과: {len(brands)}개")
-        
-        # 2. 모델 검색 (브랜드와 조인)
-        if model_name or brand_name:
-            # 특정 모델 또는 브랜드의 모델 검색
-            query = db.query(StagingModelORM, StagingBrandORM, StagingVehicleLineORM).join(
-                StagingVehicleLineORM, StagingModelORM.vehicle_line_id == StagingVehicleLineORM.id
-            ).join(
-                StagingBrandORM, StagingVehicleLineORM.brand_id == StagingBrandORM.id
-            ).filter(
-                StagingBrandORM.version_id == version_id
-            )
-            
-            if model_name:
-                model_term = f"%{model_name}%"
-                query = query.filter(StagingModelORM.name.like(model_term))
-                print(f"[DEBUG] 특정 모델 검색: '{model_name}'")
-            
-            if brand_name:
-                brand_term = f"%{brand_name}%"
-                query = query.filter(StagingBrandORM.name.like(brand_term))
-                print(f"[DEBUG] 특정 브랜드의 모델 검색: '{brand_name}'")
-            
-            models = query.limit(limit).all()
-        else:
-            # 일반 검색어로 모델 검색
-            search_term = f"%{decoded_query}%"
-            print(f"[DEBUG] 일반 모델 검색 - search_term: '{search_term}'")
-            models = db.query(StagingModelORM, StagingBrandORM, StagingVehicleLineORM).join(
-                StagingVehicleLineORM, StagingModelORM.vehicle_line_id == StagingVehicleLineORM.id
-            ).join(
-                StagingBrandORM, StagingVehicleLineORM.brand_id == StagingBrandORM.id
-            ).filter(
-                StagingBrandORM.version_id == version_id,
-                StagingModelORM.name.like(search_term)
-            ).limit(limit).all()
-        
-        for model, brand, vehicle_line in models:
-            results.append({
-                "id": model.id,
-                "name": model.name,
-                "type": "model",
-                "match_score": 80,
-                "brand_id": brand.id,
-                "brand_name": brand.name,
-                "vehicle_line_id": vehicle_line.id,
-                "vehicle_line_name": vehicle_line.name
-            })
-        
-        print(f"[DEBUG] 모델 검색 결과: {len(models)}개")
-        
-        # 3. 트림 검색 (모델과 조인)
-        if trim_name or model_name or brand_name:
-            # 특정 트림, 모델 또는 브랜드의 트림 검색
-            query = db.query(StagingTrimORM, StagingModelORM, StagingBrandORM, StagingVehicleLineORM).join(
-                StagingModelORM, StagingTrimORM.model_id == StagingModelORM.id
-            ).join(
-                StagingVehicleLineORM, StagingModelORM.vehicle_line_id == StagingVehicleLineORM.id
-            ).join(
-                StagingBrandORM, StagingVehicleLineORM.brand_id == StagingBrandORM.id
-            ).filter(
-                StagingBrandORM.version_id == version_id
-            )
-            
-            if trim_name:
-                trim_term = f"%{trim_name}%"
-                query = query.filter(StagingTrimORM.name.like(trim_term))
-                print(f"[DEBUG] 특정 트림 검색: '{trim_name}'")
-            
-            if model_name:
-                model_term = f"%{model_name}%"
-                query = query.filter(StagingModelORM.name.like(model_term))
-                print(f"[DEBUG] 특정 모델의 트림 검색: '{model_name}'")
-            
-            if brand_name:
-                brand_term = f"%{brand_name}%"
-                query = query.filter(StagingBrandORM.name.like(brand_term))
-                print(f"[DEBUG] 특정 브랜드의 트림 검색: '{brand_name}'")
-            
-            trims = query.limit(limit).all()
-        else:
-            # 일반 검색어로 트림 검색
-            search_term = f"%{decoded_query}%"
-            print(f"[DEBUG] 일반 트림 검색 - search_term: '{search_term}'")
-            trims = db.query(StagingTrimORM, StagingModelORM, StagingBrandORM, StagingVehicleLineORM).join(
-                StagingModelORM, StagingTrimORM.model_id == StagingModelORM.id
-            ).join(
-                StagingVehicleLineORM, StagingModelORM.vehicle_line_id == StagingVehicleLineORM.id
-            ).join(
-                StagingBrandORM, StagingVehicleLineORM.brand_id == StagingBrandORM.id
-            ).filter(
-                StagingBrandORM.version_id == version_id,
-                StagingTrimORM.name.like(search_term)
-            ).limit(limit).all()
-        
-        for trim, model, brand, vehicle_line in trims:
-            results.append({
-                "id": trim.id,
-                "name": trim.name,
-                "type": "trim",
-                "match_score": 70,
-                "model_id": model.id,
-                "model_name": model.name,
-                "brand_id": brand.id,
-                "brand_name": brand.name,
-                "vehicle_line_id": vehicle_line.id,
-                "vehicle_line_name": vehicle_line.name
-            })
-        
-        print(f"[DEBUG] 트림 검색 결과: {len(trims)}개")
         
-        # 4. 옵션 검색 (트림과 조인) - 옵션은 검색하지 않음 (너무 많은 결과)
-        # 옵션 검색은 제외하고 브랜드, 모델, 트림만 검색
-        print(f"[DEBUG] 옵션 검색은 제외됨 (너무 많은 결과)")
+        # 검색어 파싱 (brand:현대 model:아반떼 trim:1.6L 형태, 쿼리 파라미터는 FastAPI가 디코딩함)
+        from app.infrastructure.search_query import parse_search_query
+        from app.infrastructure.catalog_search import search_catalog
         
-        # 결과 정렬 (점수 높은 순)
-        results.sort(key=lambda x: x['match_score'], reverse=True)
+        parsed = parse_search_query(query)
+        print(f"[DEBUG] 파싱된 검색어 - 필터: {parsed.filters}, 일반: {parsed.terms}")
         
-        # 제한된 개수만 반환
-        final_results = results[:limit]
+        # 브랜드/모델/트림 검색 (SQL 백엔드는 UNION 쿼리 1번, 점수 높은 순으로 limit개)
+        # 옵션은 검색하지 않음 (너무 많은 결과)
+        final_results = search_catalog(db, parsed, ("brand", "model", "trim"), limit, version_id)
         
         print(f"[DEBUG] 최종 검색 결과: {len(final_results)}개")
         
@@ -1495,93 +1184,9 @@ def search_version_data(
             elif result['type'] in ['model', 'trim'] and 'brand_id' in result:
                 brand_ids.add(result['brand_id'])
         
-        # 특정 브랜드 검색인 경우 해당 브랜드만 필터링
-        if brand_name and brand_ids:
-            # 특정 브랜드 검색 시 해당 브랜드만 반환
-            print(f"[DEBUG] 특정 브랜드 검색 - 브랜드 ID들: {list(brand_ids)}")
-            brands = db.query(StagingBrandORM).filter(
-                StagingBrandORM.version_id == version_id,
-                StagingBrandORM.id.in_(brand_ids)
-            ).all()
-        elif brand_ids:
-            # 일반 검색 결과의 브랜드들
-            print(f"[DEBUG] 일반 검색 결과 브랜드 ID들: {list(brand_ids)}")
-            brands = db.query(StagingBrandORM).filter(
-                StagingBrandORM.version_id == version_id,
-                StagingBrandORM.id.in_(brand_ids)
-            ).all()
-        else:
-            brands = []
-        
-        # 검색 결과에 포함된 브랜드들의 전체 데이터 조회
-        brands_data = []
-        if brands:
-            
-            # 각 브랜드의 전체 계층 구조 데이터 조회
-            for brand in brands:
-                brand_data = {
-                    "id": brand.id,
-                    "name": brand.name,
-                    "vehicle_lines": []
-                }
-                
-                # 차량라인 조회
-                vehicle_lines = db.query(StagingVehicleLineORM).filter(
-                    StagingVehicleLineORM.brand_id == brand.id
-                ).all()
-                
-                for vl in vehicle_lines:
-                    vl_data = {
-                        "id": vl.id,
-                        "name": vl.name,
-                        "models": []
-                    }
-                    
-                    # 모델 조회
-                    models = db.query(StagingModelORM).filter(
-                        StagingModelORM.vehicle_line_id == vl.id
-                    ).all()
-                    
-                    for model in models:
-                        model_data = {
-                            "id": model.id,
-                            "name": model.name,
-                            "trims": []
-                        }
-                        
-                        # 트림 조회
-                        trims = db.query(StagingTrimORM).filter(
-                            StagingTrimORM.model_id == model.id
-                        ).all()
-                        
-                        for trim in trims:
-                            trim_data = {
-                                "id": trim.id,
-                                "name": trim.name,
-                                "base_price": trim.base_price,
-                                "options": []
-                            }
-                            
-                            # 옵션 조회
-                            options = db.query(StagingOptionORM).filter(
-                                StagingOptionORM.trim_id == trim.id
-                            ).all()
-                            
-                            for option in options:
-                                option_data = {
-                                    "id": option.id,
-                                    "name": option.name,
-                                    "price": option.price
-                                }
-                                trim_data["options"].append(option_data)
-                            
-                            model_data["trims"].append(trim_data)
-                        
-                        vl_data["models"].append(model_data)
-                    
-                    brand_data["vehicle_lines"].append(vl_data)
-                
-                brands_data.append(brand_data)
+        # 검색 결과에 포함된 브랜드들의 전체 계층 구조 데이터 조회 (레벨당 1쿼리)
+        # (brand_ids는 모두 version_id로 필터링된 검색 결과에서 추출됨)
+        brands_data = TreeLoader(db, SEARCH_TREE_FIELDS).load("brand", sorted(brand_ids))
         
         print(f"[DEBUG] 검색 필터링된 브랜드 데이터: {len(brands_data)}개")
         
@@ -1591,35 +1196,223 @@ def search_version_data(
                 "name": version.version_name
             },
             "query": query,
-            "decoded_query": decoded_query,
+            "decoded_query": parsed.raw,
             "parsed_filters": {
-                "brand": brand_name,
-                "model": model_name,
-                "trim": trim_name,
-                "vehicle_line": vehicle_line_name
+                "brand": parsed.filters.get("brand"),
+                "model": parsed.filters.get("model"),
+                "trim": parsed.filters.get("trim"),
+                "vehicle_line": parsed.filters.get("vehicle_line"),
+                "terms": parsed.terms
             },
             "results": final_results,
             "total_count": len(final_results),
             "limit": limit,
-            "brands": brands_data,  # 검색 결과에 맞는 브랜드들의 전체 데이터
-            "filtered_by_search": True,
-            "search_query": decoded_query  # 프론트엔드에서 사용할 검색어
+            "brands": brands_data,  # 검색 결과에 맞는 브랜드들의 전체 데이터
+            "filtered_by_search": True,
+            "search_query": parsed.raw  # 프론트엔드에서 사용할 검색어
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        import traceback
+        error_details = traceback.format_exc()
+        print(f"[ERROR] 검색 API 오류 상세:")
+        print(f"[ERROR] 오류 메시지: {str(e)}")
+        print(f"[ERROR] 오류 타입: {type(e)}")
+        print(f"[ERROR] 스택 트레이스: {error_details}")
+        print(f"[ERROR] 입력 파라미터: version_id={version_id}, query='{query}', limit={limit}")
+        raise HTTPException(status_code=500, detail=f"검색 실패: {str(e)}")
+
+
+@router.get("/{version_id}/typeahead")
+@search_telemetry("typeahead")
+@negotiated
+def typeahead_version_data(
+    version_id: int,
+    q: str = Query(..., description="입력 중인 검색어 (음절/초성, 예: 아반, ㅇㅂㄸ)"),
+    limit: int = Query(10, ge=1, le=50, description="자동완성 개수"),
+    types: Optional[str] = Query(None, description="대상 레벨 (쉼표 구분: brand,vehicle_line,model,trim)"),
+    db: Session = Depends(get_db)
+):
+    """자동완성 - 버전별 인메모리 접두사 트라이 조회 (DB 조회 없음, 색인 구축 시 제외)"""
+    try:
+        from app.infrastructure.search_index import get_index
+        from app.infrastructure.typeahead import TYPEAHEAD_LEVELS
+        
+        levels = TYPEAHEAD_LEVELS
+        if types:
+            levels = tuple(level.strip() for level in types.split(",") if level.strip())
+            invalid = [level for level in levels if level not in TYPEAHEAD_LEVELS]
+            if invalid:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"지원하지 않는 레벨입니다: {', '.join(invalid)}"
+                )
+        
+        index = get_index(db, version_id)
+        if not index.docs:
+            version_repo = SQLAlchemyStagingVersionRepository(db)
+            if not version_repo.find_by_id(version_id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="버전을 찾을 수 없습니다"
+                )
+        
+        suggestions = []
+        for doc, count in index.suggest(q, limit, levels):
+            item = index.breadcrumb(doc)
+            item["count"] = count
+            suggestions.append(item)
+        
+        return {
+            "query": q,
+            "suggestions": suggestions,
+            "total_count": len(suggestions)
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"자동완성 실패: {str(e)}")
+
+
+@router.get("/{version_id}/facets")
+@search_telemetry("facets")
+@negotiated
+@search_cached(
+    "facets",
+    key=lambda kwargs: f"{facet_filters(kwargs).cache_key}|{kwargs.get('cursor')}|{kwargs['limit']}"
+)
+def facet_search_trims(
+    version_id: int,
+    brand_id: Optional[List[int]] = Query(None, description="브랜드 ID (여러 개 가능)"),
+    car_type: Optional[List[str]] = Query(None, description="차종 (여러 개 가능)"),
+    fuel_name: Optional[List[str]] = Query(None, description="연료 (여러 개 가능)"),
+    cc: Optional[List[str]] = Query(None, description="배기량 (여러 개 가능)"),
+    price_band: Optional[List[str]] = Query(None, description="가격대 키 (예: 20000000-30000000, unknown)"),
+    q: Optional[str] = Query(None, description="모델/트림 이름 검색어"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (첫 페이지는 생략)"),
+    limit: int = Query(50, ge=1, le=500, description="페이지 크기"),
+    db: Session = Depends(get_db)
+):
+    """
+    트림 패싯 검색 - 필터에 맞는 트림 페이지 + 브랜드/차종/연료/배기량/가격대별 개수
+
+    패싯 개수는 집계 UNION ALL 1쿼리, 트림 목록은 키셋 페이지 1쿼리
+    """
+    try:
+        from .pagination import paginate
+        from app.infrastructure.orm_models import StagingTrimORM
+        from app.infrastructure.trim_facets import facet_counts, trim_query
+        
+        filters = facet_filters({
+            "brand_id": brand_id, "car_type": car_type, "fuel_name": fuel_name,
+            "cc": cc, "price_band": price_band, "q": q
+        })
+        counts = facet_counts(db, version_id, filters)
+        
+        if counts["total_count"] == 0 and not any(counts["facets"].values()):
+            version_repo = SQLAlchemyStagingVersionRepository(db)
+            if not version_repo.find_by_id(version_id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="버전을 찾을 수 없습니다"
+                )
+        
+        rows, page = paginate(
+            trim_query(db, version_id, filters), StagingTrimORM, StagingTrimORM.model_id,
+            skip=0, limit=limit, cursor=cursor or "", include_total=False
+        )
+        
+        return {
+            "version_id": version_id,
+            "filters": filters.to_dict(),
+            "total_count": counts["total_count"],
+            "facets": counts["facets"],
+            "trims": to_dicts(rows),
+            "limit": page["limit"],
+            "next_cursor": page["next_cursor"],
+            "has_next": page["has_next"]
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"패싯 검색 실패: {str(e)}")
+
+
+@router.get("/{version_id}/price-range")
+@search_telemetry("price-range")
+@negotiated
+def price_range_version_data(
+    version_id: int,
+    level: str = Query("trim", description="조회 레벨 (trim: 기본가격, option: 옵션 가격)"),
+    min_price: Optional[int] = Query(None, ge=0, description="최소 가격 (이상)"),
+    max_price: Optional[int] = Query(None, ge=0, description="최대 가격 (이하)"),
+    sort: str = Query("asc", description="가격 정렬 (asc, desc)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (첫 페이지는 생략)"),
+    limit: int = Query(50, ge=1, le=500, description="페이지 크기"),
+    db: Session = Depends(get_db)
+):
+    """가격 범위 조회 - 버전별 인메모리 (가격, id) 정렬 배열 이분 탐색 (DB 조회 없음, 색인 구축 시 제외)"""
+    try:
+        from .pagination import encode_cursor, decode_cursor
+        from app.infrastructure.search_index import get_index, PRICE_COLUMNS
+        
+        if level not in PRICE_COLUMNS:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 레벨입니다: {level}")
+        if sort not in ("asc", "desc"):
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 정렬입니다: {sort}")
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise HTTPException(status_code=400, detail="min_price가 max_price보다 큽니다")
+        
+        index = get_index(db, version_id)
+        if not index.docs:
+            version_repo = SQLAlchemyStagingVersionRepository(db)
+            if not version_repo.find_by_id(version_id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="버전을 찾을 수 없습니다"
+                )
+        
+        after = decode_cursor(cursor) if cursor else None
+        docs, total_count = index.price_range(
+            level, min_price, max_price, limit + 1,
+            descending=sort == "desc", after=after
+        )
+        has_next = len(docs) > limit
+        docs = docs[:limit]
+        
+        items = []
+        for doc in docs:
+            item = index.breadcrumb(doc)
+            item.pop("match_score", None)
+            item["price"] = doc.price
+            items.append(item)
+        
+        return {
+            "level": level,
+            "price_field": PRICE_COLUMNS[level],
+            "min_price": min_price,
+            "max_price": max_price,
+            "sort": sort,
+            "items": items,
+            "total_count": total_count,
+            "limit": limit,
+            "next_cursor": encode_cursor(docs[-1].price, docs[-1].id) if has_next and docs else None,
+            "has_next": has_next
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"[ERROR] 검색 API 오류 상세:")
-        print(f"[ERROR] 오류 메시지: {str(e)}")
-        print(f"[ERROR] 오류 타입: {type(e)}")
-        print(f"[ERROR] 스택 트레이스: {error_details}")
-        print(f"[ERROR] 입력 파라미터: version_id={version_id}, query='{query}', limit={limit}")
-        raise HTTPException(status_code=500, detail=f"검색 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"가격 범위 조회 실패: {str(e)}")
 
 
 @router.get("/{version_id}/search-filtered-data")
+@search_telemetry("search-filtered-data")
+@negotiated
 def get_search_filtered_data(
     version_id: int,
     query: str = Query(..., description="검색어"),
@@ -1709,76 +1502,8 @@ def get_search_filtered_data(
                 "search_query": query
             }
         
-        # 매칭되는 브랜드들의 전체 데이터 조회
-        brands = db.query(StagingBrandORM).filter(
-            StagingBrandORM.version_id == version_id,
-            StagingBrandORM.id.in_(matching_brand_ids)
-        ).all()
-        
-        # 각 브랜드의 전체 계층 구조 데이터 조회
-        result_brands = []
-        for brand in brands:
-            brand_data = {
-                "id": brand.id,
-                "name": brand.name,
-                "vehicle_lines": []
-            }
-            
-            # 차량라인 조회
-            vehicle_lines = db.query(StagingVehicleLineORM).filter(
-                StagingVehicleLineORM.brand_id == brand.id
-            ).all()
-            
-            for vl in vehicle_lines:
-                vl_data = {
-                    "id": vl.id,
-                    "name": vl.name,
-                    "models": []
-                }
-                
-                # 모델 조회
-                models = db.query(StagingModelORM).filter(
-                    StagingModelORM.vehicle_line_id == vl.id
-                ).all()
-                
-                for model in models:
-                    model_data = {
-                        "id": model.id,
-                        "name": model.name,
-                        "trims": []
-                    }
-                    
-                    # 트림 조회
-                    trims = db.query(StagingTrimORM).filter(
-                        StagingTrimORM.model_id == model.id
-                    ).all()
-                    
-                    for trim in trims:
-                        trim_data = {
-                            "id": trim.id,
-                            "name": trim.name,
-                            "options": []
-                        }
-                        
-                        # 옵션 조회
-                        options = db.query(StagingOptionORM).filter(
-                            StagingOptionORM.trim_id == trim.id
-                        ).all()
-                        
-                        for option in options:
-                            option_data = {
-                                "id": option.id,
-                                "name": option.name
-                            }
-                            trim_data["options"].append(option_data)
-                        
-                        model_data["trims"].append(trim_data)
-                    
-                    vl_data["models"].append(model_data)
-                
-                brand_data["vehicle_lines"].append(vl_data)
-            
-            result_brands.append(brand_data)
+        # 매칭되는 브랜드들의 전체 계층 구조 데이터 조회 (레벨당 1쿼리)
+        result_brands = TreeLoader(db, SEARCH_FILTERED_TREE_FIELDS).load("brand", matching_brand_ids)
         
         return {
             "version": {
@@ -1799,71 +1524,89 @@ def get_search_filtered_data(
 
 
 
-@router.get("/search-performance-info")
-def get_search_performance_info(db: Session = Depends(get_db)):
-    """검색 성능 정보 조회"""
+@router.get("/{version_id}/export.ndjson")
+def export_version_ndjson(
+    version_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    버전 카탈로그 NDJSON 스트리밍 내보내기
+    
+    한 줄에 트림 1건과 해당 옵션 목록을 담아 서버 사이드 커서로 순차 전송한다.
+    (carplatform 동기화, 분석 등 대용량 소비자용)
+    """
     try:
-        from sqlalchemy import text
-        
-        # 인덱스 정보 조회
-        index_query = text("""
-            SELECT 
-                schemaname,
-                tablename,
-                indexname,
-                indexdef
-            FROM pg_indexes 
-            WHERE tablename LIKE 'staging_%'
-            AND indexname LIKE '%search%'
-            ORDER BY tablename, indexname
-        """)
-        
-        result = db.execute(index_query)
-        indexes = [dict(row) for row in result.fetchall()]
-        
-        # 테이블별 행 수 조회
-        table_stats_query = text("""
-            SELECT 
-                'staging_brand' as table_name,
-                COUNT(*) as row_count
-            FROM staging_brand
-            UNION ALL
-            SELECT 
-                'staging_vehicle_line' as table_name,
-                COUNT(*) as row_count
-            FROM staging_vehicle_line
-            UNION ALL
-            SELECT 
-                'staging_model' as table_name,
-                COUNT(*) as row_count
-            FROM staging_model
-            UNION ALL
-            SELECT 
-                'staging_trim' as table_name,
-                COUNT(*) as row_count
-            FROM staging_trim
-            UNION ALL
-            SELECT 
-                'staging_option' as table_name,
-                COUNT(*) as row_count
-            FROM staging_option
-        """)
-        
-        stats_result = db.execute(table_stats_query)
-        table_stats = [dict(row) for row in stats_result.fetchall()]
+        # 버전 존재 확인 (스트리밍 시작 전에 404 판단)
+        version_repo = SQLAlchemyStagingVersionRepository(db)
+        version = version_repo.find_by_id(version_id)
+        if not version:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="버전을 찾을 수 없습니다"
+            )
         
-        return {
-            "indexes": indexes,
-            "table_stats": table_stats,
-            "total_indexes": len(indexes),
-            "search_optimized": len(indexes) > 0
-        }
+        from app.infrastructure.catalog_export import iter_version_ndjson
         
+        return StreamingResponse(
+            iter_version_ndjson(version_id),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": f'attachment; filename="version_{version_id}.ndjson"'}
+        )
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"성능 정보 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"버전 내보내기 실패: {str(e)}")
+
+
+@router.get("/{version_id}/diff")
+@negotiated
+def diff_version(
+    version_id: int,
+    against: Optional[str] = Query(None, description="비교 기준 버전 ID 또는 'main' (기본: 직전 버전, 없으면 메인 DB)"),
+    limit: int = Query(500, ge=1, le=10000, description="레벨·구분별 반환 항목 수 상한"),
+    db: Session = Depends(get_db)
+):
+    """
+    버전 변경 사항 조회 (기준 → 이 버전)
+
+    브랜드/자동차 라인/모델/트림/옵션별 추가·삭제·변경 항목과 가격 차이를 반환한다.
+    """
+    try:
+        from app.infrastructure.orm_models import StagingVersionORM
+        from app.infrastructure.version_diff import diff_catalogs, MAIN
+
+        version = db.query(StagingVersionORM.id, StagingVersionORM.version_name).filter(
+            StagingVersionORM.id == version_id
+        ).first()
+        if not version:
+            raise HTTPException(status_code=404, detail="버전을 찾을 수 없습니다")
+
+        if against is None:
+            previous = db.query(StagingVersionORM.id).filter(
+                StagingVersionORM.id < version_id
+            ).order_by(StagingVersionORM.id.desc()).first()
+            base = previous.id if previous else MAIN
+        elif against == MAIN:
+            base = MAIN
+        elif against.isdigit():
+            base = int(against)
+            if not db.query(StagingVersionORM.id).filter(StagingVersionORM.id == base).first():
+                raise HTTPException(status_code=404, detail="비교 기준 버전을 찾을 수 없습니다")
+        else:
+            raise HTTPException(status_code=400, detail="against는 버전 ID 또는 'main'이어야 합니다")
+
+        print(f"[DEBUG] 버전 diff: {base} → {version_id}")
+        result = diff_catalogs(db, base, version_id, limit=limit)
+        result["version_name"] = version.version_name
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"버전 비교 실패: {str(e)}")
 
 
 @router.get("/{version_id}/all-data-summary")
+@negotiated
 def get_all_data_summary(
     version_id: int,
     db: Session = Depends(get_db)
@@ -2010,7 +1753,8 @@ async def upload_excel_to_version(
         db.commit()
         print(f"[DEBUG] Job committed to database, job.id: {job.id}")
         
-        # Celery Task 실행 (job.id를 사용)
+        # Celery Task 실행 (job.id를 사용) - 태스크 모듈은 업로드 시점에만 로드
+        from app.tasks.excel_tasks import process_excel_file
         task = process_excel_file.delay(contents, job.id, version_id, country)
         
         # Celery Task ID 업데이트
@@ -2216,6 +1960,7 @@ def create_brand(
         
         db.add(new_brand)
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         db.refresh(new_brand)
         
         return {
@@ -2274,6 +2019,7 @@ def update_brand(
         brand.updated_by_email = current_user.get('email', 'admin@example.com')
         
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         db.refresh(brand)
         
         return {
@@ -2320,6 +2066,7 @@ def delete_brand(
         # 브랜드 삭제 (CASCADE로 관련 데이터도 함께 삭제됨)
         db.delete(brand)
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         
         return {
             "success": True,
@@ -2367,6 +2114,7 @@ def create_model(
         
         db.add(new_model)
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         db.refresh(new_model)
         
         return {
@@ -2432,6 +2180,7 @@ def update_model(
         model.updated_by_email = current_user.get('email', 'admin@example.com')
         
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         db.refresh(model)
         
         return {
@@ -2483,6 +2232,7 @@ def delete_model(
         # 모델 삭제 (CASCADE로 관련 데이터도 함께 삭제됨)
         db.delete(model)
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         
         return {
             "success": True,
@@ -2531,6 +2281,7 @@ def create_trim(
         
         db.add(new_trim)
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         db.refresh(new_trim)
         
         return {
@@ -2601,6 +2352,7 @@ def update_trim(
         trim.updated_by_email = current_user.get('email', 'admin@example.com')
         
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         db.refresh(trim)
         
         return {
@@ -2655,6 +2407,7 @@ def delete_trim(
         # 트림 삭제 (CASCADE로 관련 데이터도 함께 삭제됨)
         db.delete(trim)
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         
         return {
             "success": True,
@@ -2703,6 +2456,7 @@ def create_option(
         
         db.add(new_option)
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         db.refresh(new_option)
         
         return {
@@ -2775,6 +2529,7 @@ def update_option(
         option.updated_by_email = current_user.get('email', 'admin@example.com')
         
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         db.refresh(option)
         
         return {
@@ -2831,6 +2586,7 @@ def delete_option(
         # 옵션 삭제
         db.delete(option)
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         
         return {
             "success": True,
@@ -2849,12 +2605,11 @@ def upload_version_to_main(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """버전을 메인서버에 업로드"""
+    """버전을 메인서버에 업로드 (섀도 테이블에 구성 후 RENAME TABLE로 원자적 교체)"""
     try:
-        from app.infrastructure.orm_models import (
-            StagingVersionORM, StagingBrandORM, StagingVehicleLineORM,
-            StagingModelORM, StagingTrimORM, StagingOptionORM
-        )
+        from app.infrastructure.orm_models import StagingVersionORM
+        from app.infrastructure.main_publish import publish_version
+        from app.domain.entities import ApprovalStatus
         
         # 버전 조회
         version = db.query(StagingVersionORM).filter(StagingVersionORM.id == version_id).first()
@@ -2867,213 +2622,29 @@ def upload_version_to_main(
                 status_code=400, 
                 detail=f"승인된 버전만 메인 DB로 푸시할 수 있습니다. 현재 상태: {version.approval_status.value}"
             )
+        version_name = version.version_name
         
-        # 버전의 모든 데이터 조회
-        brands = db.query(StagingBrandORM).filter(StagingBrandORM.version_id == version_id).all()
-        
-        version_data = {
-            "version": {
-                "id": version.id,
-                "version_name": version.version_name,
-                "description": version.description,
-                "created_at": version.created_at.isoformat() if version.created_at else None,
-                "created_by": version.created_by
-            },
-            "brands": []
-        }
-        
-        for brand in brands:
-            # 브랜드의 모든 데이터 조회
-            vehicle_lines = db.query(StagingVehicleLineORM).filter(
-                StagingVehicleLineORM.brand_id == brand.id
-            ).all()
-            
-            brand_data = {
-                "id": brand.id,
-                "name": brand.name,
-                "country": brand.country,
-                "logo_url": brand.logo_url,
-                "manager": brand.manager,
-                "vehicle_lines": []
-            }
-            
-            for vehicle_line in vehicle_lines:
-                models = db.query(StagingModelORM).filter(
-                    StagingModelORM.vehicle_line_id == vehicle_line.id
-                ).all()
-                
-                vehicle_line_data = {
-                    "id": vehicle_line.id,
-                    "name": vehicle_line.name,
-                    "models": []
-                }
-                
-                for model in models:
-                    trims = db.query(StagingTrimORM).filter(
-                        StagingTrimORM.model_id == model.id
-                    ).all()
-                    
-                    model_data = {
-                        "id": model.id,
-                        "name": model.name,
-                        "code": model.code,
-                        "release_year": model.release_year,
-                        "price": model.price,
-                        "foreign": model.foreign,
-                        "trims": []
-                    }
-                    
-                    for trim in trims:
-                        options = db.query(StagingOptionORM).filter(
-                            StagingOptionORM.trim_id == trim.id
-                        ).all()
-                        
-                        trim_data = {
-                            "id": trim.id,
-                            "name": trim.name,
-                            "car_type": trim.car_type,
-                            "fuel_name": trim.fuel_name,
-                            "cc": trim.cc,
-                            "base_price": trim.base_price,
-                            "description": trim.description,
-                            "options": []
-                        }
-                        
-                        for option in options:
-                            option_data = {
-                                "id": option.id,
-                                "name": option.name,
-                                "code": option.code,
-                                "price": option.price,
-                                "discounted_price": option.discounted_price,
-                                "category": option.category
-                            }
-                            trim_data["options"].append(option_data)
-                        
-                        model_data["trims"].append(trim_data)
-                    
-                    vehicle_line_data["models"].append(model_data)
-                
-                brand_data["vehicle_lines"].append(vehicle_line_data)
-            
-            version_data["brands"].append(brand_data)
-        
-        # 실제 메인 DB로 데이터 푸시
-        from app.infrastructure.orm_models import (
-            BrandORM, VehicleLineORM, ModelORM, TrimORM, OptionORM
-        )
-        
-        # 기존 메인 DB 데이터 완전 삭제 (덮어쓰기)
         try:
-            # 모든 옵션 삭제
-            db.query(OptionORM).delete()
-            # 모든 트림 삭제
-            db.query(TrimORM).delete()
-            # 모든 모델 삭제
-            db.query(ModelORM).delete()
-            # 모든 차량 라인 삭제
-            db.query(VehicleLineORM).delete()
-            # 모든 브랜드 삭제
-            db.query(BrandORM).delete()
-            
-            db.flush()  # 삭제 작업 커밋
-            
+            counts = publish_version(db, version_id)
+        except (ValueError, TimeoutError) as e:
+            # 새 카탈로그로 옮길 수 없는 참조 행(할인 정책, 색상, 옵션 타이틀 등) 또는 다른 게시 진행 중 - 현재 카탈로그 유지
+            raise HTTPException(status_code=409, detail=str(e))
         except Exception as e:
-            db.rollback()
-            raise HTTPException(status_code=500, detail=f"기존 메인 DB 삭제 실패: {str(e)}")
-        
-        pushed_counts = {
-            "brands": 0,
-            "vehicle_lines": 0,
-            "models": 0,
-            "trims": 0,
-            "options": 0
-        }
+            raise HTTPException(status_code=500, detail=f"메인 DB 푸시 실패: {str(e)}")
+        bump_main_revision()  # 메인 카탈로그 ETag 무효화
         
-        # 트랜잭션으로 안전하게 처리
-        try:
-            for brand_data in version_data["brands"]:
-                # 새 브랜드 생성 (기존 데이터는 이미 삭제됨)
-                brand = BrandORM(
-                    name=brand_data["name"],
-                    country=brand_data["country"],
-                    logo_url=brand_data["logo_url"],
-                    manager=brand_data["manager"]
-                )
-                db.add(brand)
-                
-                db.flush()  # ID 생성
-                pushed_counts["brands"] += 1
-                
-                # 차량 라인 처리
-                for vehicle_line_data in brand_data["vehicle_lines"]:
-                    vehicle_line = VehicleLineORM(
-                        name=vehicle_line_data["name"],
-                        brand_id=brand.id
-                    )
-                    db.add(vehicle_line)
-                    
-                    db.flush()
-                    pushed_counts["vehicle_lines"] += 1
-                    
-                    # 모델 처리
-                    for model_data in vehicle_line_data["models"]:
-                        model = ModelORM(
-                            name=model_data["name"],
-                            code=model_data["code"],
-                            vehicle_line_id=vehicle_line.id,
-                            release_year=model_data["release_year"],
-                            price=model_data["price"],
-                            foreign=model_data["foreign"]
-                        )
-                        db.add(model)
-                        
-                        db.flush()
-                        pushed_counts["models"] += 1
-                        
-                        # 트림 처리
-                        for trim_data in model_data["trims"]:
-                            trim = TrimORM(
-                                name=trim_data["name"],
-                                car_type=trim_data["car_type"],
-                                fuel_name=trim_data["fuel_name"],
-                                cc=trim_data["cc"],
-                                base_price=trim_data["base_price"],
-                                description=trim_data["description"],
-                                model_id=model.id
-                            )
-                            db.add(trim)
-                            
-                            db.flush()
-                            pushed_counts["trims"] += 1
-                            
-                            # 옵션 처리
-                            for option_data in trim_data["options"]:
-                                if option_data["price"]:
-                                    option = OptionORM(
-                                        name=option_data.get("name", ""),
-                                        code=option_data.get("code"),
-                                        description=option_data.get("description"),
-                                        price=option_data["price"],
-                                        discounted_price=option_data.get("discounted_price"),
-                                        category=option_data.get("category"),
-                                        trim_id=trim.id
-                                    )
-                                    db.add(option)
-                                    pushed_counts["options"] += 1
-            
-            db.commit()
-            
-            return {
-                "message": f"버전 '{version.version_name}'이 메인 DB에 성공적으로 푸시되었습니다.",
-                "version_id": version_id,
-                "uploaded_at": datetime.now().isoformat(),
-                "pushed_data": pushed_counts
+        return {
+            "message": f"버전 '{version_name}'이 메인 DB에 성공적으로 푸시되었습니다.",
+            "version_id": version_id,
+            "uploaded_at": datetime.now().isoformat(),
+            "pushed_data": {
+                "brands": counts.get("brand", 0),
+                "vehicle_lines": counts.get("vehicle_line", 0),
+                "models": counts.get("model", 0),
+                "trims": counts.get("trim", 0),
+                "options": counts.get("option", 0)
             }
-            
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(status_code=500, detail=f"메인 DB 푸시 실패: {str(e)}")
+        }
         
     except HTTPException:
         raise
@@ -3229,6 +2800,7 @@ def download_version_from_main(
                                 pulled_counts["options"] += 1
             
             db.commit()
+            bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
             
             return {
                 "message": f"메인 DB에서 버전 '{version.version_name}'으로 데이터가 성공적으로 풀되었습니다.",
@@ -3298,10 +2870,8 @@ def approve_version(
 ):
     """버전 승인 (관리자, 매니저, 대표만 가능)"""
     try:
-        from app.infrastructure.orm_models import (
-            StagingVersionORM, StagingBrandORM, StagingVehicleLineORM,
-            StagingModelORM, StagingTrimORM, StagingOptionORM
-        )
+        from app.infrastructure.orm_models import StagingVersionORM
+        from app.infrastructure.main_publish import publish_version
         from app.domain.entities import ApprovalStatus
         from app.presentation.permission_checker import check_user_permission
         
@@ -3333,171 +2903,12 @@ def approve_version(
         version.rejection_reason = None
         
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         
-        # 승인 후 자동으로 메인 DB로 푸시
+        # 승인 후 자동으로 메인 DB로 푸시 (업로드와 같은 섀도 테이블 교체 - 빈 카탈로그 구간 없음, __prev로 되돌리기 가능)
         try:
-            # 버전의 모든 데이터 조회
-            brands = db.query(StagingBrandORM).filter(StagingBrandORM.version_id == version_id).all()
-            
-            version_data = {
-                "version": {
-                    "id": version.id,
-                    "version_name": version.version_name,
-                    "description": version.description,
-                    "created_at": version.created_at.isoformat() if version.created_at else None,
-                    "created_by": version.created_by
-                },
-                "brands": []
-            }
-            
-            for brand in brands:
-                brand_data = {
-                    "name": brand.name,
-                    "country": brand.country,
-                    "logo_url": brand.logo_url,
-                    "manager": brand.manager,
-                    "vehicle_lines": []
-                }
-                
-                # 차량 라인 조회
-                vehicle_lines = db.query(StagingVehicleLineORM).filter(StagingVehicleLineORM.brand_id == brand.id).all()
-                for vehicle_line in vehicle_lines:
-                    vehicle_line_data = {
-                        "name": vehicle_line.name,
-                        "models": []
-                    }
-                    
-                    # 모델 조회
-                    models = db.query(StagingModelORM).filter(StagingModelORM.vehicle_line_id == vehicle_line.id).all()
-                    for model in models:
-                        model_data = {
-                            "name": model.name,
-                            "code": model.code,
-                            "release_year": model.release_year,
-                            "price": model.price,
-                            "foreign": model.foreign,
-                            "trims": []
-                        }
-                        
-                        # 트림 조회
-                        trims = db.query(StagingTrimORM).filter(StagingTrimORM.model_id == model.id).all()
-                        for trim in trims:
-                            trim_data = {
-                                "name": trim.name,
-                                "car_type": trim.car_type,
-                                "fuel_name": trim.fuel_name,
-                                "cc": trim.cc,
-                                "base_price": trim.base_price,
-                                "description": trim.description,
-                                "options": []
-                            }
-                            
-                            # 옵션 조회
-                            options = db.query(StagingOptionORM).filter(StagingOptionORM.trim_id == trim.id).all()
-                            for option in options:
-                                option_data = {
-                                    "name": option.name,
-                                    "price": option.price,
-                                    "discounted_price": option.discounted_price
-                                }
-                                trim_data["options"].append(option_data)
-                            
-                            model_data["trims"].append(trim_data)
-                        
-                        vehicle_line_data["models"].append(model_data)
-                    
-                    brand_data["vehicle_lines"].append(vehicle_line_data)
-                
-                version_data["brands"].append(brand_data)
-            
-            # 메인 DB로 푸시
-            from app.infrastructure.orm_models import (
-                BrandORM, VehicleLineORM, ModelORM, TrimORM, OptionORM
-            )
-            
-            # 기존 메인 DB 데이터 완전 삭제 (덮어쓰기)
-            db.query(OptionORM).delete()
-            db.query(TrimORM).delete()
-            db.query(ModelORM).delete()
-            db.query(VehicleLineORM).delete()
-            db.query(BrandORM).delete()
-            db.flush()
-            
-            pushed_counts = {
-                "brands": 0,
-                "vehicle_lines": 0,
-                "models": 0,
-                "trims": 0,
-                "options": 0
-            }
-            
-            # 새 데이터 추가
-            for brand_data in version_data["brands"]:
-                brand = BrandORM(
-                    name=brand_data["name"],
-                    country=brand_data["country"],
-                    logo_url=brand_data["logo_url"],
-                    manager=brand_data["manager"]
-                )
-                db.add(brand)
-                db.flush()
-                pushed_counts["brands"] += 1
-                
-                # 차량 라인 처리
-                for vehicle_line_data in brand_data["vehicle_lines"]:
-                    vehicle_line = VehicleLineORM(
-                        name=vehicle_line_data["name"],
-                        brand_id=brand.id
-                    )
-                    db.add(vehicle_line)
-                    db.flush()
-                    pushed_counts["vehicle_lines"] += 1
-                    
-                    # 모델 처리
-                    for model_data in vehicle_line_data["models"]:
-                        model = ModelORM(
-                            name=model_data["name"],
-                            code=model_data["code"],
-                            vehicle_line_id=vehicle_line.id,
-                            release_year=model_data["release_year"],
-                            price=model_data["price"],
-                            foreign=model_data["foreign"]
-                        )
-                        db.add(model)
-                        db.flush()
-                        pushed_counts["models"] += 1
-                        
-                        # 트림 처리
-                        for trim_data in model_data["trims"]:
-                            trim = TrimORM(
-                                name=trim_data["name"],
-                                car_type=trim_data["car_type"],
-                                fuel_name=trim_data["fuel_name"],
-                                cc=trim_data["cc"],
-                                base_price=trim_data["base_price"],
-                                description=trim_data["description"],
-                                model_id=model.id
-                            )
-                            db.add(trim)
-                            db.flush()
-                            pushed_counts["trims"] += 1
-                            
-                            # 옵션 처리
-                            for option_data in trim_data["options"]:
-                                if option_data["price"]:
-                                    option = OptionORM(
-                                        name=option_data.get("name", ""),
-                                        code=option_data.get("code"),
-                                        description=option_data.get("description"),
-                                        price=option_data["price"],
-                                        discounted_price=option_data.get("discounted_price"),
-                                        category=option_data.get("category"),
-                                        trim_id=trim.id
-                                    )
-                                    db.add(option)
-                                    pushed_counts["options"] += 1
-            
-            db.commit()
+            counts = publish_version(db, version_id)
+            bump_main_revision()  # 메인 카탈로그 ETag 무효화
             
             return {
                 "message": f"버전 '{version.version_name}'이 승인되었고 메인 DB에 성공적으로 푸시되었습니다.",
@@ -3505,7 +2916,13 @@ def approve_version(
                 "approved_by": version.approved_by,
                 "approved_at": version.approved_at.isoformat(),
                 "status": "APPROVED",
-                "pushed_data": pushed_counts
+                "pushed_data": {
+                    "brands": counts.get("brand", 0),
+                    "vehicle_lines": counts.get("vehicle_line", 0),
+                    "models": counts.get("model", 0),
+                    "trims": counts.get("trim", 0),
+                    "options": counts.get("option", 0)
+                }
             }
             
         except Exception as push_error:
@@ -3569,6 +2986,7 @@ def reject_version(
         version.approved_at = None
         
         db.commit()
+        bump_revision(version_id)  # 버전 스냅샷 캐시 무효화
         
         return {
             "message": f"버전 '{version.version_name}'이 거부되었습니다.",
@@ -3621,6 +3039,33 @@ def switch_to_version(
         raise HTTPException(status_code=500, detail=f"버전 전환 실패: {str(e)}")
 
 
+@router.post("/main-db/rollback")
+def rollback_main_db(
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """메인 DB를 직전 업로드 이전 카탈로그로 되돌림 (다시 호출하면 되돌린 업로드로 복귀)"""
+    try:
+        from app.infrastructure.main_publish import rollback_main_catalog
+        
+        try:
+            counts = rollback_main_catalog(db)
+        except (LookupError, ValueError, TimeoutError) as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        bump_main_revision()  # 메인 카탈로그 ETag 무효화
+        
+        return {
+            "message": "메인 DB가 이전 카탈로그로 복원되었습니다.",
+            "restored_at": datetime.now().isoformat(),
+            "restored_data": counts
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"메인 DB 롤백 실패: {str(e)}")
+
+
 @router.get("/main-db/status")
 def get_main_db_status(
     db: Session = Depends(get_db),
@@ -0,0 +1,89 @@
+"""
+HTTP 조건부 GET - revision 기반 ETag / If-None-Match → 304 / Cache-Control
+
+버전 데이터(/api/versions/{id}/...)는 버전 revision, 메인 카탈로그
+(/api/main-db/..., /api/brands|models|trims)는 메인 revision으로 강한 ETag를 만든다.
+revision이 같으면 핸들러를 실행하지 않고 304를 반환하므로 DB 조회도 전송도 없다.
+바깥의 GZipMiddleware가 압축 여부를 바꾸므로 gzip 수용 여부도 ETag에 포함한다 (강한 ETag는 바이트 단위 표현마다 달라야 함).
+"""
+import hashlib
+import re
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.infrastructure.version_cache import get_revision, get_main_revision
+
+# 버전 revision 대상 경로 (/api/versions/{version_id}, /api/versions/{version_id}/...)
+VERSION_PATH = re.compile(r"^/api/versions/(\d+)(?:/|$)")
+
+# 버전 revision만으로 판단할 수 없는 경로 (작업 진행 상태, 다른 버전/메인과의 비교)
+EXCLUDED_PATH = re.compile(r"^/api/versions/\d+/(?:job-status/|diff)")
+
+# 메인 revision 대상 경로
+MAIN_PATH = re.compile(r"^/api/(?:main-db|brands|models|trims)(?:/|$)|^/api/versions/main-db/")
+
+# 관리자 SPA용: 브라우저 저장은 허용하되 매번 재검증
+CACHE_CONTROL = "private, no-cache"
+
+
+def _current_revision(path: str) -> Optional[str]:
+    """경로에 해당하는 revision 태그 (대상이 아니거나 Redis 사용 불가 시 None)"""
+    if EXCLUDED_PATH.match(path):
+        return None
+    if MAIN_PATH.match(path):
+        revision = get_main_revision()
+        return None if revision is None else f"main:{revision}"
+    match = VERSION_PATH.match(path)
+    if match:
+        revision = get_revision(int(match.group(1)))
+        return None if revision is None else f"v{match.group(1)}:{revision}"
+    return None
+
+
+def make_etag(request: Request, revision_tag: str) -> str:
+    """revision + 요청 URL + 표현 방식(Accept, gzip 압축 여부) 기준 강한 ETag"""
+    source = "|".join([
+        revision_tag,
+        request.url.path,
+        request.url.query,
+        request.headers.get("accept", ""),
+        # GZipMiddleware와 같은 기준 ("gzip" 포함 여부)으로 압축 응답과 비압축 응답을 구분
+        "gzip" if "gzip" in request.headers.get("accept-encoding", "") else "identity",
+        request.headers.get("authorization", ""),
+    ])
+    return '"' + hashlib.sha1(source.encode("utf-8")).hexdigest()[:20] + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+class ConditionalGetMiddleware(BaseHTTPMiddleware):
+    """GET 응답에 ETag/Cache-Control을 붙이고 If-None-Match 일치 시 304 반환"""
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method != "GET":
+            return await call_next(request)
+
+        # 동기 Redis 조회는 스레드풀에서 (이벤트 루프 차단 방지)
+        revision_tag = await run_in_threadpool(_current_revision, request.url.path)
+        if revision_tag is None:
+            return await call_next(request)
+
+        etag = make_etag(request, revision_tag)
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept, Accept-Encoding, Authorization"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
+        response = await call_next(request)
+        if response.status_code == 200:
+            for name, value in headers.items():
+                response.headers[name] = value
+        return response
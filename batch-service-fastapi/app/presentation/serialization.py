@@ -0,0 +1,150 @@
+"""
+응답 직렬화 - Accept 헤더 기반 콘텐츠 협상
+
+대용량 트리/목록 응답은 jsonable_encoder를 거치지 않고 바로 바이트로 인코딩한다.
+- application/json (기본): orjson 사용, 미설치 시 표준 json
+- application/msgpack: msgpack 설치 시
+- application/vnd.apache.arrow.stream: pyarrow 설치 시 (응답 내 가장 큰 목록을 테이블로 변환)
+요청한 형식의 라이브러리가 없으면 JSON으로 응답한다. 압축은 GZipMiddleware가 담당한다.
+"""
+import functools
+import inspect
+import json
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.infrastructure.search_metrics import current_trace
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _default(value):
+    """표준 직렬화기가 처리하지 못하는 값 변환 (jsonable_encoder와 동일한 규칙)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def dumps_json(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=False, default=_default).encode("utf-8")
+
+
+def dumps_msgpack(payload) -> bytes:
+    return msgpack.packb(payload, default=_default, use_bin_type=True)
+
+
+def dumps_arrow(payload) -> bytes:
+    """
+    Arrow IPC 스트림으로 변환
+
+    목록이면 그대로, dict이면 가장 긴 dict 목록 필드를 테이블로 만들고
+    나머지 스칼라 필드는 스키마 메타데이터(JSON)로 넣는다.
+    """
+    import pyarrow as pa
+
+    rows, meta = payload, {}
+    if isinstance(payload, dict):
+        list_fields = [
+            key for key, value in payload.items()
+            if isinstance(value, list) and all(isinstance(item, dict) for item in value)
+        ]
+        if not list_fields:
+            raise ValueError("Arrow로 변환할 목록 필드가 없습니다")
+        table_field = max(list_fields, key=lambda key: len(payload[key]))
+        rows = payload[table_field]
+        meta = {key: value for key, value in payload.items() if key != table_field}
+        meta["_table_field"] = table_field
+
+    # Decimal/datetime 등은 JSON과 같은 규칙으로 정규화한 뒤 변환
+    rows = json.loads(dumps_json(rows))
+    table = pa.Table.from_pylist(rows)
+    if meta:
+        table = table.replace_schema_metadata({"meta": dumps_json(meta)})
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _preferred_media_type(accept: str) -> str:
+    accept = (accept or "").lower()
+    if ARROW_MEDIA_TYPE in accept:
+        try:
+            import pyarrow  # noqa: F401
+            return ARROW_MEDIA_TYPE
+        except ImportError:
+            pass
+    if msgpack is not None and any(media_type in accept for media_type in MSGPACK_MEDIA_TYPES):
+        return MSGPACK_MEDIA_TYPES[0]
+    return JSON_MEDIA_TYPE
+
+
+def render(request: Request, payload) -> Response:
+    """Accept 헤더에 맞는 형식으로 payload를 인코딩한 Response 반환"""
+    media_type = _preferred_media_type(request.headers.get("accept"))
+    if media_type == ARROW_MEDIA_TYPE:
+        try:
+            return Response(dumps_arrow(payload), media_type=ARROW_MEDIA_TYPE)
+        except ValueError:
+            media_type = JSON_MEDIA_TYPE
+    if media_type == MSGPACK_MEDIA_TYPES[0]:
+        return Response(dumps_msgpack(payload), media_type=media_type)
+    return Response(dumps_json(payload), media_type=JSON_MEDIA_TYPE)
+
+
+def negotiated(func):
+    """
+    엔드포인트 반환값(dict/list)을 콘텐츠 협상 Response로 변환하는 데코레이터
+
+    엔드포인트 시그니처에 request 파라미터를 추가하므로 원래 함수는 Request를 받지 않아도 된다.
+    """
+    signature = inspect.signature(func)
+    takes_request = "request" in signature.parameters
+
+    @functools.wraps(func)
+    def wrapper(*args, request: Request, **kwargs):
+        if takes_request:
+            kwargs["request"] = request
+        result = func(*args, **kwargs)
+        if isinstance(result, Response):
+            return result
+        trace = current_trace()
+        if trace is None:
+            return render(request, result)
+        # 검색 텔레메트리: 결과 payload와 직렬화 시간 기록
+        trace.payload = result
+        started = time.perf_counter()
+        response = render(request, result)
+        trace.serialize_ms += (time.perf_counter() - started) * 1000
+        return response
+
+    if not takes_request:
+        wrapper.__signature__ = signature.replace(parameters=[
+            inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            *[param.replace(kind=inspect.Parameter.KEYWORD_ONLY) for param in signature.parameters.values()],
+        ])
+    return wrapper
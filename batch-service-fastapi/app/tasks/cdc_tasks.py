@@ -9,14 +9,18 @@ from datetime import datetime, timedelta
 
 from ..infrastructure.database import SessionLocal
 from ..infrastructure.orm_models import (
-    StagingBrandORM, StagingVehicleLineORM, StagingModelORM, StagingTrimORM,
-    BrandORM, VehicleLineORM, ModelORM, TrimORM
+    StagingBrandORM, StagingVehicleLineORM, StagingModelORM, StagingTrimORM
 )
 from ..domain.entities import ApprovalStatus
 from ..application.use_cases import MigrationService
+from ..infrastructure.version_cache import bump_revision, bump_main_revision
+from ..config import settings
 
 logger = get_task_logger(__name__)
 
+# 할인 정책 마이그레이션 INSERT 배치 크기 (행)
+DISCOUNT_INSERT_BATCH_SIZE = 1000
+
 
 @shared_task(bind=True, name="migrate_version_to_main")
 def migrate_version_to_main(self, version_id: int):
@@ -30,29 +34,11 @@ def migrate_version_to_main(self, version_id: int):
     db: Session = SessionLocal()
     
     try:
-        from ..infrastructure.repositories import (
-            SQLAlchemyStagingVersionRepository,
-            SQLAlchemyBrandRepository,
-            SQLAlchemyVehicleLineRepository,
-            SQLAlchemyModelRepository,
-            SQLAlchemyTrimRepository,
-            SQLAlchemyStagingBrandRepository,
-            SQLAlchemyStagingVehicleLineRepository,
-            SQLAlchemyStagingModelRepository,
-            SQLAlchemyStagingTrimRepository
-        )
+        from ..infrastructure.repositories import SQLAlchemyStagingVersionRepository
+        from ..infrastructure.main_migration import SQLAlchemyMainCatalogMigrator
         
         # Repository 인스턴스 생성
         version_repo = SQLAlchemyStagingVersionRepository(db)
-        brand_repo = SQLAlchemyBrandRepository(db)
-        vehicle_line_repo = SQLAlchemyVehicleLineRepository(db)
-        model_repo = SQLAlchemyModelRepository(db)
-        trim_repo = SQLAlchemyTrimRepository(db)
-        
-        staging_brand_repo = SQLAlchemyStagingBrandRepository(db)
-        staging_vehicle_line_repo = SQLAlchemyStagingVehicleLineRepository(db)
-        staging_model_repo = SQLAlchemyStagingModelRepository(db)
-        staging_trim_repo = SQLAlchemyStagingTrimRepository(db)
         
         # 버전 확인
         version = version_repo.find_by_id(version_id)
@@ -67,14 +53,7 @@ def migrate_version_to_main(self, version_id: int):
         # MigrationService 사용
         migration_service = MigrationService(
             version_repo=version_repo,
-            brand_repo=brand_repo,
-            vehicle_line_repo=vehicle_line_repo,
-            model_repo=model_repo,
-            trim_repo=trim_repo,
-            staging_brand_repo=staging_brand_repo,
-            staging_vehicle_line_repo=staging_vehicle_line_repo,
-            staging_model_repo=staging_model_repo,
-            staging_trim_repo=staging_trim_repo
+            catalog_migrator=SQLAlchemyMainCatalogMigrator(db)
         )
         
         # 1. 메인 서비스 마이그레이션 실행
@@ -83,7 +62,7 @@ def migrate_version_to_main(self, version_id: int):
         if not success:
             raise Exception("Main service migration failed")
         
-        logger.info(f"Main service migration completed for version {version_id}")
+        logger.info(f"Main service migration completed for version {version_id}: {migration_service.last_counts}")
         
         # 2. 할인 정책 마이그레이션 실행
         discount_policy_result = _migrate_discount_policies(db, version_id)
@@ -93,6 +72,7 @@ def migrate_version_to_main(self, version_id: int):
         # 3. 버전 상태를 MIGRATED로 업데이트
         version.approval_status = ApprovalStatus.MIGRATED
         version_repo.update(version_id, version)
+        bump_main_revision()  # 메인 카탈로그 ETag 무효화
         
         logger.info(f"Migration completed for version {version_id}")
         return {
@@ -101,7 +81,8 @@ def migrate_version_to_main(self, version_id: int):
             "message": f"Version {version.version_name} migrated successfully",
             "main_service": {
                 "success": True,
-                "message": "Main service migrated successfully"
+                "message": "Main service migrated successfully",
+                "counts": migration_service.last_counts
             },
             "discount_policy": discount_policy_result
         }
@@ -115,221 +96,60 @@ def migrate_version_to_main(self, version_id: int):
 
 
 @shared_task(bind=True, name="sync_approved_to_main")
-def sync_approved_to_main(self, entity_type: str, staging_id: int):
+def sync_approved_to_main(self, entity_type: str = None, staging_id: int = None):
     """
-    승인된 Staging 데이터를 Main 테이블로 전송 (개별 엔티티)
-    새로운 구조에 맞게 수정
+    승인된 Staging 변경분을 Main 테이블로 전송
     
-    Args:
-        entity_type: "brand", "vehicle_line", "model", "trim"
-        staging_id: Staging 테이블의 ID
+    스테이징 쓰기는 같은 트랜잭션에서 변경 outbox에 기록되므로 엔티티를 다시 읽지 않고 outbox를 비운다.
+    인자는 기존 호출 호환용이다 (해당 엔티티의 변경도 outbox에 들어 있음).
     """
-    db: Session = SessionLocal()
-    
     try:
-        if entity_type == "brand":
-            _sync_brand(db, staging_id)
-        elif entity_type == "vehicle_line":
-            _sync_vehicle_line(db, staging_id)
-        elif entity_type == "model":
-            _sync_model(db, staging_id)
-        elif entity_type == "trim":
-            _sync_trim(db, staging_id)
-        else:
-            raise ValueError(f"Unknown entity type: {entity_type}")
-        
-        logger.info(f"CDC sync completed: {entity_type} ID {staging_id}")
-        
+        return _drain_change_outbox(settings.outbox_max_batches)
     except Exception as e:
         logger.error(f"CDC sync failed: {entity_type} ID {staging_id}, Error: {str(e)}")
         raise self.retry(exc=e, countdown=60, max_retries=3)
-        
-    finally:
-        db.close()
-
-
-def _sync_brand(db: Session, staging_id: int):
-    """Staging Brand → Main Brand"""
-    staging = db.query(StagingBrandORM).filter(StagingBrandORM.id == staging_id).first()
-    if not staging:
-        raise ValueError(f"Staging brand not found: {staging_id}")
-    
-    if staging.approval_status != ApprovalStatus.APPROVED:
-        raise ValueError(f"Brand is not approved: {staging_id}")
-    
-    # Main 테이블에 같은 이름이 있는지 확인
-    existing = db.query(BrandORM).filter(BrandORM.name == staging.name).first()
-    
-    if existing:
-        # 이미 존재하면 업데이트
-        existing.country = staging.country
-        existing.logo_url = staging.logo_url
-        existing.manager = staging.manager
-        logger.info(f"Updated existing brand: {existing.id}")
-    else:
-        # 새로 생성
-        main_brand = BrandORM(
-            name=staging.name,
-            country=staging.country,
-            logo_url=staging.logo_url,
-            manager=staging.manager
-        )
-        db.add(main_brand)
-        db.flush()  # ID를 얻기 위해 flush
-        logger.info(f"Created new brand: {staging.name}")
-    
-    db.commit()
-
-
-def _sync_vehicle_line(db: Session, staging_id: int):
-    """Staging VehicleLine → Main VehicleLine"""
-    staging = db.query(StagingVehicleLineORM).filter(StagingVehicleLineORM.id == staging_id).first()
-    if not staging:
-        raise ValueError(f"Staging vehicle line not found: {staging_id}")
-    
-    if staging.approval_status != ApprovalStatus.APPROVED:
-        raise ValueError(f"Vehicle line is not approved: {staging_id}")
-    
-    # Brand ID 매핑 (Staging brand_id → Main brand_id)
-    staging_brand = db.query(StagingBrandORM).filter(StagingBrandORM.id == staging.brand_id).first()
-    if not staging_brand:
-        raise ValueError(f"Staging brand not found: {staging.brand_id}")
-    
-    main_brand = db.query(BrandORM).filter(BrandORM.name == staging_brand.name).first()
-    if not main_brand:
-        raise ValueError(f"Main brand not found for: {staging_brand.name}")
-    
-    # Main 테이블에 같은 이름이 있는지 확인
-    existing = db.query(VehicleLineORM).filter(
-        VehicleLineORM.brand_id == main_brand.id,
-        VehicleLineORM.name == staging.name
-    ).first()
-    
-    if existing:
-        # 이미 존재하면 업데이트
-        existing.description = staging.description
-        logger.info(f"Updated existing vehicle line: {existing.id}")
-    else:
-        # 새로 생성
-        main_vehicle_line = VehicleLineORM(
-            name=staging.name,
-            description=staging.description,
-            brand_id=main_brand.id
-        )
-        db.add(main_vehicle_line)
-        db.flush()  # ID를 얻기 위해 flush
-        logger.info(f"Created new vehicle line: {staging.name}")
-    
-    db.commit()
 
 
-def _sync_model(db: Session, staging_id: int):
-    """Staging Model → Main Model"""
-    staging = db.query(StagingModelORM).filter(StagingModelORM.id == staging_id).first()
-    if not staging:
-        raise ValueError(f"Staging model not found: {staging_id}")
-    
-    if staging.approval_status != ApprovalStatus.APPROVED:
-        raise ValueError(f"Model is not approved: {staging_id}")
-    
-    # VehicleLine ID 매핑
-    staging_vehicle_line = db.query(StagingVehicleLineORM).filter(StagingVehicleLineORM.id == staging.vehicle_line_id).first()
-    if not staging_vehicle_line:
-        raise ValueError(f"Staging vehicle line not found: {staging.vehicle_line_id}")
-    
-    # Main VehicleLine 찾기
-    staging_brand = db.query(StagingBrandORM).filter(StagingBrandORM.id == staging_vehicle_line.brand_id).first()
-    if not staging_brand:
-        raise ValueError(f"Staging brand not found: {staging_vehicle_line.brand_id}")
-    
-    main_brand = db.query(BrandORM).filter(BrandORM.name == staging_brand.name).first()
-    if not main_brand:
-        raise ValueError(f"Main brand not found for: {staging_brand.name}")
-    
-    main_vehicle_line = db.query(VehicleLineORM).filter(
-        VehicleLineORM.brand_id == main_brand.id,
-        VehicleLineORM.name == staging_vehicle_line.name
-    ).first()
-    if not main_vehicle_line:
-        raise ValueError(f"Main vehicle line not found for: {staging_vehicle_line.name}")
-    
-    # Main 테이블에 같은 코드가 있는지 확인
-    existing = db.query(ModelORM).filter(ModelORM.code == staging.code).first()
-    
-    if existing:
-        # 이미 존재하면 업데이트
-        existing.name = staging.name
-        existing.vehicle_line_id = main_vehicle_line.id
-        existing.release_year = staging.release_year
-        existing.price = staging.price
-        existing.foreign = staging.foreign
-        logger.info(f"Updated existing model: {existing.id}")
-    else:
-        # 새로 생성
-        main_model = ModelORM(
-            name=staging.name,
-            code=staging.code,
-            vehicle_line_id=main_vehicle_line.id,
-            release_year=staging.release_year,
-            price=staging.price,
-            foreign=staging.foreign
-        )
-        db.add(main_model)
-        db.flush()  # ID를 얻기 위해 flush
-        logger.info(f"Created new model: {staging.name}")
+@shared_task(bind=True, name="drain_change_outbox")
+def drain_change_outbox(self, max_batches: int = None):
+    """
+    변경 outbox를 배치 단위로 비우며 Main 테이블에 반영 (Celery Beat 주기 실행)
     
-    db.commit()
+    Args:
+        max_batches: 한 번 실행에서 처리할 최대 배치 수
+    """
+    try:
+        return _drain_change_outbox(max_batches or settings.outbox_max_batches)
+    except Exception as e:
+        logger.error(f"CDC outbox drain failed: {str(e)}")
+        raise self.retry(exc=e, countdown=60, max_retries=3)
 
 
-def _sync_trim(db: Session, staging_id: int):
-    """Staging Trim → Main Trim"""
-    staging = db.query(StagingTrimORM).filter(StagingTrimORM.id == staging_id).first()
-    if not staging:
-        raise ValueError(f"Staging trim not found: {staging_id}")
-    
-    if staging.approval_status != ApprovalStatus.APPROVED:
-        raise ValueError(f"Trim is not approved: {staging_id}")
-    
-    # Model ID 매핑
-    staging_model = db.query(StagingModelORM).filter(StagingModelORM.id == staging.model_id).first()
-    if not staging_model:
-        raise ValueError(f"Staging model not found: {staging.model_id}")
-    
-    # Main Model 찾기
-    main_model = db.query(ModelORM).filter(ModelORM.code == staging_model.code).first()
-    if not main_model:
-        raise ValueError(f"Main model not found for code: {staging_model.code}")
+def _drain_change_outbox(max_batches: int) -> dict:
+    """outbox가 빌 때까지(최대 max_batches 배치) 반영 - 배치마다 커밋"""
+    from ..infrastructure.change_outbox import drain_outbox
     
-    # Main 테이블에 같은 이름이 있는지 확인
-    existing = db.query(TrimORM).filter(
-        TrimORM.model_id == main_model.id,
-        TrimORM.name == staging.name
-    ).first()
-    
-    if existing:
-        # 이미 존재하면 업데이트
-        existing.car_type = staging.car_type
-        existing.fuel_name = staging.fuel_name
-        existing.cc = staging.cc
-        existing.base_price = staging.base_price
-        existing.description = staging.description
-        logger.info(f"Updated existing trim: {existing.id}")
-    else:
-        # 새로 생성
-        main_trim = TrimORM(
-            model_id=main_model.id,
-            car_type=staging.car_type,
-            name=staging.name,
-            fuel_name=staging.fuel_name,
-            cc=staging.cc,
-            base_price=staging.base_price,
-            description=staging.description
-        )
-        db.add(main_trim)
-        db.flush()  # ID를 얻기 위해 flush
-        logger.info(f"Created new trim: {staging.name}")
+    db: Session = SessionLocal()
+    totals = {}
     
-    db.commit()
+    try:
+        for _ in range(max_batches):
+            stats = drain_outbox(db, settings.outbox_batch_size)
+            for key, value in stats.items():
+                totals[key] = totals.get(key, 0) + value
+            if stats["inserted"] or stats["updated"] or stats["deleted"]:
+                bump_main_revision()  # 메인 카탈로그 ETag 무효화
+            if stats["changes"] < settings.outbox_batch_size:
+                break
+        
+        if totals.get("changes"):
+            logger.info(f"CDC outbox drained: {totals}")
+        if totals.get("failed"):
+            logger.warning(f"CDC outbox entries parked as failed: {totals['failed']}")
+        return totals
+        
+    finally:
+        db.close()
 
 
 @shared_task(name="cleanup_approved_staging_data")
@@ -384,24 +204,30 @@ def sync_pending_approvals():
     db: Session = SessionLocal()
     
     try:
-        # PENDING 상태의 버전들 조회
-        from ..infrastructure.repositories import SQLAlchemyStagingVersionRepository
-        version_repo = SQLAlchemyStagingVersionRepository(db)
-        
-        pending_versions = version_repo.find_all(approval_status=ApprovalStatus.PENDING.value)
-        
-        for version in pending_versions:
-            # 자동 승인 조건 체크 (예: 특정 시간 경과, 특정 조건 만족 등)
-            # 여기서는 단순히 24시간 경과된 버전을 자동 승인하는 예시
-            if version.created_at and (datetime.utcnow() - version.created_at).days >= 1:
-                version.approval_status = ApprovalStatus.APPROVED
-                version.approved_by = "auto_approval_system"
-                version_repo.update(version.id, version)
-                
-                logger.info(f"Auto-approved version: {version.version_name}")
-        
+        # 자동 승인 조건 체크 - 24시간 경과된 PENDING 버전만 조회
+        from ..infrastructure.orm_models import StagingVersionORM
+        cutoff = datetime.utcnow() - timedelta(days=1)
+        
+        due_versions = db.query(StagingVersionORM.id, StagingVersionORM.version_name).filter(
+            StagingVersionORM.approval_status == ApprovalStatus.PENDING,
+            StagingVersionORM.created_at <= cutoff
+        ).all()
+        if not due_versions:
+            return
+        
+        db.query(StagingVersionORM).filter(
+            StagingVersionORM.id.in_([version.id for version in due_versions])
+        ).update({
+            StagingVersionORM.approval_status: ApprovalStatus.APPROVED,
+            StagingVersionORM.approved_by: "auto_approval_system",
+            StagingVersionORM.approved_at: datetime.utcnow()
+        }, synchronize_session=False)
         db.commit()
         
+        for version in due_versions:
+            bump_revision(version.id)  # 승인 → 버전 스냅샷 캐시 무효화
+            logger.info(f"Auto-approved version: {version.version_name}")
+        
     finally:
         db.close()
 
@@ -432,6 +258,11 @@ def _migrate_discount_policies(db: Session, version_id: int):
     """
     할인 정책 마이그레이션 헬퍼 함수
     
+    스테이징 → 메인 자연 키 맵(브랜드 이름 / 라인 이름 / 모델 코드 + 트림 이름)을 버전당 한 번 만들고,
+    세부 정보는 유형마다 IN 쿼리 1번으로 읽은 뒤 정책과 세부 정보를 배치 INSERT 한다.
+    메인 정책 ID는 MAX(id) 이후로 미리 정해 세부 정보 FK에 사용한다 (정책별 flush 없음).
+    기존 메인 할인 정책 삭제와 재삽입은 한 트랜잭션으로 커밋된다.
+    
     Args:
         db: 데이터베이스 세션
         version_id: 버전 ID
@@ -439,196 +270,169 @@ def _migrate_discount_policies(db: Session, version_id: int):
     Returns:
         dict: 마이그레이션 결과
     """
+    from sqlalchemy import func, insert, select
+    from ..domain.entities import PolicyType
     from ..infrastructure.orm_models import (
         StagingDiscountPolicyORM, StagingBrandCardBenefitORM, StagingBrandPromoORM,
         StagingBrandInventoryDiscountORM, StagingBrandPrePurchaseORM,
         DiscountPolicyORM, BrandCardBenefitORM, BrandPromoORM,
         BrandInventoryDiscountORM, BrandPrePurchaseORM,
-        StagingBrandORM, StagingVehicleLineORM, StagingTrimORM,
-        BrandORM, VehicleLineORM, TrimORM
+        BrandORM, VehicleLineORM, ModelORM, TrimORM
     )
     
-    logger.info(f"Starting discount policy migration for version {version_id}")
-    
-    # 1. 기존 Main 할인 정책 모두 삭제
-    logger.info("Deleting all existing discount policies...")
-    db.query(BrandPrePurchaseORM).delete()
-    db.query(BrandInventoryDiscountORM).delete()
-    db.query(BrandPromoORM).delete()
-    db.query(BrandCardBenefitORM).delete()
-    db.query(DiscountPolicyORM).delete()
-    db.commit()
+    # 정책 유형 → (스테이징 세부 ORM, 메인 세부 ORM, 통계 키)
+    detail_plan = {
+        PolicyType.CARD_BENEFIT: (StagingBrandCardBenefitORM, BrandCardBenefitORM, "card_benefits"),
+        PolicyType.BRAND_PROMO: (StagingBrandPromoORM, BrandPromoORM, "promos"),
+        PolicyType.INVENTORY: (StagingBrandInventoryDiscountORM, BrandInventoryDiscountORM, "inventory_discounts"),
+        PolicyType.PRE_PURCHASE: (StagingBrandPrePurchaseORM, BrandPrePurchaseORM, "pre_purchases"),
+    }
+    skip_columns = {"id", "discount_policy_id", "created_at", "updated_at"}
+    
+    def copy_columns(staging_class, main_class):
+        staging_columns = staging_class.__table__.columns
+        return [
+            column.key for column in main_class.__table__.columns
+            if column.key in staging_columns and column.key not in skip_columns and not column.foreign_keys
+        ]
+    
+    def insert_batches(main_class, rows):
+        for start in range(0, len(rows), DISCOUNT_INSERT_BATCH_SIZE):
+            db.execute(insert(main_class.__table__), rows[start:start + DISCOUNT_INSERT_BATCH_SIZE])
     
-    # 2. Staging 할인 정책 조회
-    staging_policies = db.query(StagingDiscountPolicyORM).filter_by(version_id=version_id).all()
+    logger.info(f"Starting discount policy migration for version {version_id}")
+    stats = {"policies": 0, "card_benefits": 0, "promos": 0, "inventory_discounts": 0, "pre_purchases": 0}
     
-    if not staging_policies:
-        logger.info(f"No discount policies found for version {version_id}")
-        return {
-            "success": True,
-            "message": "No discount policies to migrate",
-            "stats": {
-                "policies": 0,
-                "card_benefits": 0,
-                "promos": 0,
-                "inventory_discounts": 0,
-                "pre_purchases": 0
+    try:
+        # 1. 기존 Main 할인 정책 모두 삭제 (재삽입과 같은 트랜잭션)
+        logger.info("Deleting all existing discount policies...")
+        db.query(BrandPrePurchaseORM).delete()
+        db.query(BrandInventoryDiscountORM).delete()
+        db.query(BrandPromoORM).delete()
+        db.query(BrandCardBenefitORM).delete()
+        db.query(DiscountPolicyORM).delete()
+        
+        # 2. Staging 할인 정책 + 자연 키 조회 (1쿼리)
+        staging_policies = db.execute(
+            select(
+                StagingDiscountPolicyORM,
+                StagingBrandORM.name.label("brand_name"),
+                StagingVehicleLineORM.name.label("vehicle_line_name"),
+                StagingModelORM.code.label("model_code"),
+                StagingTrimORM.name.label("trim_name"),
+            ).join(
+                StagingBrandORM, StagingDiscountPolicyORM.brand_id == StagingBrandORM.id
+            ).join(
+                StagingVehicleLineORM, StagingDiscountPolicyORM.vehicle_line_id == StagingVehicleLineORM.id
+            ).join(
+                StagingTrimORM, StagingDiscountPolicyORM.trim_id == StagingTrimORM.id
+            ).join(
+                StagingModelORM, StagingTrimORM.model_id == StagingModelORM.id
+            ).where(
+                StagingDiscountPolicyORM.version_id == version_id
+            ).order_by(StagingDiscountPolicyORM.id)
+        ).all()
+        
+        if not staging_policies:
+            db.commit()
+            logger.info(f"No discount policies found for version {version_id}")
+            return {
+                "success": True,
+                "message": "No discount policies to migrate",
+                "stats": stats
             }
-        }
-    
-    policy_count = 0
-    card_benefit_count = 0
-    promo_count = 0
-    inventory_discount_count = 0
-    pre_purchase_count = 0
-    
-    for staging_policy in staging_policies:
-        # 3. Staging에서 Main으로 ID 매핑
-        # Brand ID 매핑
-        staging_brand = db.query(StagingBrandORM).filter_by(id=staging_policy.brand_id).first()
-        if not staging_brand:
-            logger.warning(f"Skipping policy {staging_policy.id}: Staging brand not found")
-            continue
-            
-        main_brand = db.query(BrandORM).filter_by(name=staging_brand.name).first()
         
-        # Vehicle Line ID 매핑
-        staging_vehicle_line = db.query(StagingVehicleLineORM).filter_by(id=staging_policy.vehicle_line_id).first()
-        if not staging_vehicle_line:
-            logger.warning(f"Skipping policy {staging_policy.id}: Staging vehicle line not found")
-            continue
+        # 3. Staging → Main 자연 키 맵 (레벨당 1쿼리)
+        brand_names = {row.brand_name for row in staging_policies}
+        main_brands = {}
+        for brand_id, name in db.execute(
+            select(BrandORM.id, BrandORM.name).where(BrandORM.name.in_(brand_names)).order_by(BrandORM.id)
+        ):
+            main_brands.setdefault(name, brand_id)
+        
+        main_vehicle_lines = {}
+        for line_id, brand_id, name in db.execute(
+            select(VehicleLineORM.id, VehicleLineORM.brand_id, VehicleLineORM.name).where(
+                VehicleLineORM.brand_id.in_(set(main_brands.values())),
+                VehicleLineORM.name.in_({row.vehicle_line_name for row in staging_policies})
+            ).order_by(VehicleLineORM.id)
+        ):
+            main_vehicle_lines.setdefault((brand_id, name), line_id)
+        
+        # 트림은 (차량 라인, 모델 코드, 트림 이름)으로 찾는다
+        main_trims = {}
+        for trim_id, line_id, code, name in db.execute(
+            select(TrimORM.id, ModelORM.vehicle_line_id, ModelORM.code, TrimORM.name).join(
+                ModelORM, TrimORM.model_id == ModelORM.id
+            ).where(
+                ModelORM.vehicle_line_id.in_(set(main_vehicle_lines.values())),
+                TrimORM.name.in_({row.trim_name for row in staging_policies})
+            ).order_by(TrimORM.id)
+        ):
+            main_trims.setdefault((line_id, code, name), trim_id)
+        
+        # 4. Main 정책 행 구성 (ID를 미리 정함)
+        next_id = (db.execute(select(func.max(DiscountPolicyORM.id)).with_for_update()).scalar() or 0) + 1
+        policy_columns = copy_columns(StagingDiscountPolicyORM, DiscountPolicyORM)
+        policy_rows = []
+        main_policy_ids = {}
+        policy_ids_by_type = {policy_type: [] for policy_type in detail_plan}
+        
+        for row in staging_policies:
+            staging_policy = row[0]
+            main_brand_id = main_brands.get(row.brand_name)
+            main_vehicle_line_id = main_vehicle_lines.get((main_brand_id, row.vehicle_line_name))
+            main_trim_id = main_trims.get((main_vehicle_line_id, row.model_code, row.trim_name))
+            if not main_brand_id or not main_vehicle_line_id or not main_trim_id:
+                logger.warning(f"Skipping policy {staging_policy.id}: Could not find main references")
+                continue
             
-        main_vehicle_line = db.query(VehicleLineORM).filter_by(
-            brand_id=main_brand.id,
-            name=staging_vehicle_line.name
-        ).first()
-        
-        # Trim ID 매핑
-        staging_trim = db.query(StagingTrimORM).filter_by(id=staging_policy.trim_id).first()
-        if not staging_trim:
-            logger.warning(f"Skipping policy {staging_policy.id}: Staging trim not found")
-            continue
-            
-        main_trim = db.query(TrimORM).filter_by(
-            model_id=main_vehicle_line.id,  # vehicle_line을 통해 모델 찾기
-            name=staging_trim.name
-        ).first()
-        
-        if not main_brand or not main_vehicle_line or not main_trim:
-            logger.warning(f"Skipping policy {staging_policy.id}: Could not find main references")
-            continue
-        
-        # 4. Main 할인 정책 생성
-        main_policy = DiscountPolicyORM(
-            brand_id=main_brand.id,
-            vehicle_line_id=main_vehicle_line.id,
-            trim_id=main_trim.id,
-            policy_type=staging_policy.policy_type,
-            title=staging_policy.title,
-            description=staging_policy.description,
-            valid_from=staging_policy.valid_from,
-            valid_to=staging_policy.valid_to,
-            is_active=staging_policy.is_active
-        )
-        db.add(main_policy)
-        db.flush()
-        policy_count += 1
-        
-        # 5. 정책 유형별 세부 정보 마이그레이션
-        if staging_policy.policy_type == "CARD_BENEFIT":
-            card_benefits = db.query(StagingBrandCardBenefitORM).filter_by(
-                discount_policy_id=staging_policy.id
-            ).all()
-            
-            for card_benefit in card_benefits:
-                main_card_benefit = BrandCardBenefitORM(
-                    discount_policy_id=main_policy.id,
-                    card_partner=card_benefit.card_partner,
-                    cashback_rate=card_benefit.cashback_rate,
-                    title=card_benefit.title,
-                    description=card_benefit.description,
-                    valid_from=card_benefit.valid_from,
-                    valid_to=card_benefit.valid_to,
-                    is_active=card_benefit.is_active
-                )
-                db.add(main_card_benefit)
-                card_benefit_count += 1
-        
-        elif staging_policy.policy_type == "BRAND_PROMO":
-            promos = db.query(StagingBrandPromoORM).filter_by(
-                discount_policy_id=staging_policy.id
-            ).all()
-            
-            for promo in promos:
-                main_promo = BrandPromoORM(
-                    discount_policy_id=main_policy.id,
-                    discount_rate=promo.discount_rate,
-                    discount_amount=promo.discount_amount,
-                    title=promo.title,
-                    description=promo.description,
-                    valid_from=promo.valid_from,
-                    valid_to=promo.valid_to,
-                    is_active=promo.is_active
-                )
-                db.add(main_promo)
-                promo_count += 1
-        
-        elif staging_policy.policy_type == "INVENTORY":
-            inventory_discounts = db.query(StagingBrandInventoryDiscountORM).filter_by(
-                discount_policy_id=staging_policy.id
-            ).all()
-            
-            for inventory_discount in inventory_discounts:
-                main_inventory_discount = BrandInventoryDiscountORM(
-                    discount_policy_id=main_policy.id,
-                    inventory_level_threshold=inventory_discount.inventory_level_threshold,
-                    discount_rate=inventory_discount.discount_rate,
-                    title=inventory_discount.title,
-                    description=inventory_discount.description,
-                    valid_from=inventory_discount.valid_from,
-                    valid_to=inventory_discount.valid_to,
-                    is_active=inventory_discount.is_active
-                )
-                db.add(main_inventory_discount)
-                inventory_discount_count += 1
-        
-        elif staging_policy.policy_type == "PRE_PURCHASE":
-            pre_purchases = db.query(StagingBrandPrePurchaseORM).filter_by(
-                discount_policy_id=staging_policy.id
-            ).all()
-            
-            for pre_purchase in pre_purchases:
-                main_pre_purchase = BrandPrePurchaseORM(
-                    discount_policy_id=main_policy.id,
-                    event_type=pre_purchase.event_type,
-                    discount_rate=pre_purchase.discount_rate,
-                    discount_amount=pre_purchase.discount_amount,
-                    title=pre_purchase.title,
-                    description=pre_purchase.description,
-                    pre_purchase_start=pre_purchase.pre_purchase_start,
-                    valid_from=pre_purchase.valid_from,
-                    valid_to=pre_purchase.valid_to,
-                    is_active=pre_purchase.is_active
-                )
-                db.add(main_pre_purchase)
-                pre_purchase_count += 1
-    
-    # 6. 커밋
-    db.commit()
+            values = {name: getattr(staging_policy, name) for name in policy_columns}
+            values.update(id=next_id, brand_id=main_brand_id, vehicle_line_id=main_vehicle_line_id, trim_id=main_trim_id)
+            policy_rows.append(values)
+            main_policy_ids[staging_policy.id] = next_id
+            if staging_policy.policy_type in policy_ids_by_type:
+                policy_ids_by_type[staging_policy.policy_type].append(staging_policy.id)
+            next_id += 1
+        
+        insert_batches(DiscountPolicyORM, policy_rows)
+        stats["policies"] = len(policy_rows)
+        
+        # 5. 정책 유형별 세부 정보 (유형당 IN 쿼리 1번 + 배치 INSERT)
+        for policy_type, (staging_class, main_class, stat_key) in detail_plan.items():
+            staging_policy_ids = policy_ids_by_type[policy_type]
+            if not staging_policy_ids:
+                continue
+            columns = copy_columns(staging_class, main_class)
+            details = db.execute(
+                select(staging_class).where(
+                    staging_class.discount_policy_id.in_(staging_policy_ids)
+                ).order_by(staging_class.id)
+            ).scalars().all()
+            detail_rows = [
+                {
+                    "discount_policy_id": main_policy_ids[detail.discount_policy_id],
+                    **{name: getattr(detail, name) for name in columns}
+                }
+                for detail in details
+            ]
+            insert_batches(main_class, detail_rows)
+            stats[stat_key] = len(detail_rows)
+        
+        # 6. 커밋
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    bump_main_revision()
     
     logger.info(f"Discount policy migration completed for version {version_id}")
-    logger.info(f"Migrated: {policy_count} policies, {card_benefit_count} card benefits, "
-               f"{promo_count} promos, {inventory_discount_count} inventory discounts, "
-               f"{pre_purchase_count} pre-purchases")
+    logger.info(f"Migrated: {stats['policies']} policies, {stats['card_benefits']} card benefits, "
+               f"{stats['promos']} promos, {stats['inventory_discounts']} inventory discounts, "
+               f"{stats['pre_purchases']} pre-purchases")
     
     return {
         "success": True,
         "message": f"Discount policies migrated successfully",
-        "stats": {
-            "policies": policy_count,
-            "card_benefits": card_benefit_count,
-            "promos": promo_count,
-            "inventory_discounts": inventory_discount_count,
-            "pre_purchases": pre_purchase_count
-        }
-    }
\ No newline at end of file
+        "stats": stats
+    }
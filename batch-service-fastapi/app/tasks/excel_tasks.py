@@ -6,7 +6,6 @@ from celery.utils.log import get_task_logger
 from sqlalchemy.orm import Session
 from datetime import datetime
 from typing import Optional
-import pandas as pd
 from io import BytesIO
 
 from ..celery_app import celery_app
@@ -23,6 +22,7 @@ from ..infrastructure.repositories import (
     SQLAlchemyStagingOptionRepository
 )
 from ..infrastructure.excel_parser import PandasExcelParser
+from ..infrastructure.version_cache import bump_revision
 
 logger = get_task_logger(__name__)
 
@@ -93,6 +93,7 @@ def process_excel_file_for_version(self, job_id: int, file_path: str, version_id
         # 비동기 처리를 동기로 실행 (Celery Worker 내부에서)
         import asyncio
         result = asyncio.run(service.import_excel(file_content, country, version_id, "batch_service"))
+        bump_revision(version_id)  # 임포트 완료 → 버전 스냅샷 캐시 무효화
         
         # 작업 완료 상태 업데이트
         job.status = JobStatus.COMPLETED if result.success else JobStatus.FAILED
@@ -220,6 +221,7 @@ def process_excel_file(self, file_content: bytes, job_id: int, version_id: int =
         # 비동기 처리를 동기로 실행 (Celery Worker 내부에서)
         import asyncio
         result = asyncio.run(service.import_excel(file_content, country, target_version_id, "batch_service"))
+        bump_revision(target_version_id)  # 임포트 완료 → 버전 스냅샷 캐시 무효화
         
         # 작업 완료 상태 업데이트
         job.status = JobStatus.COMPLETED if result.success else JobStatus.FAILED
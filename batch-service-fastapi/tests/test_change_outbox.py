@@ -0,0 +1,88 @@
+"""
+Change outbox 소비 - 반영할 수 없는 삭제(메인 트림을 옵션 타이틀이 참조)가 배치 전체를 막지 않는지 확인
+"""
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domain.entities import ApprovalStatus
+from app.infrastructure.change_outbox import OP_DELETE, drain_outbox
+from app.infrastructure.database import Base
+from app.infrastructure.orm_models import (
+    BrandORM, CatalogChangeOutboxORM, ModelORM, OptionTitleORM, StagingVersionORM, TrimORM, VehicleLineORM
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+
+    @event.listens_for(engine, "connect")
+    def connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None  # SAVEPOINT는 SQLAlchemy가 BEGIN을 직접 내보낼 때만 동작
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    @event.listens_for(engine, "begin")
+    def begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _seed_brand(db, name: str, referenced: bool) -> None:
+    brand = BrandORM(name=name, country="KR")
+    db.add(brand)
+    db.flush()
+    line = VehicleLineORM(name=f"{name} 승용", brand_id=brand.id)
+    db.add(line)
+    db.flush()
+    model = ModelORM(name=f"{name} 세단", code=f"{name}-1", vehicle_line_id=line.id)
+    db.add(model)
+    db.flush()
+    trim = TrimORM(name="프리미엄", car_type="SEDAN", model_id=model.id)
+    db.add(trim)
+    db.flush()
+    if referenced:
+        db.add(OptionTitleORM(name="편의 사양", trim_id=trim.id))
+
+
+@pytest.fixture
+def seeded(db):
+    version = StagingVersionORM(version_name="v1", approval_status=ApprovalStatus.APPROVED)
+    db.add(version)
+    db.flush()
+    _seed_brand(db, "현대", referenced=True)
+    _seed_brand(db, "기아", referenced=False)
+    for entity_id, name in ((1, "현대"), (2, "기아")):
+        db.add(CatalogChangeOutboxORM(
+            entity_type="brand", entity_id=entity_id, operation=OP_DELETE,
+            payload={"name": name, "version_id": version.id}
+        ))
+    db.commit()
+    return db
+
+
+def test_drain_outbox_parks_failing_delete_and_applies_the_rest(seeded):
+    stats = drain_outbox(seeded, batch_size=10)
+
+    assert stats["changes"] == 2
+    assert stats["failed"] == 1
+    assert stats["deleted"] == 1
+    assert list(seeded.execute(select(BrandORM.name)).scalars()) == ["현대"]
+
+    remaining = seeded.execute(select(CatalogChangeOutboxORM)).scalars().all()
+    assert [entry.payload["name"] for entry in remaining] == ["현대"]
+    assert remaining[0].failed_at is not None
+    assert "FOREIGN KEY" in remaining[0].error
+
+    # 실패로 제외된 항목은 다음 배치를 막지 않는다
+    assert drain_outbox(seeded, batch_size=10)["changes"] == 0
@@ -0,0 +1,121 @@
+"""
+메인 DB 검색 API - 결과 수와 무관하게 레벨별 1쿼리 (모델/트림/옵션 = 3쿼리) 유지 확인
+"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.config import settings
+from app.infrastructure.database import Base, get_db
+from app.infrastructure.orm_models import BrandORM, VehicleLineORM, ModelORM, TrimORM, OptionORM
+from app.main import app
+from app.presentation.dependencies import get_current_user
+
+BRAND_NAMES = ["현대", "기아", "제네시스"]
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def seeded(engine):
+    """브랜드 3개 × 라인 1개 × 모델 4개 × 트림 3개 × 옵션 2개"""
+    db = sessionmaker(bind=engine)()
+    for brand_name in BRAND_NAMES:
+        brand = BrandORM(name=brand_name, country="KR")
+        db.add(brand)
+        db.flush()
+        line = VehicleLineORM(name=f"{brand_name} 승용", brand_id=brand.id)
+        db.add(line)
+        db.flush()
+        for m in range(4):
+            model = ModelORM(name=f"{brand_name} 세단{m}", code=f"{brand_name}-{m}", vehicle_line_id=line.id)
+            db.add(model)
+            db.flush()
+            for t in range(3):
+                trim = TrimORM(name=f"프리미엄{t}", car_type="SEDAN", model_id=model.id)
+                db.add(trim)
+                db.flush()
+                db.add(OptionORM(name="선루프", price=1000000, trim_id=trim.id))
+                db.add(OptionORM(name="세단 패키지", price=500000, trim_id=trim.id))
+    db.commit()
+    db.close()
+    return engine
+
+
+@pytest.fixture
+def client(seeded, monkeypatch):
+    monkeypatch.setattr(settings, "search_backend", "like")
+    monkeypatch.setattr(settings, "search_cache_enabled", False)
+    monkeypatch.setattr(settings, "snapshot_cache_enabled", False)
+
+    session_factory = sessionmaker(bind=seeded)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: {"username": "tester"}
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def statements(seeded):
+    """실행된 SQL 문 수 집계"""
+    executed = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(seeded, "before_cursor_execute", count)
+    yield executed
+    event.remove(seeded, "before_cursor_execute", count)
+
+
+@pytest.mark.parametrize("q, expected", [
+    ("없는검색어", {}),
+    ("제네시스", {"model": 4}),
+    ("세단", {"model": 12, "option": 36}),
+    ("프리미엄", {"trim": 36}),
+    ("선루프", {"option": 36}),
+])
+def test_search_main_db_uses_one_query_per_level(client, statements, q, expected):
+    response = client.get("/api/main-db/search", params={"q": q})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    counts = {}
+    for result in results:
+        counts[result["type"]] = counts.get(result["type"], 0) + 1
+    assert counts == expected
+    assert len(statements) == 3
+
+
+def test_search_main_db_includes_parent_names(client, statements):
+    response = client.get("/api/main-db/search", params={"q": "선루프", "limit": 5})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == 5
+    for result in results:
+        assert result["brand"] in BRAND_NAMES
+        assert result["vehicle_line"] == f"{result['brand']} 승용"
+        assert result["model"].startswith(result["brand"])
+        assert result["trim"].startswith("프리미엄")
+    assert len(statements) == 3
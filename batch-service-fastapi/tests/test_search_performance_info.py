@@ -0,0 +1,68 @@
+"""
+검색 성능 정보 API - "/{version_id}" 경로보다 먼저 매칭되어 200 응답 확인
+
+인덱스 조회는 MySQL information_schema 전용이므로 DB 세션은 MySQL 8 응답 형태(별칭 적용된 소문자 컬럼)를 흉내 낸다.
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.infrastructure.database import get_db
+from app.main import app
+
+INDEX_ROWS = [
+    {"table_name": "staging_brand", "index_name": "PRIMARY", "index_type": "BTREE", "non_unique": 0, "columns": "id"},
+    {"table_name": "staging_model", "index_name": "ft_staging_model_name", "index_type": "FULLTEXT", "non_unique": 1, "columns": "name"},
+]
+STAT_ROWS = [
+    {"table_name": "staging_brand", "row_count": 3},
+    {"table_name": "staging_model", "row_count": 12},
+]
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return [SimpleNamespace(_mapping=row) for row in self.rows]
+
+
+class _MySQLSession:
+    """information_schema 인덱스 조회 / 테이블 행 수 조회에 고정 결과를 반환"""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement, *args, **kwargs):
+        sql = str(statement)
+        self.statements.append(sql)
+        return _Result(INDEX_ROWS if "information_schema.statistics" in sql else STAT_ROWS)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def session(monkeypatch):
+    monkeypatch.setattr(settings, "snapshot_cache_enabled", False)
+    session = _MySQLSession()
+    app.dependency_overrides[get_db] = lambda: session
+    yield session
+    app.dependency_overrides.clear()
+
+
+def test_search_performance_info_is_not_shadowed_by_version_route(session):
+    response = TestClient(app).get("/api/versions/search-performance-info")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["indexes"] == INDEX_ROWS
+    assert body["table_stats"] == STAT_ROWS
+    assert body["total_indexes"] == 2
+    assert body["search_optimized"] is True
+    assert body["search_backend"] == settings.search_backend
+    assert "telemetry" in body
+    assert len(session.statements) == 2